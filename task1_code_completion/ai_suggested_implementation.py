@@ -62,9 +62,6 @@ def sort_dict_list_ai_v5(data_list, sort_key, reverse=False):
 # ============================================================================
 
 if __name__ == "__main__":
-    import time
-    import random
-    
     print("="*80)
     print("TASK 1: AI-SUGGESTED IMPLEMENTATION - CODE COMPLETION")
     print("="*80)
@@ -135,78 +132,34 @@ if __name__ == "__main__":
     print("  - Doesn't always consider edge cases")
     print("  - May miss project-specific requirements")
     print("  - Can suggest inefficient solutions for large scale")
-    print("  - Requires human review and testing")*80
-    print("PERFORMANCE COMPARISON")
-    print("="*80)
-    
-    # Generate large dataset for benchmarking
-    large_data = [
-        {
-            "id": i,
-            "value": random.randint(1, 100000),
-            "category": random.choice(['A', 'B', 'C'])
-        }
-        for i in range(50000)
-    ]
-    
-    print(f"\nDataset size: {len(large_data):,} items")
-    print("\nBenchmarking each implementation:\n")
-    
-    implementations = [
-        ("AI v1 (Simple)", sort_dict_list_ai_v1),
-        ("AI v2 (Error handling)", sort_dict_list_ai_v2),
-        ("AI v3 (Default values)", sort_dict_list_ai_v3),
-        ("AI v4 (itemgetter)", sort_dict_list_ai_v4),
-        ("AI v5 (In-place)", sort_dict_list_ai_v5)
-    ]
-    
-    results = []
-    
-    for name, func in implementations:
-        # Create fresh copy for each test
-        test_copy = large_data.copy()
-        
-        start_time = time.perf_counter()
-        
-        if name == "AI v3 (Default values)":
-            sorted_result = func(test_copy, 'value', default=0)
-        else:
-            sorted_result = func(test_copy, 'value')
-        
-        end_time = time.perf_counter()
-        
-        execution_time = (end_time - start_time) * 1000  # Convert to ms
-        results.append((name, execution_time))
-        
-        print(f"{name:30s}: {execution_time:8.2f} ms")
-    
-    # Find fastest implementation
-    fastest = min(results, key=lambda x: x[1])
-    print(f"\n🏆 Fastest: {fastest[0]} ({fastest[1]:.2f} ms)")
+    print("  - Requires human review and testing")
     
-    # Memory usage comparison
     print("\n" + "="*80)
-    print("MEMORY COMPARISON")
+    print("PERFORMANCE AND MEMORY COMPARISON")
     print("="*80)
     
-    import sys
+    from benchmark_suite import print_results, run_benchmark
     
-    small_data = test_data.copy()
+    ai_versions = [f"sort_dict_list_ai_v{i}" for i in range(1, 6)]
     
-    print("\nMemory usage (approximate):\n")
+    # Warmup + repeated runs per version; tracemalloc peak counts the whole
+    # sort (new list included), unlike sys.getsizeof on the result shell
+    results = run_benchmark(
+        ai_versions, sizes=[50000], key_types=["int_bounded"],
+        orders=["random"], missing_ratios=[0.0],
+    )
+    print(f"\nDataset size: {50000:,} items (median / p95 of 5 runs after warmup)\n")
+    print_results(results)
     
-    # V1-V4 create new lists
-    result_new = sort_dict_list_ai_v1(small_data, 'salary')
-    mem_new = sys.getsizeof(result_new)
-    print(f"New list (v1-v4): {mem_new} bytes")
+    # Find fastest implementation
+    fastest = min(results, key=lambda row: row["median_ms"])
+    print(f"\n🏆 Fastest: {fastest['implementation']} ({fastest['median_ms']:.2f} ms median)")
     
-    # V5 modifies in place
-    test_inplace = small_data.copy()
-    result_inplace = sort_dict_list_ai_v5(test_inplace, 'salary')
-    mem_inplace = sys.getsizeof(result_inplace)
-    print(f"In-place (v5):    {mem_inplace} bytes")
-    print(f"\nDifference: {mem_new - mem_inplace} bytes")
+    peaks = {row["implementation"]: row["peak_kib"] for row in results}
+    print(f"\nPeak memory, new list (v1):  {peaks['sort_dict_list_ai_v1']:8.1f} KiB")
+    print(f"Peak memory, in-place (v5):  {peaks['sort_dict_list_ai_v5']:8.1f} KiB")
     print("Note: In-place sorting doesn't create a new list, saving memory")
+    print("Full matrix and regression checks: python benchmark_suite.py --help")
     
     # Code characteristics
     print("\n" + "="*80)
@@ -241,8 +194,4 @@ if __name__ == "__main__":
     print(f"  AI v4: Fails on missing keys (no .get() support)")
     print(f"  AI v5: Mutates original list (side effects)")
     
-    print("\n" + "=")
-          
-
-
-          
+    print("\n" + "="*80)
@@ -0,0 +1,377 @@
+"""
+Task 1: AI-Powered Code Completion - Benchmark Suite
+Objective: Time every sort_dict_list_* implementation over a matrix of sizes,
+key types, presortedness and missing-key ratios, and catch regressions by
+comparing JSON results across commits
+Author: [Kipruto Andrew Kipngetich]
+Date: October 2026
+
+Usage:
+    python benchmark_suite.py --output results.json
+    python benchmark_suite.py --compare results.json --threshold 0.10
+"""
+
+import argparse
+import json
+import math
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from functools import partial
+from itertools import product
+
+from ai_suggested_implementation import (
+    sort_dict_list_ai_v1,
+    sort_dict_list_ai_v2,
+    sort_dict_list_ai_v3,
+    sort_dict_list_ai_v4,
+    sort_dict_list_ai_v5,
+)
+from columnar_sort import np
+from manual_implementation import (
+    sort_dict_list_manual,
+    sort_dict_list_multiple_keys,
+    sort_dict_list_with_default,
+)
+
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000]
+DEFAULT_WARMUP = 1
+DEFAULT_REPEATS = 5
+
+# A median slower than the baseline by more than this fraction is a regression
+DEFAULT_THRESHOLD = 0.10
+
+# Differences below this many milliseconds are timer noise, never regressions
+NOISE_FLOOR_MS = 0.05
+
+SORT_KEY = "value"
+
+# Key generators: value for one row, given the row's random generator
+KEY_TYPES = {
+    "int_bounded": lambda rng: rng.randint(1, 10000),
+    "int_wide": lambda rng: rng.randint(-2 ** 40, 2 ** 40),
+    "float": lambda rng: rng.uniform(0, 1000),
+    "str_low_card": lambda rng: rng.choice(['A', 'B', 'C', 'D']),
+    "str_high_card": lambda rng: f"user_{rng.randint(1, 10 ** 6)}",
+}
+
+# Default for missing keys, comparable with each key type
+MISSING_DEFAULTS = {
+    "int_bounded": 0,
+    "int_wide": 0,
+    "float": 0.0,
+    "str_low_card": "",
+    "str_high_card": "",
+}
+
+ORDERS = ("random", "sorted", "reversed", "nearly_sorted")
+
+# Fraction of positions swapped to make a "nearly_sorted" input
+NEARLY_SORTED_SWAPS = 0.01
+
+DEFAULT_MISSING_RATIOS = [0.0, 0.1]
+
+# name -> (function, calling convention)
+#   "strict"        - fn(data, key); every row must have the key
+#   "keys"          - fn(data, [key]); every row must have the key
+#   "default_value" - fn(data, key, default_value=...) handles missing keys
+#   "default"       - fn(data, key, default=...) handles missing keys
+IMPLEMENTATIONS = {
+    "sort_dict_list_manual": (sort_dict_list_manual, "strict"),
+    "sort_dict_list_manual[sampled]": (partial(sort_dict_list_manual, validation="sampled"), "strict"),
+    "sort_dict_list_manual[off]": (partial(sort_dict_list_manual, validation="off"), "strict"),
+    "sort_dict_list_with_default": (sort_dict_list_with_default, "default_value"),
+    "sort_dict_list_multiple_keys": (sort_dict_list_multiple_keys, "keys"),
+    "sort_dict_list_ai_v1": (sort_dict_list_ai_v1, "strict"),
+    "sort_dict_list_ai_v2": (sort_dict_list_ai_v2, "strict"),
+    "sort_dict_list_ai_v3": (sort_dict_list_ai_v3, "default"),
+    "sort_dict_list_ai_v4": (sort_dict_list_ai_v4, "strict"),
+    "sort_dict_list_ai_v5": (sort_dict_list_ai_v5, "strict"),
+}
+
+
+def generate_dataset(size, key_type, order="random", missing_ratio=0.0, seed=0):
+    """
+    Build one benchmark input.
+
+    Args:
+        size (int): Number of rows
+        key_type (str): One of KEY_TYPES
+        order (str): One of ORDERS - presortedness of the SORT_KEY column
+        missing_ratio (float): Fraction of rows without SORT_KEY
+        seed (int): Random seed, so every implementation sees the same rows
+
+    Returns:
+        list: Dictionaries with "id", SORT_KEY and "category" fields
+    """
+
+    rng = random.Random(seed)
+    make_key = KEY_TYPES[key_type]
+    keys = [make_key(rng) for _ in range(size)]
+
+    if order in ("sorted", "nearly_sorted"):
+        keys.sort()
+    elif order == "reversed":
+        keys.sort(reverse=True)
+    elif order != "random":
+        raise ValueError(f"Unknown order '{order}', expected one of {ORDERS}")
+
+    if order == "nearly_sorted" and size > 1:
+        for _ in range(max(1, int(size * NEARLY_SORTED_SWAPS))):
+            i, j = rng.randrange(size), rng.randrange(size)
+            keys[i], keys[j] = keys[j], keys[i]
+
+    dataset = [
+        {"id": i, SORT_KEY: key, "category": rng.choice(['A', 'B', 'C'])}
+        for i, key in enumerate(keys)
+    ]
+    for row in rng.sample(dataset, int(size * missing_ratio)):
+        del row[SORT_KEY]
+    return dataset
+
+
+def make_runner(name, key_type, missing_ratio):
+    """
+    Adapt an implementation to a one-argument callable for this cell.
+
+    Returns:
+        callable or None: fn(data_list), or None if the implementation
+        cannot handle missing keys and the cell has some
+    """
+
+    func, style = IMPLEMENTATIONS[name]
+    default = MISSING_DEFAULTS[key_type]
+
+    if style == "default_value":
+        return lambda data: func(data, SORT_KEY, default_value=default)
+    if style == "default":
+        return lambda data: func(data, SORT_KEY, default=default)
+    if missing_ratio:
+        return None
+    if style == "keys":
+        return lambda data: func(data, [SORT_KEY])
+    return lambda data: func(data, SORT_KEY)
+
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of a non-empty list (fraction in [0, 1])."""
+    ordered = sorted(values)
+    return ordered[max(1, math.ceil(len(ordered) * fraction)) - 1]
+
+
+def measure(runner, dataset, warmup=DEFAULT_WARMUP, repeats=DEFAULT_REPEATS):
+    """
+    Time one runner on one dataset.
+
+    Every call gets a fresh shallow copy made outside the timed region, so
+    in-place implementations (ai_v5) always see the original order. Peak
+    memory comes from one extra run under tracemalloc, which is kept out of
+    the timings because tracing slows allocation down.
+
+    Returns:
+        dict: median_ms, p95_ms, min_ms and peak_kib
+    """
+
+    for _ in range(warmup):
+        runner(list(dataset))
+
+    timings = []
+    for _ in range(repeats):
+        data = list(dataset)
+        start_time = time.perf_counter()
+        runner(data)
+        timings.append((time.perf_counter() - start_time) * 1000)
+
+    data = list(dataset)
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    runner(data)
+    peak = tracemalloc.get_traced_memory()[1] - baseline
+    tracemalloc.stop()
+
+    return {
+        "median_ms": round(statistics.median(timings), 4),
+        "p95_ms": round(percentile(timings, 0.95), 4),
+        "min_ms": round(min(timings), 4),
+        "peak_kib": round(peak / 1024, 1),
+    }
+
+
+def run_benchmark(implementations=None, sizes=DEFAULT_SIZES, key_types=None,
+                  orders=ORDERS, missing_ratios=DEFAULT_MISSING_RATIOS,
+                  warmup=DEFAULT_WARMUP, repeats=DEFAULT_REPEATS, seed=0,
+                  progress=None):
+    """
+    Run every implementation over the full input matrix.
+
+    Args:
+        implementations (list): Names from IMPLEMENTATIONS (all if None)
+        sizes (list): Row counts
+        key_types (list): Names from KEY_TYPES (all if None)
+        orders (list): Names from ORDERS
+        missing_ratios (list): Fractions of rows without the sort key
+        warmup (int): Untimed runs before measuring
+        repeats (int): Timed runs per cell
+        seed (int): Random seed for the datasets
+        progress (callable): Called with each result row as it completes
+
+    Returns:
+        list: One dict per (implementation, size, key_type, order,
+        missing_ratio) cell; cells an implementation cannot handle carry a
+        "skipped" reason instead of timings
+    """
+
+    implementations = implementations or list(IMPLEMENTATIONS)
+    key_types = key_types or list(KEY_TYPES)
+    results = []
+
+    for size, key_type, order, missing_ratio in product(sizes, key_types, orders, missing_ratios):
+        dataset = generate_dataset(size, key_type, order, missing_ratio, seed)
+        for name in implementations:
+            row = {
+                "implementation": name,
+                "size": size,
+                "key_type": key_type,
+                "order": order,
+                "missing_ratio": missing_ratio,
+            }
+            runner = make_runner(name, key_type, missing_ratio)
+            if runner is None:
+                row["skipped"] = "requires every row to have the key"
+            else:
+                row.update(measure(runner, dataset, warmup, repeats))
+            results.append(row)
+            if progress is not None:
+                progress(row)
+
+    return results
+
+
+def _git_commit():
+    """Current git commit hash, or None outside a git checkout."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def environment_info():
+    """Metadata stored with every result file."""
+    return {
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "numpy": np.__version__ if np is not None else None,
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+
+def _cell_key(row):
+    return (row["implementation"], row["size"], row["key_type"],
+            row["order"], row["missing_ratio"])
+
+
+def compare_results(baseline, current, threshold=DEFAULT_THRESHOLD):
+    """
+    Compare two result lists cell by cell on median time.
+
+    Args:
+        baseline (list): Results from an earlier run
+        current (list): Results from this run
+        threshold (float): Allowed slowdown as a fraction of the baseline
+
+    Returns:
+        list: (cell dict, baseline median, current median, ratio) for every
+        cell slower than threshold allows, worst first
+    """
+
+    previous = {_cell_key(row): row for row in baseline if "median_ms" in row}
+    regressions = []
+    for row in current:
+        old = previous.get(_cell_key(row))
+        if old is None or "median_ms" not in row:
+            continue
+        before, after = old["median_ms"], row["median_ms"]
+        if after - before > NOISE_FLOOR_MS and after > before * (1 + threshold):
+            regressions.append((row, before, after, after / before))
+    return sorted(regressions, key=lambda item: item[3], reverse=True)
+
+
+def print_results(results):
+    """Print result rows as a fixed-width table."""
+    print(f"{'implementation':30s} {'rows':>8s} {'key type':>14s} {'order':>14s} "
+          f"{'miss':>5s} {'median ms':>10s} {'p95 ms':>10s} {'peak KiB':>10s}")
+    print("-" * 110)
+    for row in results:
+        head = (f"{row['implementation']:30s} {row['size']:>8,d} {row['key_type']:>14s} "
+                f"{row['order']:>14s} {row['missing_ratio']:>5.0%}")
+        if "skipped" in row:
+            print(f"{head} {'skipped':>10s}")
+        else:
+            print(f"{head} {row['median_ms']:>10.2f} {row['p95_ms']:>10.2f} "
+                  f"{row['peak_kib']:>10.1f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the sort_dict_list_* implementations")
+    parser.add_argument("--implementations", nargs="+", choices=list(IMPLEMENTATIONS),
+                        default=list(IMPLEMENTATIONS))
+    parser.add_argument("--sizes", nargs="+", type=int, default=DEFAULT_SIZES)
+    parser.add_argument("--key-types", nargs="+", choices=list(KEY_TYPES), default=list(KEY_TYPES))
+    parser.add_argument("--orders", nargs="+", choices=ORDERS, default=list(ORDERS))
+    parser.add_argument("--missing-ratios", nargs="+", type=float, default=DEFAULT_MISSING_RATIOS)
+    parser.add_argument("--warmup", type=int, default=DEFAULT_WARMUP)
+    parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Write results to this JSON file")
+    parser.add_argument("--compare", help="Baseline JSON file to check for regressions")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    args = parser.parse_args(argv)
+
+    if args.repeats < 1:
+        parser.error("--repeats must be at least 1")
+
+    print("="*80)
+    print("SORT IMPLEMENTATION BENCHMARK SUITE")
+    print("="*80)
+    print(f"\nWarmup {args.warmup}, repeats {args.repeats}, seed {args.seed}\n")
+
+    results = run_benchmark(
+        args.implementations, args.sizes, args.key_types, args.orders,
+        args.missing_ratios, args.warmup, args.repeats, args.seed,
+    )
+    print_results(results)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output_file:
+            json.dump({"environment": environment_info(), "results": results}, output_file, indent=2)
+        print(f"\n✓ Results written to {args.output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as baseline_file:
+            baseline = json.load(baseline_file)
+        regressions = compare_results(baseline["results"], results, args.threshold)
+        print(f"\nCompared with {args.compare} "
+              f"(commit {baseline['environment'].get('commit')}):")
+        if not regressions:
+            print(f"  ✓ No cell slower than +{args.threshold:.0%}")
+            return 0
+        for row, before, after, ratio in regressions:
+            print(f"  ⚠️  {row['implementation']} {row['size']:,} {row['key_type']} "
+                  f"{row['order']} miss={row['missing_ratio']:.0%}: "
+                  f"{before:.2f} -> {after:.2f} ms ({ratio:.2f}x)")
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
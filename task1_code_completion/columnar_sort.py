@@ -0,0 +1,463 @@
+"""
+Task 1: AI-Powered Code Completion - Columnar Sort Helpers
+Objective: Validate rows and pull key columns out of lists of dictionaries,
+convert them to typed NumPy arrays, and sort multiple keys with lexsort
+Author: [Kipruto Andrew Kipngetich]
+Date: October 2026
+"""
+
+import random
+import time
+from itertools import islice, repeat
+from operator import methodcaller
+
+try:
+    import numpy as np
+except ImportError:  # numpy is in requirements.txt, but keep the module importable
+    np = None
+
+
+# Below this many rows the NumPy round-trip costs more than it saves
+COLUMNAR_THRESHOLD = 2048
+
+# Largest integer magnitude that float64 represents exactly
+FLOAT_EXACT_INT = 2 ** 53
+
+# Rows inspected to decide whether a string column is low-cardinality
+CARDINALITY_SAMPLE = 4096
+
+# Per-key sort directions accepted by sort_dict_list_multiple_keys
+SORT_DIRECTIONS = {"asc": False, "desc": True}
+
+# Validation levels accepted by sort_dict_list_manual
+VALIDATION_LEVELS = ("full", "sampled", "off")
+
+# Rows checked by "sampled" validation
+VALIDATION_SAMPLE_SIZE = 1024
+
+# Offending row indices quoted in a validation error message
+REPORTED_ROWS = 10
+
+
+def find_invalid_rows(data_list, sort_key, start=0):
+    """
+    Locate every row that cannot be sorted by sort_key.
+
+    Args:
+        data_list (list): Rows to check
+        sort_key (str): Key every row must have
+        start (int): First row to check (rows before it are trusted)
+
+    Returns:
+        tuple: (indices of non-dictionary rows, indices of dictionaries
+        without sort_key)
+    """
+
+    non_dicts = []
+    missing = []
+    for index, item in enumerate(islice(data_list, start, None), start):
+        if not isinstance(item, dict):
+            non_dicts.append(index)
+        elif sort_key not in item:
+            missing.append(index)
+    return non_dicts, missing
+
+
+def _describe_rows(indices):
+    """'rows 3, 8, 21 and 4 more' style summary of offending indices."""
+    shown = ", ".join(map(str, indices[:REPORTED_ROWS]))
+    extra = len(indices) - REPORTED_ROWS
+    label = "row" if len(indices) == 1 else "rows"
+    return f"{label} {shown}" + (f" and {extra} more" if extra > 0 else "")
+
+
+def raise_invalid_rows(data_list, sort_key, start=0):
+    """
+    Raise one error that lists every offending row, if there are any.
+
+    The full list of indices (positions in data_list, whatever start is)
+    is attached to the exception as invalid_rows; the message quotes the
+    first REPORTED_ROWS of them. Rows before start are not checked.
+
+    Raises:
+        TypeError: If any row is not a dictionary
+        KeyError: If any dictionary lacks sort_key
+    """
+
+    non_dicts, missing = find_invalid_rows(data_list, sort_key, start)
+    if non_dicts:
+        error = TypeError(
+            f"All items in data_list must be dictionaries ({_describe_rows(non_dicts)})")
+        error.invalid_rows = non_dicts
+        raise error
+    if missing:
+        error = KeyError(
+            f"Key '{sort_key}' not found in all dictionaries ({_describe_rows(missing)})")
+        error.invalid_rows = missing
+        raise error
+
+
+def validate_rows(data_list, sort_key, validation="full"):
+    """
+    Check that rows are dictionaries holding sort_key.
+
+    Levels:
+        full    - every row, in one fused C-level pass (dict.__contains__
+                  rejects non-dictionaries and reports the key in one call);
+                  callers that need the keys anyway should use
+                  extract_key_column, which validates as it extracts
+        sampled - VALIDATION_SAMPLE_SIZE random rows; for trusted data
+        off     - no checks
+
+    Any failure is reported in bulk: the whole list is scanned once more so
+    the error names every offending row, not just the first.
+
+    Args:
+        data_list (list): Rows to check
+        sort_key (str): Key every row must have
+        validation (str): One of VALIDATION_LEVELS
+
+    Raises:
+        ValueError: If validation is not one of VALIDATION_LEVELS
+        TypeError: If a checked row is not a dictionary
+        KeyError: If a checked dictionary lacks sort_key
+    """
+
+    if validation not in VALIDATION_LEVELS:
+        raise ValueError(f"validation must be one of {VALIDATION_LEVELS}, got {validation!r}")
+    if validation == "off":
+        return
+
+    rows = data_list
+    if validation == "sampled" and len(data_list) > VALIDATION_SAMPLE_SIZE:
+        rows = random.sample(data_list, VALIDATION_SAMPLE_SIZE)
+
+    try:
+        if all(map(dict.__contains__, rows, repeat(sort_key))):
+            return
+    except TypeError:  # a row that is not a dictionary
+        pass
+    raise_invalid_rows(data_list, sort_key)
+
+
+def extract_key_column(data_list, sort_key):
+    """
+    Validate the rows and pull the sort key out of every dictionary.
+
+    Validation and extraction are one C-level pass: dict.__getitem__ rejects
+    non-dictionaries and missing keys alike, so this is also the cheapest
+    full validation. On failure every offending row is reported (see
+    raise_invalid_rows).
+
+    Args:
+        data_list (list): List of dictionaries
+        sort_key (str): Key to extract
+
+    Returns:
+        list: Key values in row order
+
+    Raises:
+        TypeError: If any item is not a dictionary
+        KeyError: If sort_key is missing from any dictionary
+    """
+
+    try:
+        return list(map(dict.__getitem__, data_list, repeat(sort_key)))
+    except (TypeError, KeyError):
+        raise_invalid_rows(data_list, sort_key)
+        raise
+
+
+def to_typed_array(keys, numeric_only=False):
+    """
+    Convert a key column to a typed NumPy array when that is lossless.
+
+    Only columns whose NumPy ordering is guaranteed to match Python's
+    comparison order are converted:
+        - bool/int          -> int64 (if every value fits)
+        - int/float mixes   -> float64 (no NaN, ints exactly representable)
+        - str               -> fixed-width unicode (no NUL characters, which
+                               NumPy strips from the end of strings)
+
+    Args:
+        keys (list): Key values in row order
+        numeric_only (bool): If True, leave string columns unconverted
+
+    Returns:
+        numpy.ndarray or None: Typed column, or None if the column must be
+        sorted with Python comparisons
+    """
+
+    if np is None or not keys:
+        return None
+
+    key_types = set(map(type, keys))
+
+    if key_types <= {bool, int}:
+        try:
+            return np.array(keys, dtype=np.int64)
+        except OverflowError:
+            return None
+
+    if key_types <= {bool, int, float}:
+        try:
+            column = np.array(keys, dtype=np.float64)
+        except OverflowError:
+            return None
+        # NaN breaks Python's total order, so NumPy would "fix" the result
+        if np.isnan(column).any():
+            return None
+        if key_types != {float} and np.abs(column).max() > FLOAT_EXACT_INT:
+            return None
+        return column
+
+    if key_types == {str} and not numeric_only:
+        if "\x00" in "".join(keys):
+            return None
+        return np.array(keys, dtype=str)
+
+    return None
+
+
+def narrow_int_column(column):
+    """
+    Re-base an integer column onto the smallest unsigned dtype that holds it.
+
+    NumPy's stable sort is a radix sort for 8- and 16-bit integers, so bounded
+    keys such as random.randint(1, 10000) sort in linear time once narrowed.
+    Wider or non-integer columns are returned unchanged.
+
+    Args:
+        column (numpy.ndarray): Typed key column
+
+    Returns:
+        numpy.ndarray: Column with the same ordering
+    """
+
+    if column.dtype.kind not in "iu" or not len(column):
+        return column
+
+    low = column.min()
+    span = int(column.max()) - int(low)
+    if span >= 2 ** 16:
+        return column
+
+    return (column - low).astype(np.uint8 if span < 2 ** 8 else np.uint16)
+
+
+def stable_argsort(column, reverse=False):
+    """
+    Stable argsort that matches sorted(..., reverse=True) for descending order.
+
+    Python keeps equal elements in their original order even when reverse=True,
+    so the descending permutation is built by sorting the reversed column and
+    mapping the indices back.
+
+    Args:
+        column (numpy.ndarray): Typed key column
+        reverse (bool): If True, sort in descending order
+
+    Returns:
+        numpy.ndarray: Row permutation
+    """
+
+    if not reverse:
+        return np.argsort(column, kind="stable")
+
+    last = len(column) - 1
+    return last - np.argsort(column[::-1], kind="stable")[::-1]
+
+
+def gather_rows(data_list, order):
+    """Return the rows of data_list in the order given by a permutation array."""
+    return list(map(data_list.__getitem__, order.tolist()))
+
+
+def parse_sort_keys(sort_keys):
+    """
+    Normalise a sort_keys list to (key, descending) pairs.
+
+    Entries are either a plain key ('name') or a (key, direction) pair
+    (('grade', 'desc')) with direction 'asc' or 'desc'.
+
+    Args:
+        sort_keys (list): Keys in priority order
+
+    Returns:
+        list: (key, descending) tuples
+
+    Raises:
+        ValueError: If a direction is not 'asc' or 'desc'
+    """
+
+    specs = []
+    for spec in sort_keys:
+        if isinstance(spec, tuple) and len(spec) == 2 and isinstance(spec[1], str):
+            key, direction = spec
+            if direction not in SORT_DIRECTIONS:
+                raise ValueError(f"Sort direction must be 'asc' or 'desc', got '{direction}'")
+            specs.append((key, SORT_DIRECTIONS[direction]))
+        else:
+            specs.append((spec, False))
+    return specs
+
+
+def mirror_numeric_column(column):
+    """
+    Flip a numeric column so that ascending order becomes descending order.
+
+    Floats are negated; integers are mirrored around their maximum, which
+    keeps unsigned columns unsigned.
+
+    Returns:
+        numpy.ndarray or None: Mirrored column, or None if an integer column
+        spans more than int64 can hold
+    """
+
+    if column.dtype.kind == "f":
+        return -column
+    if int(column.max()) - int(column.min()) >= 2 ** 63:
+        return None
+    return column.max() - column
+
+
+def encode_sort_column(values, descending=False):
+    """
+    Encode one key column as an array whose ascending order is the requested
+    order, so several columns can be combined in one lexsort.
+
+    Numeric columns are negated (or mirrored, for integers) when descending.
+    String columns are rank-encoded: low-cardinality columns through a
+    dictionary of their sorted distinct values, others with np.unique (an
+    ascending high-cardinality column is passed through as a unicode array).
+
+    Args:
+        values (list): Key values in row order
+        descending (bool): If True, encode for descending order
+
+    Returns:
+        numpy.ndarray or None: Encoded column, or None for mixed or
+        unsupported key types
+    """
+
+    column = to_typed_array(values, numeric_only=True)
+    if column is not None:
+        if not descending:
+            return column
+        mirrored = mirror_numeric_column(column)
+        if mirrored is not None:
+            return mirrored
+
+    key_types = set(map(type, values))
+
+    if key_types == {str} and len(set(values[:CARDINALITY_SAMPLE])) > CARDINALITY_SAMPLE // 8:
+        column = to_typed_array(values)
+        if column is not None:
+            if not descending:
+                return column
+            distinct, codes = np.unique(column, return_inverse=True)
+            return len(distinct) - 1 - codes
+
+    if not (key_types == {str} or key_types <= {bool, int}):
+        return None
+
+    ranks = {value: rank for rank, value in enumerate(sorted(set(values)))}
+    codes = np.fromiter(map(ranks.__getitem__, values), dtype=np.int64, count=len(values))
+    return len(ranks) - 1 - codes if descending else codes
+
+
+def sort_dict_list_lexsort(data_list, key_specs):
+    """
+    Sort by several keys, each with its own direction, in a single lexsort.
+
+    Missing keys read as None (like sort_dict_list_multiple_keys), which
+    makes the column unsupported.
+
+    Args:
+        data_list (list): List of dictionaries to sort
+        key_specs (list): (key, descending) pairs in priority order
+
+    Returns:
+        list or None: Sorted list of dictionaries (stable), or None if any
+        column cannot be encoded and a Python sort is needed instead
+    """
+
+    if np is None:
+        return None
+
+    columns = []
+    # np.lexsort treats the last column as the primary key
+    for key, descending in reversed(key_specs):
+        encoded = encode_sort_column(list(map(methodcaller("get", key), data_list)), descending)
+        if encoded is None:
+            return None
+        columns.append(narrow_int_column(encoded))
+
+    return gather_rows(data_list, np.lexsort(columns))
+
+
+# ============================================================================
+# BENCHMARK: LEXSORT VS CHAINED SORTS
+# ============================================================================
+
+def _sort_chained(data_list, key_specs):
+    """The repeated-sort workaround for per-key directions, kept as the baseline."""
+    sorted_list = list(data_list)
+    for key, descending in reversed(key_specs):
+        sorted_list.sort(key=lambda x: x.get(key), reverse=descending)
+    return sorted_list
+
+
+def _best_of(repeats, func, *args):
+    """Run func repeatedly and return (best time in ms, last result)."""
+    best_ms = float("inf")
+    for _ in range(repeats):
+        start_time = time.perf_counter()
+        result = func(*args)
+        best_ms = min(best_ms, (time.perf_counter() - start_time) * 1000)
+    return best_ms, result
+
+
+if __name__ == "__main__":
+    import sys
+
+    print("="*80)
+    print("PER-KEY DIRECTIONS - LEXSORT VS CHAINED SORTS")
+    print("="*80)
+
+    if np is None:
+        sys.exit("\n⚠️  NumPy is not installed - sort_dict_list_lexsort needs it")
+
+    sizes = [int(arg) for arg in sys.argv[1:]] or [100_000, 1_000_000]
+    repeats = 3
+
+    scenarios = {
+        "dept asc, grade desc, age asc": [('dept', 'asc'), ('grade', 'desc'), ('age', 'asc')],
+        "grade desc, name asc": [('grade', 'desc'), ('name', 'asc')],
+    }
+
+    print(f"\n{'keys':32s} {'rows':>10s} {'chained (ms)':>13s} "
+          f"{'lexsort (ms)':>13s} {'speedup':>8s}")
+    print("-" * 80)
+
+    for size in sizes:
+        students = [
+            {
+                "name": f"student_{random.randint(1, size):07d}",
+                "dept": random.choice(['CS', 'EE', 'ME', 'CE', 'BIO']),
+                "grade": random.randint(50, 100),
+                "age": random.randint(18, 30),
+            }
+            for _ in range(size)
+        ]
+
+        for label, sort_keys in scenarios.items():
+            key_specs = parse_sort_keys(sort_keys)
+            chained_ms, expected = _best_of(repeats, _sort_chained, students, key_specs)
+            lexsort_ms, actual = _best_of(repeats, sort_dict_list_lexsort, students, key_specs)
+
+            assert all(a is b for a, b in zip(actual, expected)), "order mismatch"
+            print(f"{label:32s} {size:>10,d} {chained_ms:>13.1f} {lexsort_ms:>13.1f} "
+                  f"{chained_ms / lexsort_ms:>7.2f}x")
+
+    print("\n✓ Lexsort results identical to the chained sorts for every size")
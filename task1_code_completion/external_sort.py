@@ -0,0 +1,249 @@
+"""
+Task 1: AI-Powered Code Completion - External Merge Sort
+Objective: Sort streams of dictionaries that do not fit in memory by spilling
+sorted runs to disk and k-way merging them back
+Author: [Kipruto Andrew Kipngetich]
+Date: October 2026
+"""
+
+import heapq
+import json
+import os
+import pickle
+import sys
+import tempfile
+from itertools import islice
+
+
+DEFAULT_MEMORY_BUDGET = 64 * 1024 * 1024  # bytes
+DEFAULT_MAX_OPEN_RUNS = 64
+
+# Bytes per list slot holding a record while a run is buffered
+_SLOT_SIZE = 8
+
+
+def estimate_record_size(record):
+    """
+    Approximate the in-memory footprint of one dictionary record.
+
+    Counts the dict itself plus its keys and values (one level deep). Shared
+    objects such as interned key strings are counted every time, so the
+    estimate errs on the high side.
+
+    Args:
+        record (dict): Record to measure
+
+    Returns:
+        int: Estimated size in bytes
+    """
+
+    size = sys.getsizeof(record) + _SLOT_SIZE
+    for key, value in record.items():
+        size += sys.getsizeof(key) + sys.getsizeof(value)
+    return size
+
+
+def _write_run(rows, directory, batch_rows):
+    """
+    Spill a sorted run to a temporary file.
+
+    Rows are pickled in batches: each batch shares one pickle memo, so the
+    repeated field names are written once per batch instead of once per row.
+
+    Returns:
+        str: Path of the run file
+    """
+
+    handle, path = tempfile.mkstemp(suffix=".run", dir=directory)
+    with os.fdopen(handle, "wb") as run_file:
+        iterator = iter(rows)
+        while True:
+            batch = list(islice(iterator, batch_rows))
+            if not batch:
+                break
+            pickle.dump(batch, run_file, protocol=pickle.HIGHEST_PROTOCOL)
+    return path
+
+
+def _read_run(path):
+    """Yield the rows of a run file, holding one batch in memory at a time."""
+    with open(path, "rb") as run_file:
+        while True:
+            try:
+                batch = pickle.load(run_file)
+            except EOFError:
+                break
+            yield from batch
+    os.remove(path)
+
+
+def _merge_runs(paths, key, reverse):
+    """Stable k-way merge: ties are taken from the earlier run first."""
+    return heapq.merge(*(_read_run(path) for path in paths), key=key, reverse=reverse)
+
+
+def external_sort_dict_stream(records, sort_key, reverse=False, default_value=None,
+                              memory_budget=DEFAULT_MEMORY_BUDGET,
+                              max_open_runs=DEFAULT_MAX_OPEN_RUNS, temp_dir=None):
+    """
+    Sort an iterable of dictionaries of any size within a memory budget.
+
+    Uses the same key semantics as sort_dict_list_with_default (missing keys
+    sort as default_value) and the same stable ordering.
+
+    Phases:
+        1. Buffer records until their estimated size reaches memory_budget,
+           sort the buffer and spill it to disk as a run.
+        2. While more than max_open_runs runs exist, merge neighbouring groups
+           into longer runs (neighbours only, so stability is kept).
+        3. Lazily k-way merge the remaining runs.
+
+    Run files are read back in batches sized so that max_open_runs open
+    batches also fit in memory_budget.
+
+    Args:
+        records (iterable): Dictionaries to sort (list, generator, file reader)
+        sort_key (str): Key to sort by
+        reverse (bool): If True, sort in descending order
+        default_value: Default value for missing keys
+        memory_budget (int): Approximate peak memory for buffered records, bytes
+        max_open_runs (int): Maximum number of runs merged at once (>= 2)
+        temp_dir (str): Directory for run files (system default if None)
+
+    Yields:
+        dict: Records in sorted order
+
+    Time Complexity: O(n log n) - plus O(log_k(runs)) passes over the data
+    Space Complexity: O(memory_budget) - independent of the input size
+    """
+
+    if max_open_runs < 2:
+        raise ValueError("max_open_runs must be at least 2")
+
+    key = lambda x: x.get(sort_key, default_value)
+
+    work_dir = tempfile.TemporaryDirectory(prefix="external_sort_", dir=temp_dir)
+    try:
+        runs = []
+        buffer = []
+        buffered_bytes = 0
+        total_bytes = 0
+        total_rows = 0
+        batch_rows = None
+
+        for record in records:
+            record_bytes = estimate_record_size(record)
+            buffer.append(record)
+            buffered_bytes += record_bytes
+            total_bytes += record_bytes
+            total_rows += 1
+
+            if buffered_bytes >= memory_budget:
+                if batch_rows is None:
+                    average = total_bytes / total_rows
+                    batch_rows = max(1, int(memory_budget / (max_open_runs * average)))
+                buffer.sort(key=key, reverse=reverse)
+                runs.append(_write_run(buffer, work_dir.name, batch_rows))
+                buffer = []
+                buffered_bytes = 0
+
+        buffer.sort(key=key, reverse=reverse)
+
+        if not runs:
+            # Everything fit in one run: no disk round-trip needed
+            yield from buffer
+            return
+
+        if buffer:
+            runs.append(_write_run(buffer, work_dir.name, batch_rows))
+        del buffer
+
+        while len(runs) > max_open_runs:
+            merged = []
+            for start in range(0, len(runs), max_open_runs):
+                group = runs[start:start + max_open_runs]
+                if len(group) == 1:
+                    merged.append(group[0])
+                    continue
+                merged.append(_write_run(_merge_runs(group, key, reverse),
+                                         work_dir.name, batch_rows))
+            runs = merged
+
+        yield from _merge_runs(runs, key, reverse)
+    finally:
+        work_dir.cleanup()
+
+
+def iter_jsonl(path):
+    """
+    Stream dictionaries from a JSON-lines file, one line at a time.
+
+    Args:
+        path (str): Path to a .jsonl file
+
+    Yields:
+        dict: One record per non-blank line
+    """
+
+    with open(path, encoding="utf-8") as jsonl_file:
+        for line in jsonl_file:
+            if line.strip():
+                yield json.loads(line)
+
+
+# ============================================================================
+# DEMONSTRATION
+# ============================================================================
+
+if __name__ == "__main__":
+    import random
+    import time
+    import tracemalloc
+
+    from manual_implementation import sort_dict_list_with_default
+
+    print("="*80)
+    print("EXTERNAL MERGE SORT - STREAMING DICTIONARIES")
+    print("="*80)
+
+    def generate_records(count, seed):
+        rng = random.Random(seed)
+        for i in range(count):
+            record = {"id": i, "category": rng.choice(['A', 'B', 'C', 'D'])}
+            if rng.random() > 0.1:  # ~10% of records have no value
+                record["value"] = rng.randint(1, 100000)
+            yield record
+
+    # Correctness: identical to the in-memory sort, including ties
+    print("\n[Check] Matches sort_dict_list_with_default:")
+    print("-" * 80)
+    sample = list(generate_records(50_000, seed=1))
+    for reverse in (False, True):
+        expected = sort_dict_list_with_default(sample, 'value', reverse=reverse, default_value=0)
+        actual = list(external_sort_dict_stream(
+            iter(sample), 'value', reverse=reverse, default_value=0,
+            memory_budget=256 * 1024, max_open_runs=4,
+        ))
+        assert [r["id"] for r in actual] == [r["id"] for r in expected]
+        print(f"  reverse={reverse}: ✓ identical order ({len(actual):,} rows)")
+
+    # Memory: peak stays near the budget while the input grows
+    print("\n[Benchmark] Peak memory vs input size (budget 8 MB):")
+    print("-" * 80)
+    budget = 8 * 1024 * 1024
+    for count in (100_000, 200_000, 400_000):
+        tracemalloc.start()
+        start_time = time.perf_counter()
+        previous = None
+        for record in external_sort_dict_stream(
+                generate_records(count, seed=2), 'value',
+                default_value=0, memory_budget=budget):
+            value = record.get('value', 0)
+            assert previous is None or previous <= value
+            previous = value
+        elapsed = time.perf_counter() - start_time
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"  {count:>10,d} rows: {elapsed:6.2f} s, peak {peak / 2**20:6.1f} MB")
+
+    print("\n✓ External sort complete")
@@ -0,0 +1,290 @@
+"""
+Task 1: AI-Powered Code Completion - Incremental Re-Sort
+Objective: Re-sort append-mostly lists of dictionaries by sorting only the
+new tail and merging it into the already-sorted prefix
+Author: [Kipruto Andrew Kipngetich]
+Date: October 2026
+"""
+
+from bisect import bisect_right
+from itertools import compress, count, islice
+from operator import gt, itemgetter, lt
+
+from columnar_sort import extract_key_column, raise_invalid_rows, validate_rows
+
+
+# Bisect-merging a tail costs about log2(prefix) probes per tail row;
+# Timsort's own run merge wins once that exceeds prefix / MERGE_COST_RATIO.
+# Probing an extracted key list is about twice as cheap as probing dicts.
+MERGE_COST_RATIO = 8
+KEY_LIST_MERGE_COST_RATIO = 4
+
+
+def sorted_run_length(keys, reverse=False):
+    """
+    Length of the longest prefix of keys that is already in sorted order.
+
+    Uses map() over adjacent pairs and stops at the first out-of-order pair,
+    so the scan runs at C speed.
+
+    Args:
+        keys (list): Key values in row order
+        reverse (bool): If True, measure a non-increasing prefix
+
+    Returns:
+        int: Number of leading keys that are sorted (len(keys) if all are)
+    """
+
+    out_of_order = lt if reverse else gt
+    pairs = map(out_of_order, keys, islice(keys, 1, None))
+    return next(compress(count(1), pairs), len(keys))
+
+
+def is_strictly_reversed(keys, reverse=False):
+    """
+    True if keys run strictly against the requested order.
+
+    Only a strict run can simply be reversed: equal neighbours would swap
+    places and break stability.
+    """
+
+    against_order = lt if reverse else gt
+    return all(map(against_order, keys, islice(keys, 1, None)))
+
+
+def count_descents(keys, reverse=False):
+    """Number of adjacent pairs that are out of the requested order."""
+    out_of_order = lt if reverse else gt
+    return sum(map(out_of_order, keys, islice(keys, 1, None)))
+
+
+def tail_merge_pays_off(prefix_length, tail_length, cost_ratio=MERGE_COST_RATIO):
+    """True if bisect-merging the tail beats letting Timsort merge the runs."""
+    return tail_length * max(prefix_length, 2).bit_length() * cost_ratio <= prefix_length
+
+
+def plan_incremental_sort(keys, reverse=False):
+    """
+    Decide how much work a re-sort needs.
+
+    Plans:
+        sorted     - already in order; copy the list
+        reversed   - strictly in the opposite order; reverse the list
+        merge_tail - sorted prefix plus a short tail; sort the tail and
+                     bisect-merge it into the prefix
+        timsort    - anything else; Timsort still exploits existing runs,
+                     so near-sorted input stays close to linear
+
+    Args:
+        keys (list): Key values in row order
+        reverse (bool): If True, plan a descending sort
+
+    Returns:
+        tuple: (plan name, sorted prefix length)
+    """
+
+    sorted_prefix = sorted_run_length(keys, reverse)
+    if sorted_prefix == len(keys):
+        return "sorted", sorted_prefix
+    if sorted_prefix == 1 and is_strictly_reversed(keys, reverse):
+        return "reversed", sorted_prefix
+    if tail_merge_pays_off(sorted_prefix, len(keys) - sorted_prefix, KEY_LIST_MERGE_COST_RATIO):
+        return "merge_tail", sorted_prefix
+    return "timsort", sorted_prefix
+
+
+def _insert_position(sequence, value, lo, hi, get_key, reverse):
+    """
+    Index after every prefix entry that sorts at or before value.
+
+    Ascending order uses bisect (in C); descending order has no bisect
+    equivalent, so it is a plain binary search.
+    """
+
+    if not reverse:
+        return bisect_right(sequence, value, lo, hi, key=get_key)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        probe = sequence[mid] if get_key is None else get_key(sequence[mid])
+        if probe >= value:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+
+def merge_sorted_tail(data_list, sorted_prefix, sort_key, reverse=False, keys=None):
+    """
+    Sort data_list[sorted_prefix:] and merge it into the sorted prefix.
+
+    Each tail row is placed with a binary search that starts where the
+    previous one ended, and the prefix is copied across in slices, so the
+    prefix rows' keys are read only O(tail * log n) times.
+
+    Ties keep stable order: prefix rows stay ahead of tail rows with an
+    equal key, exactly as a full stable sort would leave them.
+
+    Args:
+        data_list (list): Rows whose first sorted_prefix entries are sorted
+        sorted_prefix (int): Length of the sorted prefix
+        sort_key (str): Key to sort by
+        reverse (bool): If True, sort in descending order
+        keys (list): Key of every row, if already extracted (searched
+            directly instead of through the dictionaries)
+
+    Returns:
+        list: Sorted list of dictionaries
+    """
+
+    get_key = itemgetter(sort_key)
+    tail = sorted(data_list[sorted_prefix:], key=get_key, reverse=reverse)
+    sequence, probe_key = (data_list, get_key) if keys is None else (keys, None)
+
+    merged = []
+    start = 0
+    for row in tail:
+        pos = _insert_position(sequence, get_key(row), start, sorted_prefix, probe_key, reverse)
+        merged += data_list[start:pos]
+        merged.append(row)
+        start = pos
+    merged += data_list[start:sorted_prefix]
+    return merged
+
+
+def sort_dict_list_incremental(data_list, sort_key, reverse=False, sorted_prefix=None,
+                               validation="full"):
+    """
+    Re-sort a list whose front is already sorted (e.g. events by timestamp
+    with new rows appended since the last call).
+
+    With sorted_prefix the caller vouches that data_list[:sorted_prefix]
+    is sorted and valid (typically the length of the previous result), so
+    only the appended rows are validated (at the given level) and sorted.
+    Invalid rows are reported by their position in data_list, as
+    sort_dict_list_manual would report them. Without it, the sorted
+    prefix is detected with one C-speed pass over the keys, and fully
+    sorted or strictly reversed inputs skip sorting altogether.
+
+    Args:
+        data_list (list): List of dictionaries to sort
+        sort_key (str): Key to sort by
+        reverse (bool): If True, sort in descending order
+        sorted_prefix (int): Length of the already-sorted prefix, if known
+        validation (str): Check level for the appended rows (see
+            columnar_sort.validate_rows); without sorted_prefix every row
+            is checked while its key is extracted
+
+    Returns:
+        list: Sorted list of dictionaries (same order as sort_dict_list_manual)
+
+    Raises:
+        TypeError: If data_list is not a list or contains non-dictionaries
+        KeyError: If sort_key is missing from a validated dictionary; the
+            error lists every offending row index
+        ValueError: If sorted_prefix is outside 0..len(data_list), or
+            validation is not a known level
+
+    Time Complexity: O(k log k + k log n + n) for k appended rows (the
+    O(n) part is a slice copy); O(n) for sorted or reversed input
+    """
+
+    if not isinstance(data_list, list):
+        raise TypeError("data_list must be a list")
+
+    if sorted_prefix is None:
+        keys = extract_key_column(data_list, sort_key)
+        plan, sorted_prefix = plan_incremental_sort(keys, reverse)
+    else:
+        if not 0 <= sorted_prefix <= len(data_list):
+            raise ValueError("sorted_prefix must be between 0 and len(data_list)")
+        # Validate the appended rows only; the prefix was checked last time
+        try:
+            validate_rows(data_list[sorted_prefix:], sort_key, validation)
+        except (KeyError, TypeError):
+            raise_invalid_rows(data_list, sort_key, start=sorted_prefix)
+            raise
+        keys = None
+        tail_length = len(data_list) - sorted_prefix
+        plan = "merge_tail" if tail_merge_pays_off(sorted_prefix, tail_length) else "timsort"
+
+    if plan == "sorted":
+        return list(data_list)
+    if plan == "reversed":
+        return data_list[::-1]
+    try:
+        if plan == "merge_tail":
+            return merge_sorted_tail(data_list, sorted_prefix, sort_key, reverse, keys)
+        return sorted(data_list, key=itemgetter(sort_key), reverse=reverse)
+    except (KeyError, TypeError):
+        # An appended row that sampled / skipped validation did not see
+        raise_invalid_rows(data_list, sort_key, start=sorted_prefix)
+        raise
+
+
+# ============================================================================
+# BENCHMARK: INCREMENTAL VS FULL RE-SORT
+# ============================================================================
+
+if __name__ == "__main__":
+    import random
+    import sys
+    import time
+
+    from manual_implementation import sort_dict_list_manual
+
+    print("="*80)
+    print("INCREMENTAL RE-SORT FOR APPEND-MOSTLY LISTS")
+    print("="*80)
+
+    # 10M event rows need roughly 3 GB of RAM; pass a smaller size as an
+    # argument on smaller machines, e.g. python incremental_sort.py 1000000
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000
+    rng = random.Random(42)
+    events = [{"id": i, "timestamp": i * 10 + rng.randint(0, 9)} for i in range(size)]
+
+    def timed(func, *args, **kwargs):
+        start_time = time.perf_counter()
+        result = func(*args, **kwargs)
+        return time.perf_counter() - start_time, result
+
+    print(f"\nSorted prefix: {size:,} events; appended rows have random timestamps\n")
+    print(f"{'appended':>10s} {'full re-sort':>14s} {'detect prefix':>14s} "
+          f"{'prefix hint':>14s} {'plan':>12s} {'speedup':>9s}")
+    print("-" * 80)
+
+    for fraction in (0.001, 0.01, 0.1):
+        appended = [
+            {"id": -1, "timestamp": rng.randint(0, size * 10)}
+            for _ in range(int(size * fraction))
+        ]
+        current = events + appended
+
+        full_time, expected = timed(sort_dict_list_manual, current, 'timestamp')
+        detect_time, detected = timed(sort_dict_list_incremental, current, 'timestamp')
+        hint_time, hinted = timed(sort_dict_list_incremental, current, 'timestamp',
+                                  sorted_prefix=size)
+        assert all(a is b for a, b in zip(detected, expected)), "order mismatch"
+        assert all(a is b for a, b in zip(hinted, expected)), "order mismatch"
+
+        plan = "merge_tail" if tail_merge_pays_off(size, len(appended)) else "timsort"
+        print(f"{fraction:>10.1%} {full_time:>13.3f}s {detect_time:>13.3f}s "
+              f"{hint_time:>13.3f}s {plan:>12s} {full_time / hint_time:>8.1f}x")
+        del current, expected, detected, hinted
+
+    print("\n[Presortedness detection]")
+    print("-" * 80)
+    sample = events[:100_000]
+    for label, rows in (("sorted", sample), ("reverse-sorted", sample[::-1]),
+                        ("1% random swaps", None)):
+        if rows is None:
+            rows = list(sample)
+            for _ in range(len(rows) // 100):
+                i, j = rng.randrange(len(rows)), rng.randrange(len(rows))
+                rows[i], rows[j] = rows[j], rows[i]
+        keys = extract_key_column(rows, 'timestamp')
+        elapsed, result = timed(sort_dict_list_incremental, rows, 'timestamp')
+        assert [r['id'] for r in result] == sorted(r['id'] for r in rows)
+        print(f"  {label:16s} plan={plan_incremental_sort(keys)[0]:10s} "
+              f"descents={count_descents(keys):6,d} {elapsed * 1000:8.1f} ms")
+
+    print("\n✓ Incremental results identical to a full re-sort")
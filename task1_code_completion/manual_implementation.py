@@ -5,7 +5,28 @@ Author: [Kipruto Andrew Kipngetich]
 Date: October 2025
 """
 
-def sort_dict_list_manual(data_list, sort_key, reverse=False):
+from operator import itemgetter, methodcaller
+
+from columnar_sort import (
+    COLUMNAR_THRESHOLD,
+    VALIDATION_LEVELS,
+    extract_key_column,
+    parse_sort_keys,
+    raise_invalid_rows,
+    sort_dict_list_lexsort,
+    validate_rows,
+)
+from incremental_sort import sort_dict_list_incremental
+from parallel_sort import sort_dict_list_multiple_keys_parallel
+from record_table import RecordTable
+from specialized_sort import (
+    SPECIALIZED_MIN_ROWS,
+    bucket_sort_dict_list,
+    sort_rows_by_keys,
+)
+
+def sort_dict_list_manual(data_list, sort_key, reverse=False, sorted_prefix=None,
+                          validation="full", return_strategy=False):
     """
     Manually implemented function to sort a list of dictionaries by a specific key.
     
@@ -13,43 +34,94 @@ def sort_dict_list_manual(data_list, sort_key, reverse=False):
         data_list (list): List of dictionaries to sort
         sort_key (str): Key to sort by
         reverse (bool): If True, sort in descending order
+        sorted_prefix (int): Length of a prefix already sorted by an earlier
+            call; only the rows after it are validated, sorted and merged in
+            (see incremental_sort.py)
+        validation (str): 'full' checks every row, 'sampled' checks a random
+            sample (trusted pipeline data), 'off' skips the checks
+        return_strategy (bool): If True, also return the name of the sort
+            used: one of specialized_sort.STRATEGIES, 'incremental' for
+            sorted_prefix calls or 'record_table' for RecordTable input
         
     Returns:
-        list: Sorted list of dictionaries
+        list: Sorted list of dictionaries, or a (list, strategy) tuple if
+        return_strategy is True
+        
+    Raises:
+        TypeError: If data_list is not a list, or rows are not dictionaries
+        KeyError: If sort_key is missing from any dictionary; the error
+            lists every offending row index (see columnar_sort.raise_invalid_rows)
+        ValueError: If validation is not 'full', 'sampled' or 'off'
         
     Time Complexity: O(n log n) - using Python's Timsort algorithm
     Space Complexity: O(n) - creates new sorted list
+    
+    Note: 'full' validation is the key extraction itself
+    (columnar_sort.extract_key_column), and the extracted keys go through
+    specialized_sort.sort_rows_by_keys: from SPECIALIZED_MIN_ROWS rows,
+    bounded integer keys are counting / radix sorted and keys with few
+    distinct values bucket sorted; everything else is Timsort over the
+    same keys. With 'sampled' or 'off', lists of COLUMNAR_THRESHOLD items
+    or more try a one-pass bucket sort first. Every path returns the same
+    stable order as sorted().
     """
     
     # Validate inputs
-    if not data_list:
-        return []
+    if validation not in VALIDATION_LEVELS:
+        raise ValueError(f"validation must be one of {VALIDATION_LEVELS}, got {validation!r}")
+    
+    if isinstance(data_list, RecordTable):
+        if data_list.columns and sort_key not in data_list.columns:
+            raise KeyError(f"Key '{sort_key}' not found in all dictionaries")
+        sorted_list, strategy = data_list.sort_by(sort_key, reverse=reverse), "record_table"
+    
+    elif not data_list:
+        sorted_list, strategy = [], "timsort"
     
-    if not isinstance(data_list, list):
+    elif not isinstance(data_list, list):
         raise TypeError("data_list must be a list")
     
-    if not all(isinstance(item, dict) for item in data_list):
-        raise TypeError("All items in data_list must be dictionaries")
+    # Append-mostly lists: sort only the new tail and merge it in
+    elif sorted_prefix is not None:
+        sorted_list = sort_dict_list_incremental(
+            data_list, sort_key, reverse, sorted_prefix, validation)
+        strategy = "incremental"
     
-    # Check if sort_key exists in all dictionaries
-    if not all(sort_key in item for item in data_list):
-        raise KeyError(f"Key '{sort_key}' not found in all dictionaries")
+    elif validation == "full":
+        # One pass checks every row and pulls out its key; the sort reuses
+        # the keys instead of reading the rows again
+        keys = extract_key_column(data_list, sort_key)
+        sorted_list, strategy = sort_rows_by_keys(data_list, keys, reverse)
     
-    # Create a copy to avoid modifying the original list
-    sorted_list = data_list.copy()
+    else:
+        sorted_list, strategy = _sort_spot_checked(data_list, sort_key, reverse, validation)
     
-    # Sort using the built-in sorted() function with a lambda key function
-    # Lambda extracts the value of sort_key from each dictionary
-    sorted_list = sorted(
-        sorted_list,
-        key=lambda x: x[sort_key],
-        reverse=reverse
-    )
+    return (sorted_list, strategy) if return_strategy else sorted_list
+
+
+def _sort_spot_checked(data_list, sort_key, reverse, validation):
+    """sort_dict_list_manual for 'sampled' / 'off' validation: (rows, strategy)."""
     
-    return sorted_list
+    # Spot checks only; a row they miss is reported after the sort fails
+    validate_rows(data_list, sort_key, validation)
+    
+    try:
+        # Large inputs: one-pass bucket sort when the key has few distinct values
+        if len(data_list) >= COLUMNAR_THRESHOLD:
+            sorted_list = bucket_sort_dict_list(data_list, sort_key, reverse)
+            if sorted_list is not None:
+                return sorted_list, "bucket"
+        
+        # Sort using the built-in sorted() function (returns a new list)
+        return sorted(data_list, key=itemgetter(sort_key), reverse=reverse), "timsort"
+    except (KeyError, TypeError):
+        # A row that sampled / skipped validation did not see: report them all
+        raise_invalid_rows(data_list, sort_key)
+        raise
 
 
-def sort_dict_list_with_default(data_list, sort_key, reverse=False, default_value=None):
+def sort_dict_list_with_default(data_list, sort_key, reverse=False, default_value=None,
+                                return_strategy=False):
     """
     Enhanced version that handles missing keys with default values.
     
@@ -58,32 +130,51 @@ def sort_dict_list_with_default(data_list, sort_key, reverse=False, default_valu
         sort_key (str): Key to sort by
         reverse (bool): If True, sort in descending order
         default_value: Default value for missing keys
+        return_strategy (bool): If True, also return the name of the sort
+            used (see sort_dict_list_manual)
         
     Returns:
-        list: Sorted list of dictionaries
+        list: Sorted list of dictionaries, or a (list, strategy) tuple if
+        return_strategy is True
     """
     
     if not data_list:
-        return []
-    
-    # Use get() method with default value to handle missing keys
-    sorted_list = sorted(
-        data_list,
-        key=lambda x: x.get(sort_key, default_value),
-        reverse=reverse
-    )
-    
-    return sorted_list
+        return ([], "timsort") if return_strategy else []
+    
+    if isinstance(data_list, RecordTable):
+        sorted_list = data_list.sort_by(sort_key, reverse=reverse, default_value=default_value)
+        strategy = "record_table"
+    
+    elif isinstance(data_list, list) and len(data_list) >= SPECIALIZED_MIN_ROWS:
+        # Large inputs: extract the keys once and pick a counting, radix,
+        # bucket or Timsort pass for them (specialized_sort.py)
+        keys = list(map(methodcaller("get", sort_key, default_value), data_list))
+        sorted_list, strategy = sort_rows_by_keys(data_list, keys, reverse)
+    
+    else:
+        # Use get() method with default value to handle missing keys
+        sorted_list = sorted(
+            data_list,
+            key=lambda x: x.get(sort_key, default_value),
+            reverse=reverse
+        )
+        strategy = "timsort"
+    
+    return (sorted_list, strategy) if return_strategy else sorted_list
 
 
-def sort_dict_list_multiple_keys(data_list, sort_keys, reverse=False):
+def sort_dict_list_multiple_keys(data_list, sort_keys, reverse=False, workers=1):
     """
     Sort by multiple keys in order of priority.
     
     Args:
         data_list (list): List of dictionaries to sort
-        sort_keys (list): List of keys to sort by (in priority order)
-        reverse (bool): If True, sort in descending order
+        sort_keys (list): Keys to sort by (in priority order); each entry is
+            a key or a (key, 'asc' | 'desc') pair
+        reverse (bool): If True, flip every key's direction
+        workers (int): Worker processes; values above 1 use the parallel
+            mode in parallel_sort.py (None means one per CPU core). Only
+            used when all keys share one direction.
         
     Returns:
         list: Sorted list of dictionaries
@@ -91,15 +182,46 @@ def sort_dict_list_multiple_keys(data_list, sort_keys, reverse=False):
     Example:
         sort_dict_list_multiple_keys(students, ['grade', 'name'])
         # Sorts by grade first, then by name for students with same grade
+        
+        sort_dict_list_multiple_keys(students, [('grade', 'desc'), ('name', 'asc')])
+        # Highest grade first, names alphabetical within a grade
     """
     
+    if isinstance(data_list, RecordTable):
+        return data_list.sort_by(list(sort_keys), reverse=reverse)
+    
     if not data_list:
         return []
     
+    key_specs = [(key, descending != reverse) for key, descending in parse_sort_keys(sort_keys)]
+    directions = {descending for _, descending in key_specs}
+    
+    # Large inputs: one stable lexsort over encoded key columns
+    if workers == 1 and len(data_list) >= COLUMNAR_THRESHOLD:
+        sorted_list = sort_dict_list_lexsort(data_list, key_specs)
+        if sorted_list is not None:
+            return sorted_list
+    
+    if len(directions) > 1:
+        # Mixed directions with unencodable keys: chained stable sorts,
+        # least significant key first
+        sorted_list = list(data_list)
+        for key, descending in reversed(key_specs):
+            sorted_list.sort(key=methodcaller("get", key), reverse=descending)
+        return sorted_list
+    
+    keys = [key for key, _ in key_specs]
+    reverse = directions.pop()
+    
+    if workers != 1:
+        return sort_dict_list_multiple_keys_parallel(
+            data_list, keys, reverse=reverse, workers=workers
+        )
+    
     # Sort by multiple keys using tuple in lambda
     sorted_list = sorted(
         data_list,
-        key=lambda x: tuple(x.get(key) for key in sort_keys),
+        key=lambda x: tuple(x.get(key) for key in keys),
         reverse=reverse
     )
     
@@ -196,8 +318,7 @@ if __name__ == "__main__":
     
     sorted_students = sort_dict_list_multiple_keys(
         students,
-        ['grade', 'name'],
-        reverse=True
+        [('grade', 'desc'), ('name', 'asc')]
     )
     print("\nSorted by grade (desc), then by name (asc):")
     for student in sorted_students:
@@ -207,29 +328,15 @@ if __name__ == "__main__":
     print("\n[Test 6] Performance test with large dataset:")
     print("-" * 80)
     
-    import time
-    import random
-    
-    # Generate large dataset
-    large_dataset = [
-        {
-            "id": i,
-            "value": random.randint(1, 10000),
-            "category": random.choice(['A', 'B', 'C', 'D'])
-        }
-        for i in range(10000)
-    ]
-    
-    print(f"Dataset size: {len(large_dataset)} items")
+    from benchmark_suite import print_results, run_benchmark
     
-    start_time = time.time()
-    sorted_large = sort_dict_list_manual(large_dataset, 'value')
-    end_time = time.time()
-    
-    execution_time = (end_time - start_time) * 1000  # Convert to milliseconds
-    print(f"Sorting time: {execution_time:.2f} ms")
-    print(f"First 5 items: {sorted_large[:5]}")
-    print(f"Last 5 items: {sorted_large[-5:]}")
+    # Median / p95 of repeated runs after warmup, plus tracemalloc peak;
+    # python benchmark_suite.py runs the full matrix and regression checks
+    print_results(run_benchmark(
+        ["sort_dict_list_manual"], sizes=[10000],
+        key_types=["int_bounded", "str_low_card"],
+        orders=["random", "nearly_sorted"], missing_ratios=[0.0],
+    ))
     
     # Test Case 7: Error handling
     print("\n[Test 7] Error handling:")
@@ -248,8 +355,26 @@ if __name__ == "__main__":
     except TypeError as e:
         print(f"✓ Correctly caught error: {e}")
     
-    # Test Case 8: Edge cases
-    print("\n[Test 8] Edge cases:")
+    try:
+        # Every offending row is reported, not just the first
+        gappy_data = [{"name": f"user_{i}"} if i % 7 else {"age": i} for i in range(100)]
+        sort_dict_list_manual(gappy_data, 'name')
+    except KeyError as e:
+        print(f"✓ Correctly caught error: {e}")
+        print(f"  {len(e.invalid_rows)} offending rows: {e.invalid_rows[:5]}...")
+    
+    # Test Case 8: Validation levels
+    print("\n[Test 8] Validation overhead (full / sampled / off):")
+    print("-" * 80)
+    
+    print_results(run_benchmark(
+        ["sort_dict_list_manual", "sort_dict_list_manual[sampled]", "sort_dict_list_manual[off]"],
+        sizes=[100000], key_types=["int_wide", "str_low_card"],
+        orders=["random", "sorted"], missing_ratios=[0.0],
+    ))
+    
+    # Test Case 9: Edge cases
+    print("\n[Test 9] Edge cases:")
     print("-" * 80)
     
     # Empty list
@@ -0,0 +1,296 @@
+"""
+Task 1: AI-Powered Code Completion - Parallel Multi-Key Sort
+Objective: Spread sort_dict_list_multiple_keys over a process pool for large
+report builds
+Author: [Kipruto Andrew Kipngetich]
+Date: October 2026
+"""
+
+import heapq
+import marshal
+import os
+import pickle
+import random
+from array import array
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+from operator import methodcaller
+
+# Below this many rows the pool round trips and encoding cost more than they
+# save. The parent's own share (extract, encode, gather) is ~40% of the serial
+# sort at 1M rows, so even a perfect pool tops out near 2.4x; the benchmark's
+# crossover section checks this value on a given machine
+PARALLEL_THRESHOLD = 200_000
+
+# Sampled rows per worker used to pick the key ranges (sample sort)
+SPLITTER_OVERSAMPLING = 64
+
+
+def _encode_column(values):
+    """
+    Encode one key column as a compact byte buffer for a worker.
+
+    marshal handles the usual key types (None, bool, int, float, str, bytes)
+    far faster than pickle; anything else falls back to pickle.
+    """
+    try:
+        return b"M" + marshal.dumps(values)
+    except ValueError:
+        return b"P" + pickle.dumps(values, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _decode_column(buffer):
+    """Inverse of _encode_column."""
+    if buffer[:1] == b"M":
+        return marshal.loads(buffer[1:])
+    return pickle.loads(buffer[1:])
+
+
+def _sort_keys(columns, positions):
+    """
+    Key tuples with a trailing tiebreak, one per row.
+
+    The tiebreak makes every tuple distinct, so plain ascending tuple
+    order is a stable order without any key function. For a descending
+    sort it is the negated row index (see _merge_range).
+    """
+    return list(zip(*columns, positions))
+
+
+def _split_chunk(offset, encoded_columns, splitters, reverse):
+    """
+    Worker, first round: sort one chunk and cut it at the splitters.
+
+    Args:
+        offset (int): Index of the chunk's first row in the full list
+        encoded_columns (list): One _encode_column buffer per sort key
+        splitters (list): Ascending key tuples bounding each key range
+        reverse (bool): If True, tiebreaks are negated row indices
+
+    Returns:
+        list: One encoded sorted run per key range (len(splitters) + 1)
+    """
+    columns = list(map(_decode_column, encoded_columns))
+    size = len(columns[0])
+    positions = range(-offset, -offset - size, -1) if reverse else range(offset, offset + size)
+    rows = sorted(_sort_keys(columns, positions))
+
+    cuts = [0, *(bisect_left(rows, splitter) for splitter in splitters), size]
+    return [_encode_column(rows[start:end]) for start, end in zip(cuts, cuts[1:])]
+
+
+def _merge_range(encoded_runs, reverse):
+    """
+    Worker, second round: merge every chunk's run for one key range.
+
+    Args:
+        encoded_runs (list): The range's sorted run from each chunk
+        reverse (bool): If True, return the range in descending order
+
+    Returns:
+        bytes: Global row indices in sorted order, as a packed int64 array
+    """
+    runs = list(map(_decode_column, encoded_runs))
+    order = array("q", [row[-1] for row in heapq.merge(*runs)])
+    if reverse:
+        # Ascending by (keys, -index), reversed: keys descending and equal
+        # keys in input order
+        order = array("q", [-position for position in reversed(order)])
+    return order.tobytes()
+
+
+def _pick_splitters(columns, reverse, count):
+    """Sample the key tuples and return count ascending range boundaries."""
+    size = len(columns[0])
+    picks = random.sample(range(size), min(size, (count + 1) * SPLITTER_OVERSAMPLING))
+    positions = [-i for i in picks] if reverse else picks
+    sample = sorted(_sort_keys([[column[i] for i in picks] for column in columns], positions))
+    step = len(sample) / (count + 1)
+    return [sample[int(step * i)] for i in range(1, count + 1)]
+
+
+def sort_dict_list_multiple_keys_parallel(data_list, sort_keys, reverse=False,
+                                          workers=None, executor=None):
+    """
+    Parallel version of sort_dict_list_multiple_keys (a sample sort).
+
+    Steps:
+        1. Extract each key column with x.get(key) (C-level map, one per key).
+        2. Sample the key tuples and pick one key range per worker.
+        3. Ship each chunk's key columns as marshal buffers - the
+           dictionaries never leave the parent process. Workers sort their
+           chunk and cut it into one sorted run per key range.
+        4. One worker per key range heapq.merges the chunks' runs for it
+           and returns packed row indices.
+        5. The parent concatenates the ranges and gathers the rows; it does
+           no per-row comparisons of its own.
+
+    Each key tuple carries the row index as a final tiebreak, so ties stay
+    in input order and the result is identical to the serial sort.
+
+    Args:
+        data_list (list): List of dictionaries to sort
+        sort_keys (list): List of keys to sort by (in priority order)
+        reverse (bool): If True, sort in descending order
+        workers (int): Number of worker processes (os.cpu_count() if None)
+        executor (ProcessPoolExecutor): Existing pool to reuse across calls
+
+    Returns:
+        list: Sorted list of dictionaries
+    """
+
+    if not data_list:
+        return []
+
+    workers = workers or os.cpu_count() or 1
+    columns = [list(map(methodcaller("get", key), data_list)) for key in sort_keys]
+
+    if workers < 2 or len(data_list) < PARALLEL_THRESHOLD:
+        keys = list(zip(*columns))
+        order = sorted(range(len(keys)), key=keys.__getitem__, reverse=reverse)
+        return list(map(data_list.__getitem__, order))
+
+    chunk_size = -(-len(data_list) // workers)
+    splitters = _pick_splitters(columns, reverse, workers - 1)
+
+    own_executor = executor is None
+    if own_executor:
+        executor = ProcessPoolExecutor(max_workers=workers)
+    try:
+        chunks = [
+            executor.submit(
+                _split_chunk,
+                start,
+                [_encode_column(column[start:start + chunk_size]) for column in columns],
+                splitters,
+                reverse,
+            )
+            for start in range(0, len(data_list), chunk_size)
+        ]
+        runs = [future.result() for future in chunks]
+        ranges = [
+            executor.submit(_merge_range, [chunk_runs[i] for chunk_runs in runs], reverse)
+            for i in range(len(splitters) + 1)
+        ]
+        if reverse:
+            ranges.reverse()
+        order = array("q")
+        for future in ranges:
+            order.frombytes(future.result())
+    finally:
+        if own_executor:
+            executor.shutdown()
+
+    return list(map(data_list.__getitem__, order))
+
+
+# ============================================================================
+# SCALING BENCHMARK
+# ============================================================================
+
+if __name__ == "__main__":
+    import sys
+    import time
+
+    from manual_implementation import sort_dict_list_multiple_keys
+
+    print("="*80)
+    print("PARALLEL MULTI-KEY SORT - SCALING BENCHMARK")
+    print("="*80)
+
+    def make_dataset(size):
+        rng = random.Random(size)
+        return [
+            {
+                "id": i,
+                "value": rng.randint(1, 100000),
+                "category": rng.choice(['A', 'B', 'C', 'D']),
+                "name": f"user_{rng.randint(1, 10**6)}",
+            }
+            for i in range(size)
+        ]
+
+    def best_of(repeats, func, *args, **kwargs):
+        timings = []
+        for _ in range(repeats):
+            start_time = time.perf_counter()
+            result = func(*args, **kwargs)
+            timings.append(time.perf_counter() - start_time)
+        return min(timings), result
+
+    def parent_work(dataset, sort_keys, workers):
+        """The steps the parent runs itself: extract, sample, encode, gather."""
+        columns = [list(map(methodcaller("get", key), dataset)) for key in sort_keys]
+        _pick_splitters(columns, False, workers - 1)
+        chunk_size = -(-len(dataset) // workers)
+        for start in range(0, len(dataset), chunk_size):
+            [_encode_column(column[start:start + chunk_size]) for column in columns]
+        return list(map(dataset.__getitem__, range(len(dataset))))
+
+    # 50M rows of dicts needs roughly 15 GB of RAM; pass smaller sizes as
+    # arguments on smaller machines, e.g. python parallel_sort.py 1000000
+    sizes = [int(arg) for arg in sys.argv[1:]] or [1_000_000, 10_000_000, 50_000_000]
+    cpu_count = os.cpu_count() or 1
+    worker_counts = sorted({1, 2, 4, 8, 16, 32, 64, cpu_count} & set(range(1, cpu_count + 1)))
+    sort_keys = ['category', 'value', 'name']
+
+    for size in sizes:
+        dataset = make_dataset(size)
+
+        start_time = time.perf_counter()
+        expected = sort_dict_list_multiple_keys(dataset, sort_keys)
+        serial_time = time.perf_counter() - start_time
+        parent_time, _ = best_of(1, parent_work, dataset, sort_keys, max(worker_counts[-1], 2))
+
+        print(f"\n{size:,} rows - serial sort_dict_list_multiple_keys: {serial_time:.2f} s")
+        print(f"  parent-only work {parent_time:.2f} s: no worker count can beat "
+              f"{serial_time / parent_time:.1f}x")
+        print(f"{'workers':>10s} {'time (s)':>10s} {'speedup':>10s}")
+        print("-" * 80)
+
+        for workers in worker_counts:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                # Warm the pool so process start-up is not part of the timing
+                list(pool.map(abs, range(workers)))
+                start_time = time.perf_counter()
+                actual = sort_dict_list_multiple_keys_parallel(
+                    dataset, sort_keys, workers=workers, executor=pool)
+                elapsed = time.perf_counter() - start_time
+
+            assert all(a is b for a, b in zip(actual, expected)), "order mismatch"
+            print(f"{workers:>10d} {elapsed:>10.2f} {serial_time / elapsed:>9.2f}x")
+
+        del dataset, expected
+
+    print("\n✓ Parallel results identical to the serial sort at every worker count")
+
+    # Crossover: the smallest list the parallel path sorts faster than the
+    # serial one, to check PARALLEL_THRESHOLD against this machine
+    print("\n" + "="*80)
+    print(f"CROSSOVER ({cpu_count} CPUs, PARALLEL_THRESHOLD = {PARALLEL_THRESHOLD:,})")
+    print("="*80)
+
+    workers = max(cpu_count, 2)
+    threshold, PARALLEL_THRESHOLD = PARALLEL_THRESHOLD, 0  # time every size in parallel
+    print(f"\n{'rows':>10s} {'serial (s)':>11s} {f'{workers} workers':>11s} {'speedup':>8s}")
+    print("-" * 80)
+    crossover = None
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        list(pool.map(abs, range(workers)))
+        for size in (25_000, 50_000, 100_000, 200_000, 400_000, 800_000):
+            dataset = make_dataset(size)
+            serial_time, expected = best_of(3, sort_dict_list_multiple_keys, dataset, sort_keys)
+            parallel_time, actual = best_of(
+                3, sort_dict_list_multiple_keys_parallel, dataset, sort_keys,
+                workers=workers, executor=pool)
+            assert all(a is b for a, b in zip(actual, expected)), "order mismatch"
+            if crossover is None and parallel_time < serial_time:
+                crossover = size
+            print(f"{size:>10,d} {serial_time:>11.3f} {parallel_time:>11.3f} "
+                  f"{serial_time / parallel_time:>7.2f}x")
+    PARALLEL_THRESHOLD = threshold
+
+    if crossover is None:
+        print(f"\n⚠️  No crossover up to 800,000 rows with {workers} workers on {cpu_count} CPUs")
+    else:
+        print(f"\n✓ Parallel wins from {crossover:,} rows (PARALLEL_THRESHOLD: {threshold:,})")
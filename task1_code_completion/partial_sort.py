@@ -0,0 +1,294 @@
+"""
+Task 1: AI-Powered Code Completion - Top-k / Partial Sort
+Objective: Return the first k rows of a sort without sorting (or even
+materialising) the whole input
+Author: [Kipruto Andrew Kipngetich]
+Date: October 2026
+"""
+
+import heapq
+from operator import itemgetter
+
+from columnar_sort import (
+    COLUMNAR_THRESHOLD,
+    extract_key_column,
+    gather_rows,
+    np,
+    parse_sort_keys,
+    stable_argsort,
+    to_typed_array,
+)
+from manual_implementation import sort_dict_list_multiple_keys
+
+
+def _validated_rows(data, sort_key):
+    """
+    Lazily apply sort_dict_list_manual's validation to an iterable.
+
+    Raises:
+        TypeError: If any item is not a dictionary
+        KeyError: If sort_key is missing from any dictionary
+    """
+    for item in data:
+        if not isinstance(item, dict):
+            raise TypeError("All items in data_list must be dictionaries")
+        if sort_key not in item:
+            raise KeyError(f"Key '{sort_key}' not found in all dictionaries")
+        yield item
+
+
+def _select_k_columnar(data_list, keys, k, largest):
+    """
+    Select k rows with np.partition instead of a heap.
+
+    The k-th key is found in O(n); every row strictly before it plus the
+    earliest rows tied with it are kept, so ties resolve exactly as in a full
+    stable sort. Only the k survivors are then sorted.
+
+    Args:
+        data_list (list): Rows the keys were extracted from
+        keys (list): Key values in row order
+        k (int): Number of rows to return (0 < k < len(keys))
+        largest (bool): If True, select the k largest keys
+
+    Returns:
+        list or None: Selected rows in sorted order, or None if the key
+        column cannot be represented as a typed array
+    """
+
+    column = to_typed_array(keys, numeric_only=True)
+    if column is None:
+        return None
+
+    if largest:
+        kth = np.partition(column, len(column) - k)[len(column) - k]
+        ahead = np.flatnonzero(column > kth)
+    else:
+        kth = np.partition(column, k - 1)[k - 1]
+        ahead = np.flatnonzero(column < kth)
+
+    tied = np.flatnonzero(column == kth)[:k - len(ahead)]
+    selected = np.sort(np.concatenate([ahead, tied]))
+    order = selected[stable_argsort(column[selected], reverse=largest)]
+
+    return gather_rows(data_list, order)
+
+
+def _is_large_list(data):
+    """True if data is a list big enough for the columnar selection path."""
+    return isinstance(data, list) and len(data) >= COLUMNAR_THRESHOLD
+
+
+def _select_k(data, k, key, largest, keys=None):
+    """Shared top-k / bottom-k driver for lists and iterators."""
+
+    if k <= 0:
+        return []
+
+    if keys is not None and np is not None and k < len(keys):
+        selected = _select_k_columnar(data, keys, k, largest)
+        if selected is not None:
+            return selected
+
+    # heapq.nsmallest / nlargest are documented as equivalent to
+    # sorted(iterable, key=key)[:k] (reverse=True for nlargest), ties included
+    if largest:
+        return heapq.nlargest(k, data, key=key)
+    return heapq.nsmallest(k, data, key=key)
+
+
+def bottom_k_dict_list_manual(data, sort_key, k):
+    """
+    First k rows of sort_dict_list_manual(data, sort_key).
+
+    Args:
+        data (iterable): List or iterator of dictionaries
+        sort_key (str): Key to sort by
+        k (int): Number of rows to return
+
+    Returns:
+        list: Up to k dictionaries with the smallest keys, ascending
+
+    Time Complexity: O(n log k) - heap selection (O(n) partition for large
+    numeric lists)
+    Space Complexity: O(k) for iterators
+    """
+
+    if isinstance(data, list):
+        if not data:
+            return []
+        keys = extract_key_column(data, sort_key)
+        return _select_k(data, k, itemgetter(sort_key), False, keys)
+
+    return _select_k(_validated_rows(data, sort_key), k, itemgetter(sort_key), False)
+
+
+def top_k_dict_list_manual(data, sort_key, k):
+    """
+    First k rows of sort_dict_list_manual(data, sort_key, reverse=True).
+
+    Args:
+        data (iterable): List or iterator of dictionaries
+        sort_key (str): Key to sort by
+        k (int): Number of rows to return
+
+    Returns:
+        list: Up to k dictionaries with the largest keys, descending
+    """
+
+    if isinstance(data, list):
+        if not data:
+            return []
+        keys = extract_key_column(data, sort_key)
+        return _select_k(data, k, itemgetter(sort_key), True, keys)
+
+    return _select_k(_validated_rows(data, sort_key), k, itemgetter(sort_key), True)
+
+
+def bottom_k_dict_list_with_default(data, sort_key, k, default_value=None):
+    """
+    First k rows of sort_dict_list_with_default(data, sort_key, default_value=...).
+
+    Args:
+        data (iterable): List or iterator of dictionaries
+        sort_key (str): Key to sort by
+        k (int): Number of rows to return
+        default_value: Default value for missing keys
+
+    Returns:
+        list: Up to k dictionaries with the smallest keys, ascending
+    """
+
+    key = lambda x: x.get(sort_key, default_value)
+    keys = list(map(key, data)) if _is_large_list(data) else None
+    return _select_k(data, k, key, False, keys)
+
+
+def top_k_dict_list_with_default(data, sort_key, k, default_value=None):
+    """
+    First k rows of sort_dict_list_with_default(data, sort_key, reverse=True, ...).
+
+    Args:
+        data (iterable): List or iterator of dictionaries
+        sort_key (str): Key to sort by
+        k (int): Number of rows to return
+        default_value: Default value for missing keys
+
+    Returns:
+        list: Up to k dictionaries with the largest keys, descending
+    """
+
+    key = lambda x: x.get(sort_key, default_value)
+    keys = list(map(key, data)) if _is_large_list(data) else None
+    return _select_k(data, k, key, True, keys)
+
+
+def _select_k_multiple_keys(data, sort_keys, k, largest):
+    """Top-k / bottom-k driver for (key, direction) specs."""
+
+    key_specs = parse_sort_keys(sort_keys)
+    directions = {descending for _, descending in key_specs}
+
+    if len(directions) > 1:
+        # Mixed directions have no single heap key (strings cannot be
+        # negated), so fall back to the full lexsort and slice
+        return sort_dict_list_multiple_keys(list(data), sort_keys, reverse=largest)[:k]
+
+    keys = [key for key, _ in key_specs]
+    key = lambda x: tuple(x.get(sort_key) for sort_key in keys)
+    return _select_k(data, k, key, largest != directions.pop())
+
+
+def bottom_k_dict_list_multiple_keys(data, sort_keys, k):
+    """
+    First k rows of sort_dict_list_multiple_keys(data, sort_keys).
+
+    Args:
+        data (iterable): List or iterator of dictionaries
+        sort_keys (list): Keys or (key, 'asc' | 'desc') pairs, in priority order
+        k (int): Number of rows to return
+
+    Returns:
+        list: Up to k dictionaries from the start of the sorted order
+    """
+
+    return _select_k_multiple_keys(data, sort_keys, k, False)
+
+
+def top_k_dict_list_multiple_keys(data, sort_keys, k):
+    """
+    First k rows of sort_dict_list_multiple_keys(data, sort_keys, reverse=True).
+
+    Args:
+        data (iterable): List or iterator of dictionaries
+        sort_keys (list): Keys or (key, 'asc' | 'desc') pairs, in priority order
+        k (int): Number of rows to return
+
+    Returns:
+        list: Up to k dictionaries from the start of the reversed order
+    """
+
+    return _select_k_multiple_keys(data, sort_keys, k, True)
+
+
+# ============================================================================
+# DEMONSTRATION AND BENCHMARK
+# ============================================================================
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    from manual_implementation import sort_dict_list_manual, sort_dict_list_with_default
+
+    print("="*80)
+    print("TOP-K / PARTIAL SORT")
+    print("="*80)
+
+    dataset = [
+        {
+            "id": i,
+            "value": random.randint(1, 10000),
+            "category": random.choice(['A', 'B', 'C', 'D'])
+        }
+        for i in range(1_000_000)
+    ]
+    sparse = [dict(row) for row in dataset[:200_000]]
+    for row in sparse[::7]:
+        del row["value"]
+
+    checks = [
+        ("manual, bottom",
+         lambda: sort_dict_list_manual(dataset, 'value')[:10],
+         lambda: bottom_k_dict_list_manual(dataset, 'value', 10)),
+        ("manual, top",
+         lambda: sort_dict_list_manual(dataset, 'value', reverse=True)[:10],
+         lambda: top_k_dict_list_manual(dataset, 'value', 10)),
+        ("manual, top (iterator)",
+         lambda: sort_dict_list_manual(dataset, 'value', reverse=True)[:10],
+         lambda: top_k_dict_list_manual(iter(dataset), 'value', 10)),
+        ("default, top",
+         lambda: sort_dict_list_with_default(sparse, 'value', reverse=True, default_value=0)[:100],
+         lambda: top_k_dict_list_with_default(sparse, 'value', 100, default_value=0)),
+        ("multi-key, bottom",
+         lambda: sort_dict_list_multiple_keys(dataset, ['category', 'value'])[:100],
+         lambda: bottom_k_dict_list_multiple_keys(dataset, ['category', 'value'], 100)),
+    ]
+
+    print(f"\n{'case':28s} {'sort+slice (ms)':>16s} {'top-k (ms)':>12s} {'speedup':>8s}")
+    print("-" * 80)
+
+    for name, full_sort, partial in checks:
+        start_time = time.perf_counter()
+        expected = full_sort()
+        full_ms = (time.perf_counter() - start_time) * 1000
+
+        start_time = time.perf_counter()
+        actual = partial()
+        partial_ms = (time.perf_counter() - start_time) * 1000
+
+        assert len(actual) == len(expected)
+        assert all(a is b for a, b in zip(actual, expected)), f"{name}: order mismatch"
+        print(f"{name:28s} {full_ms:>16.1f} {partial_ms:>12.1f} {full_ms / partial_ms:>7.2f}x")
+
+    print("\n✓ Every top-k result matches full-sort-then-slice, ties included")
@@ -0,0 +1,379 @@
+"""
+Task 1: AI-Powered Code Completion - Columnar Record Table
+Objective: Store homogeneous rows column-wise in compact typed buffers and
+sort them without materialising one dictionary per row
+Author: [Kipruto Andrew Kipngetich]
+Date: October 2026
+"""
+
+import sys
+from array import array
+from collections.abc import Mapping
+from operator import itemgetter
+
+from columnar_sort import (
+    mirror_numeric_column,
+    narrow_int_column,
+    np,
+    parse_sort_keys,
+    stable_argsort,
+)
+
+# array typecodes per column kind ("category" columns store codes)
+_TYPECODES = {"int": "q", "float": "d", "bool": "B"}
+
+
+def _column_kind(value):
+    """Storage kind for a column, inferred from its first value."""
+    if isinstance(value, bool):
+        return "bool"
+    if isinstance(value, int):
+        return "int"
+    if isinstance(value, float):
+        return "float"
+    if isinstance(value, str):
+        return "category"
+    return "object"
+
+
+def _code_typecode(category_count):
+    """Smallest unsigned array typecode that can index category_count values."""
+    if category_count <= 2 ** 8:
+        return "B"
+    if category_count <= 2 ** 16:
+        return "H"
+    return "I"
+
+
+class RecordView(Mapping):
+    """
+    Read-only dictionary-like view of one RecordTable row.
+
+    Supports row['key'], row.get('key', default), iteration over field names
+    and len(), so code written against dictionaries can read it unchanged.
+    """
+
+    __slots__ = ("_table", "_index")
+
+    def __init__(self, table, index):
+        self._table = table
+        self._index = index
+
+    def __getitem__(self, key):
+        return self._table.value(key, self._index)
+
+    def __iter__(self):
+        return iter(self._table.columns)
+
+    def __len__(self):
+        return len(self._table.columns)
+
+    def to_dict(self):
+        """Materialise this row as a plain dictionary."""
+        return {name: self[name] for name in self._table.columns}
+
+    def __repr__(self):
+        return f"RecordView({self.to_dict()!r})"
+
+
+class RecordTable:
+    """
+    Column-wise container for rows that all share the same fields.
+
+    Column storage:
+        int      -> array('q')  (8 bytes per row)
+        float    -> array('d')  (8 bytes per row)
+        bool     -> array('B')  (1 byte per row)
+        str      -> interned category list + array of 1/2/4-byte codes
+        other    -> plain list
+
+    All sort_dict_list_* functions in manual_implementation.py accept a
+    RecordTable and return a permuted RecordTable (see sort_by).
+    """
+
+    def __init__(self, data, kinds, categories):
+        """
+        Low-level constructor; use from_records() or from_columns().
+
+        Args:
+            data (dict): Column name -> array (or list for "object" columns)
+            kinds (dict): Column name -> storage kind
+            categories (dict): Column name -> list of strings, for categories
+        """
+        self._data = data
+        self._kinds = kinds
+        self._categories = categories
+        self._len = len(next(iter(data.values()))) if data else 0
+
+    @classmethod
+    def from_columns(cls, columns):
+        """
+        Build a table from equal-length value lists, one per field.
+
+        Args:
+            columns (dict): Field name -> list of values (one type per field)
+
+        Returns:
+            RecordTable
+
+        Raises:
+            ValueError: If the columns differ in length
+            TypeError: If a column mixes value types
+        """
+
+        lengths = {len(values) for values in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError("All columns must have the same length")
+
+        data, kinds, categories = {}, {}, {}
+        for name, values in columns.items():
+            kind = _column_kind(values[0]) if values else "object"
+            if kind != "object" and any(_column_kind(v) != kind for v in values):
+                raise TypeError(f"Column '{name}' mixes value types")
+            kinds[name] = kind
+
+            if kind == "category":
+                lookup = {}
+                codes = [lookup.setdefault(value, len(lookup)) for value in values]
+                categories[name] = [sys.intern(value) for value in lookup]
+                data[name] = array(_code_typecode(len(lookup)), codes)
+            elif kind == "object":
+                data[name] = list(values)
+            else:
+                data[name] = array(_TYPECODES[kind], values)
+
+        return cls(data, kinds, categories)
+
+    @classmethod
+    def from_records(cls, records):
+        """
+        Build a table from dictionaries that all have the same keys.
+
+        Args:
+            records (iterable): Dictionaries with identical key sets
+
+        Returns:
+            RecordTable
+
+        Raises:
+            KeyError: If a record is missing one of the first record's keys
+        """
+
+        records = list(records)
+        if not records:
+            return cls({}, {}, {})
+        names = list(records[0])
+        try:
+            columns = {name: list(map(itemgetter(name), records)) for name in names}
+        except KeyError as error:
+            raise KeyError(f"Key {error} not found in all dictionaries") from None
+        return cls.from_columns(columns)
+
+    @property
+    def columns(self):
+        """Field names, in insertion order."""
+        return list(self._data)
+
+    @property
+    def nbytes(self):
+        """Approximate bytes held by the column buffers and category lists."""
+        total = 0
+        for name, values in self._data.items():
+            if isinstance(values, array):
+                total += values.itemsize * len(values)
+            else:
+                total += sys.getsizeof(values) + sum(map(sys.getsizeof, values))
+        for names in self._categories.values():
+            total += sys.getsizeof(names) + sum(map(sys.getsizeof, names))
+        return total
+
+    def __len__(self):
+        return self._len
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("RecordTable index out of range")
+        return RecordView(self, index)
+
+    def __iter__(self):
+        return (RecordView(self, i) for i in range(self._len))
+
+    def value(self, name, index):
+        """Return one field of one row, decoded to its Python value."""
+        kind = self._kinds[name]
+        raw = self._data[name][index]
+        if kind == "category":
+            return self._categories[name][raw]
+        if kind == "bool":
+            return bool(raw)
+        return raw
+
+    def column(self, name):
+        """Return a field's values for every row as a Python list."""
+        kind = self._kinds[name]
+        values = self._data[name]
+        if kind == "category":
+            return list(map(self._categories[name].__getitem__, values))
+        if kind == "bool":
+            return list(map(bool, values))
+        return list(values)
+
+    def to_records(self):
+        """Materialise every row as a plain dictionary."""
+        names = self.columns
+        return [dict(zip(names, row)) for row in zip(*map(self.column, names))]
+
+    def take(self, order):
+        """
+        Return a new table with rows in the given order.
+
+        Args:
+            order: Sequence (or NumPy array) of row indices
+
+        Returns:
+            RecordTable
+        """
+
+        data = {}
+        for name, values in self._data.items():
+            if np is not None and isinstance(values, array):
+                taken = np.frombuffer(values, dtype=values.typecode)[order]
+                data[name] = array(values.typecode, taken.tobytes())
+            elif isinstance(values, array):
+                data[name] = array(values.typecode, map(values.__getitem__, order))
+            else:
+                data[name] = list(map(values.__getitem__, order))
+        return RecordTable(data, dict(self._kinds), dict(self._categories))
+
+    def _sort_column(self, name, default_value):
+        """
+        A column whose ascending order is the field's ascending order.
+
+        Category codes are replaced by the rank of their string, so sorting
+        the codes sorts the strings. A missing field sorts as default_value
+        for every row, i.e. it does not reorder anything.
+        """
+
+        if name not in self._data:
+            return [default_value] * self._len
+
+        kind = self._kinds[name]
+        values = self._data[name]
+
+        if kind == "category":
+            names = self._categories[name]
+            ranks = [0] * len(names)
+            for rank, code in enumerate(sorted(range(len(names)), key=names.__getitem__)):
+                ranks[code] = rank
+            if np is not None:
+                return np.array(ranks)[np.frombuffer(values, dtype=values.typecode)]
+            return list(map(ranks.__getitem__, values))
+
+        if kind != "object" and np is not None:
+            return np.frombuffer(values, dtype=values.typecode)
+        return list(values)
+
+    def sort_by(self, sort_keys, reverse=False, default_value=None):
+        """
+        Stable sort by one key or by several (key, direction) specs.
+
+        Args:
+            sort_keys: A field name, or a list of names / (name, 'asc' | 'desc')
+            reverse (bool): If True, flip every key's direction
+            default_value: Value used for fields the table does not have
+
+        Returns:
+            RecordTable: Rows in sorted order (no dictionaries are created)
+        """
+
+        if not isinstance(sort_keys, list):
+            sort_keys = [sort_keys]
+        key_specs = [(name, descending != reverse) for name, descending in parse_sort_keys(sort_keys)]
+
+        columns = [self._sort_column(name, default_value) for name, _ in key_specs]
+        order = None
+
+        if np is not None and all(isinstance(c, np.ndarray) for c in columns):
+            if len(columns) == 1:
+                order = stable_argsort(narrow_int_column(columns[0]), key_specs[0][1])
+            else:
+                encoded = [
+                    mirror_numeric_column(column) if descending else column
+                    for column, (_, descending) in zip(columns, key_specs)
+                ]
+                if all(column is not None for column in encoded):
+                    order = np.lexsort([narrow_int_column(c) for c in reversed(encoded)])
+
+        if order is None:
+            # Object columns: chained stable sorts, least significant key first
+            order = list(range(self._len))
+            for column, (_, descending) in reversed(list(zip(columns, key_specs))):
+                order.sort(key=column.__getitem__, reverse=descending)
+
+        return self.take(order)
+
+
+# ============================================================================
+# MEMORY AND SORT-TIME COMPARISON
+# ============================================================================
+
+if __name__ == "__main__":
+    import random
+    import time
+    import tracemalloc
+
+    from manual_implementation import sort_dict_list_manual, sort_dict_list_multiple_keys
+    # Use the class manual_implementation checks against, not __main__'s copy
+    from record_table import RecordTable
+
+    print("="*80)
+    print("RECORD TABLE VS LIST OF DICTIONARIES")
+    print("="*80)
+
+    size = 1_000_000
+    rng = random.Random(42)
+    ids = list(range(size))
+    values = [rng.randint(1, 10000) for _ in range(size)]
+    categories = [rng.choice(['A', 'B', 'C', 'D']) for _ in range(size)]
+
+    tracemalloc.start()
+    large_dataset = [
+        {"id": i, "value": v, "category": c}
+        for i, v, c in zip(ids, values, categories)
+    ]
+    dict_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    tracemalloc.start()
+    table = RecordTable.from_columns({"id": ids, "value": values, "category": categories})
+    table_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    print(f"\nRows: {size:,} (id, value, category)")
+    print(f"\n{'':24s} {'bytes/row':>10s} {'sort value (ms)':>16s} {'sort category,value (ms)':>25s}")
+    print("-" * 80)
+
+    timings = {}
+    for label, data in (("list of dicts", large_dataset), ("RecordTable", table)):
+        start_time = time.perf_counter()
+        by_value = sort_dict_list_manual(data, 'value')
+        single_ms = (time.perf_counter() - start_time) * 1000
+
+        start_time = time.perf_counter()
+        by_both = sort_dict_list_multiple_keys(data, ['category', ('value', 'desc')])
+        multi_ms = (time.perf_counter() - start_time) * 1000
+
+        timings[label] = (single_ms, multi_ms, by_value, by_both)
+
+    for label, total_bytes in (("list of dicts", dict_bytes), ("RecordTable", table_bytes)):
+        single_ms, multi_ms, _, _ = timings[label]
+        print(f"{label:24s} {total_bytes / size:>10.1f} {single_ms:>16.1f} {multi_ms:>25.1f}")
+
+    _, _, dict_sorted, dict_multi = timings["list of dicts"]
+    _, _, table_sorted, table_multi = timings["RecordTable"]
+    assert table_sorted.column('id') == [row['id'] for row in dict_sorted]
+    assert table_multi.column('id') == [row['id'] for row in dict_multi]
+    print("\n✓ RecordTable sorts return the same row order as the dictionary path")
+    print(f"  First row: {table_sorted[0].to_dict()}")
@@ -0,0 +1,226 @@
+"""
+Task 1: AI-Powered Code Completion - Sort Result Cache
+Objective: Serve repeated identical sort requests from a cached permutation
+instead of re-sorting unchanged data
+Author: [Kipruto Andrew Kipngetich]
+Date: October 2026
+"""
+
+from collections import OrderedDict
+from functools import wraps
+from operator import methodcaller
+
+_MISSING = object()
+
+
+def _key_names(sort_key):
+    """Return the dictionary keys a sort_key argument reads."""
+    if isinstance(sort_key, (list, tuple)):
+        return [spec[0] if isinstance(spec, tuple) else spec for spec in sort_key]
+    return [sort_key]
+
+
+def _freeze(value):
+    """Make list arguments (e.g. sort_keys) usable in a cache key."""
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _copy_result(result):
+    """
+    Copy the row list of a sort result, so neither the caller nor the cache
+    sees the other's edits. A (rows, strategy) tuple (return_strategy=True)
+    stays a tuple.
+    """
+    if isinstance(result, tuple):
+        return (list(result[0]), *result[1:])
+    return list(result)
+
+
+def content_fingerprint(data_list, sort_key):
+    """
+    Cheap O(n) fingerprint of everything a sort result depends on.
+
+    Combines the identity of every row (catches inserts, deletes, reorders
+    and replaced rows) with the value of every key the sort reads (catches
+    rows edited in place). Both passes run at C speed.
+
+    Args:
+        data_list (list): Rows about to be sorted
+        sort_key: Key or list of keys the sort uses
+
+    Returns:
+        int or None: Fingerprint, or None if a key value is unhashable
+    """
+
+    parts = [len(data_list), tuple(map(id, data_list))]
+    for key in _key_names(sort_key):
+        parts.append(tuple(map(methodcaller("get", key, _MISSING), data_list)))
+    try:
+        return hash(tuple(parts))
+    except TypeError:
+        return None
+
+
+class SortCache:
+    """
+    LRU cache of sort results.
+
+    Entries are keyed by the sort function, the list's identity, a version
+    or content fingerprint, the sort key(s) and the remaining arguments
+    (direction, default value). Each entry holds the permuted row references
+    (8 bytes per row, the same as an index array, but with no index lookups
+    to apply it). A hit costs one O(n) fingerprint plus an O(n) list copy -
+    or just the copy when the caller supplies an explicit version.
+
+    Cached entries keep their rows, and the list they were sorted from,
+    alive until evicted. A hit also requires that very list: once it is
+    freed, a new list can reuse its id.
+
+    Example:
+        cache = SortCache(maxsize=64)
+        cached_sort = cache.wrap(sort_dict_list_ai_v4)
+        top = cached_sort(products, 'price', reverse=True)
+    """
+
+    def __init__(self, maxsize=128):
+        """
+        Args:
+            maxsize (int): Maximum number of cached results
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self):
+        """Return the hit/miss/eviction counters and current size."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+        }
+
+    def clear(self):
+        """Drop every cached result (counters are kept)."""
+        self._entries.clear()
+
+    def sort(self, func, data_list, sort_key, *args, version=None, **kwargs):
+        """
+        Call func(data_list, sort_key, *args, **kwargs) through the cache.
+
+        Args:
+            func: Any sort_dict_list_* style function returning the input rows
+                in a new order
+            data_list (list): List of dictionaries to sort
+            sort_key: Key (or keys) to sort by
+            version: Optional caller-maintained version of data_list; when
+                given it replaces the content fingerprint, so a hit is O(1)
+                apart from the gather. Callers must change it on every edit.
+
+        Returns:
+            list: Sorted list of dictionaries (whatever func returns, e.g. a
+            (rows, strategy) tuple with return_strategy=True)
+        """
+
+        fingerprint = version if version is not None else content_fingerprint(data_list, sort_key)
+        try:
+            cache_key = (
+                getattr(func, "__qualname__", repr(func)),
+                id(data_list),
+                version is not None,
+                fingerprint,
+                _freeze(sort_key),
+                _freeze(args),
+                tuple(sorted(kwargs.items())),
+            )
+            hash(cache_key)
+        except TypeError:
+            cache_key = None
+
+        if fingerprint is None or cache_key is None:
+            # Unhashable keys or arguments: nothing safe to cache
+            self.misses += 1
+            return func(data_list, sort_key, *args, **kwargs)
+
+        entry = self._entries.get(cache_key)
+        if entry is not None and entry[0] is data_list:
+            self._entries.move_to_end(cache_key)
+            self.hits += 1
+            return _copy_result(entry[1])
+
+        self.misses += 1
+        result = func(data_list, sort_key, *args, **kwargs)
+
+        # Store a copy: callers (and in-place sorts such as ai_v5) may
+        # mutate the returned list
+        self._entries[cache_key] = (data_list, _copy_result(result))
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+        return result
+
+    def wrap(self, func):
+        """Return a drop-in version of func that goes through this cache."""
+
+        @wraps(func)
+        def cached_sort(data_list, sort_key, *args, version=None, **kwargs):
+            return self.sort(func, data_list, sort_key, *args, version=version, **kwargs)
+
+        cached_sort.cache = self
+        return cached_sort
+
+
+# ============================================================================
+# DEMONSTRATION
+# ============================================================================
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    from ai_suggested_implementation import sort_dict_list_ai_v4
+    from manual_implementation import sort_dict_list_manual
+
+    print("="*80)
+    print("SORT RESULT CACHE")
+    print("="*80)
+
+    dashboard = [
+        {"id": i, "value": random.randint(1, 100000), "category": random.choice(['A', 'B', 'C'])}
+        for i in range(500_000)
+    ]
+
+    cache = SortCache(maxsize=8)
+    cached_manual = cache.wrap(sort_dict_list_manual)
+    cached_v4 = cache.wrap(sort_dict_list_ai_v4)
+
+    def timed(label, func, *args, **kwargs):
+        start_time = time.perf_counter()
+        result = func(*args, **kwargs)
+        print(f"  {label:45s} {(time.perf_counter() - start_time) * 1000:8.1f} ms")
+        return result
+
+    print(f"\nDataset size: {len(dashboard):,} rows\n")
+    first = timed("sort_dict_list_manual (miss)", cached_manual, dashboard, 'value')
+    again = timed("sort_dict_list_manual (hit, fingerprint)", cached_manual, dashboard, 'value')
+    timed("sort_dict_list_manual (miss, version=1)", cached_manual, dashboard, 'value', version=1)
+    timed("sort_dict_list_manual (hit, version=1)", cached_manual, dashboard, 'value', version=1)
+    timed("sort_dict_list_ai_v4 reverse=True (miss)", cached_v4, dashboard, 'value', reverse=True)
+    assert all(a is b for a, b in zip(first, again))
+
+    dashboard[42]["value"] = 0  # edited in place
+    edited = timed("after an in-place edit (miss)", cached_manual, dashboard, 'value')
+    assert edited[0] is dashboard[42]
+
+    print(f"\n📊 Cache stats: {cache.stats()}")
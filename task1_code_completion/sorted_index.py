@@ -0,0 +1,274 @@
+"""
+Task 1: AI-Powered Code Completion - Sorted Dictionary Index
+Objective: Keep a list of dictionaries sorted under small batches of updates
+instead of re-sorting it from scratch after every change
+Author: [Kipruto Andrew Kipngetich]
+Date: October 2026
+"""
+
+from bisect import bisect_left, bisect_right
+from itertools import accumulate, chain
+
+from manual_implementation import sort_dict_list_with_default
+
+
+class SortedDictIndex:
+    """
+    Sorted index over dictionaries using a blocked sorted-list layout.
+
+    Rows live in blocks of roughly `load` entries, each a plain Python list
+    with a parallel list of keys. A list of block maxima is bisected to find
+    the block, then the block itself is bisected, so lookups are O(log n) and
+    an insert or delete only shifts one block of pointers, which keeps update
+    cost and memory flat even at 10M entries.
+
+    Ordering matches sort_dict_list_with_default: a missing key sorts as
+    default_value and rows with equal keys keep insertion order (rows from
+    the initial list first, in list order).
+
+    Rows must not be mutated while indexed - remove them, change them, and
+    insert them again.
+    """
+
+    def __init__(self, data_list, sort_key, default_value=None, load=1000):
+        """
+        Build the index once from an existing list.
+
+        Args:
+            data_list (list): Dictionaries to index
+            sort_key (str or tuple): Key, or tuple of keys in priority order
+            default_value: Default value for missing keys
+            load (int): Target block size
+        """
+
+        if load < 4:
+            raise ValueError("load must be at least 4")
+
+        self.sort_key = sort_key
+        self.default_value = default_value
+        self._load = load
+
+        if isinstance(sort_key, tuple):
+            rows = sorted(data_list, key=self.key_of)
+        else:
+            rows = sort_dict_list_with_default(data_list, sort_key, default_value=default_value)
+
+        keys = list(map(self.key_of, rows))
+        self._rows = [rows[i:i + load] for i in range(0, len(rows), load)]
+        self._keys = [keys[i:i + load] for i in range(0, len(keys), load)]
+        self._maxes = [block[-1] for block in self._keys]
+        self._len = len(rows)
+        self._offsets = None
+
+    def key_of(self, record):
+        """Return the sort key of a record."""
+        if isinstance(self.sort_key, tuple):
+            return tuple(record.get(key, self.default_value) for key in self.sort_key)
+        return record.get(self.sort_key, self.default_value)
+
+    def __len__(self):
+        return self._len
+
+    def __iter__(self):
+        """Iterate over the rows in sorted order."""
+        return chain.from_iterable(self._rows)
+
+    def _block_offsets(self):
+        """Cumulative row counts before each block, rebuilt lazily after updates."""
+        if self._offsets is None:
+            self._offsets = [0, *accumulate(map(len, self._keys))]
+        return self._offsets
+
+    def insert(self, record):
+        """
+        Insert a row after any rows with an equal key.
+
+        Time Complexity: O(log n + load)
+        """
+
+        key = self.key_of(record)
+        self._len += 1
+        self._offsets = None
+
+        if not self._maxes:
+            self._keys.append([key])
+            self._rows.append([record])
+            self._maxes.append(key)
+            return
+
+        pos = bisect_right(self._maxes, key)
+        if pos == len(self._maxes):
+            pos -= 1
+            self._keys[pos].append(key)
+            self._rows[pos].append(record)
+            self._maxes[pos] = key
+        else:
+            idx = bisect_right(self._keys[pos], key)
+            self._keys[pos].insert(idx, key)
+            self._rows[pos].insert(idx, record)
+
+        if len(self._keys[pos]) > 2 * self._load:
+            self._split(pos)
+
+    def remove(self, record):
+        """
+        Remove a row (matched by identity, like the rows the index returns).
+
+        Time Complexity: O(log n + load + rows sharing its key)
+
+        Raises:
+            ValueError: If the row is not in the index
+        """
+
+        key = self.key_of(record)
+        pos = bisect_left(self._maxes, key)
+
+        while pos < len(self._maxes):
+            keys, rows = self._keys[pos], self._rows[pos]
+            idx = bisect_left(keys, key)
+            while idx < len(keys) and keys[idx] == key:
+                if rows[idx] is record:
+                    del keys[idx], rows[idx]
+                    self._len -= 1
+                    self._offsets = None
+                    self._rebalance(pos)
+                    return
+                idx += 1
+            if idx < len(keys):
+                break
+            pos += 1
+
+        raise ValueError("record is not in the index")
+
+    def _split(self, pos):
+        """Split an oversized block in two."""
+        keys, rows = self._keys[pos], self._rows[pos]
+        half = len(keys) // 2
+        self._keys[pos:pos + 1] = [keys[:half], keys[half:]]
+        self._rows[pos:pos + 1] = [rows[:half], rows[half:]]
+        self._maxes[pos:pos + 1] = [keys[half - 1], keys[-1]]
+
+    def _rebalance(self, pos):
+        """Drop empty blocks and merge undersized ones into their successor."""
+        keys = self._keys[pos]
+        if not keys:
+            del self._keys[pos], self._rows[pos], self._maxes[pos]
+            return
+
+        self._maxes[pos] = keys[-1]
+        if len(keys) < self._load // 2 and pos + 1 < len(self._keys):
+            self._keys[pos] += self._keys.pop(pos + 1)
+            self._rows[pos] += self._rows.pop(pos + 1)
+            del self._maxes[pos]
+            if len(self._keys[pos]) > 2 * self._load:
+                self._split(pos)
+
+    def rank(self, value):
+        """
+        Number of rows whose key is strictly less than value.
+
+        Time Complexity: O(log n) (plus a one-off O(n / load) offset rebuild
+        after updates)
+        """
+
+        pos = bisect_left(self._maxes, value)
+        if pos == len(self._maxes):
+            return self._len
+        return self._block_offsets()[pos] + bisect_left(self._keys[pos], value)
+
+    def range(self, lo=None, hi=None):
+        """
+        Yield rows with lo <= key < hi, in sorted order.
+
+        Args:
+            lo: Inclusive lower bound (None for no lower bound)
+            hi: Exclusive upper bound (None for no upper bound)
+
+        Yields:
+            dict: Matching rows
+        """
+
+        pos = 0 if lo is None else bisect_left(self._maxes, lo)
+        idx = 0 if lo is None or pos == len(self._maxes) else bisect_left(self._keys[pos], lo)
+
+        while pos < len(self._keys):
+            keys, rows = self._keys[pos], self._rows[pos]
+            end = len(keys) if hi is None else bisect_left(keys, hi, idx)
+            yield from rows[idx:end]
+            if end < len(keys):
+                return
+            pos += 1
+            idx = 0
+
+    def __getitem__(self, index):
+        """Return the row at a sorted position (negative indices allowed)."""
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("SortedDictIndex index out of range")
+        offsets = self._block_offsets()
+        pos = bisect_right(offsets, index) - 1
+        return self._rows[pos][index - offsets[pos]]
+
+
+# ============================================================================
+# DEMONSTRATION AND BENCHMARK
+# ============================================================================
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    from manual_implementation import sort_dict_list_manual
+
+    print("="*80)
+    print("SORTED DICTIONARY INDEX")
+    print("="*80)
+
+    employees = [
+        {"name": "Alice", "age": 30, "salary": 75000},
+        {"name": "Charlie", "age": 25, "salary": 60000},
+        {"name": "Bob", "age": 35, "salary": 85000},
+        {"name": "Diana", "age": 28, "salary": 70000}
+    ]
+
+    index = SortedDictIndex(employees, 'salary')
+    index.insert({"name": "Eve", "age": 32, "salary": 72000})
+    index.remove(employees[0])
+
+    print("\n[Demo] Salary index after inserting Eve and removing Alice:")
+    for emp in index:
+        print(f"  {emp['name']}: ${emp['salary']:,}")
+    print(f"  Earning 70,000-80,000: {[e['name'] for e in index.range(70000, 80000)]}")
+    print(f"  Employees earning below 72,000: {index.rank(72000)}")
+
+    print("\n[Benchmark] 20 batches of 100 inserts on 1,000,000 rows:")
+    print("-" * 80)
+
+    rows = [{"id": i, "value": random.randint(1, 100000)} for i in range(1_000_000)]
+    batches = [
+        [{"id": -1, "value": random.randint(1, 100000)} for _ in range(100)]
+        for _ in range(20)
+    ]
+
+    start_time = time.perf_counter()
+    current = list(rows)
+    for batch in batches:
+        current.extend(batch)
+        resorted = sort_dict_list_manual(current, 'value')
+    resort_time = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    index = SortedDictIndex(rows, 'value')
+    build_time = time.perf_counter() - start_time
+    start_time = time.perf_counter()
+    for batch in batches:
+        for row in batch:
+            index.insert(row)
+    update_time = time.perf_counter() - start_time
+
+    assert all(a is b for a, b in zip(index, resorted)), "order mismatch"
+    print(f"  Re-sort after every batch: {resort_time * 1000:10.1f} ms")
+    print(f"  Index build (once):        {build_time * 1000:10.1f} ms")
+    print(f"  Index inserts (2,000):     {update_time * 1000:10.1f} ms")
+    print("\n✓ Index order identical to a full re-sort")
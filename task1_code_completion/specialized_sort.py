@@ -0,0 +1,409 @@
+"""
+Task 1: AI-Powered Code Completion - Specialized Sort Strategies
+Objective: Detect bounded-integer and low-cardinality keys and sort them with
+counting, radix or bucket sort instead of comparison sorting
+Author: [Kipruto Andrew Kipngetich]
+Date: October 2026
+"""
+
+from functools import partial
+from itertools import islice
+
+from columnar_sort import (
+    CARDINALITY_SAMPLE,
+    extract_key_column,
+    gather_rows,
+    narrow_int_column,
+    np,
+    stable_argsort,
+)
+
+
+# Below this many rows detection costs more than any strategy saves (the
+# crossover benchmark below puts every strategy ahead of sorted() over the
+# extracted keys from ~4,000 rows on lists of dictionaries)
+SPECIALIZED_MIN_ROWS = 4096
+
+# Widest integer key range sorted with one counting pass (2**16 buckets)
+COUNTING_MAX_SPAN = 2 ** 16
+
+# Widest integer key range sorted with LSD radix (16-bit digits, NumPy only)
+RADIX_MAX_SPAN = 2 ** 32
+
+# Most distinct values a key may have for bucket sort
+BUCKET_MAX_DISTINCT = 1024
+
+# Bucket sort on dictionaries only pays when buckets average this many rows
+BUCKET_MIN_ROWS_PER_KEY = 16
+
+STRATEGIES = ("counting", "radix", "bucket", "timsort")
+
+_REQUIRED = object()
+
+
+def integer_key_array(keys):
+    """
+    Return keys as an int64 NumPy array if every key is an int (or bool).
+
+    One conversion both checks the types and gives detection and the
+    counting / radix sorts a column to work on; anything else (floats,
+    strings, mixed types, ints beyond int64) returns None.
+    """
+
+    if np is None or not keys or type(keys[0]) not in (int, bool):
+        return None
+    column = np.array(keys)
+    if column.dtype.kind not in "bi":
+        return None
+    return column.astype(np.int64, copy=False)
+
+
+def detect_sort_strategy(keys, min_rows=SPECIALIZED_MIN_ROWS):
+    """
+    Pick the cheapest stable sort for a key column.
+
+        bucket   - str or int keys with at most BUCKET_MAX_DISTINCT values
+                   and BUCKET_MIN_ROWS_PER_KEY rows per value on average
+        counting - ints spanning fewer than COUNTING_MAX_SPAN values
+                   (without NumPy, only while the span is at most len(keys))
+        radix    - ints spanning fewer than RADIX_MAX_SPAN values (NumPy)
+        timsort  - everything else, and any column shorter than min_rows
+
+    Args:
+        keys (list): Key values in row order
+        min_rows (int): Shortest column worth a specialised strategy
+
+    Returns:
+        str: One of STRATEGIES
+    """
+
+    return _detect_sort_strategy(keys, min_rows)[0]
+
+
+def _detect_sort_strategy(keys, min_rows):
+    """detect_sort_strategy, plus the integer_key_array column (or None)."""
+
+    # Only int, bool and str columns have a faster strategy; checking the
+    # first key lets float and object columns skip detection entirely
+    first_type = type(keys[0]) if len(keys) >= max(min_rows, 1) else None
+    if first_type not in (bool, int, str):
+        return "timsort", None
+
+    column = integer_key_array(keys)
+    key_types = {str} if first_type is str else {bool, int}
+
+    # Few values with many rows each: one bucket pass beats the counting
+    # sort's row gather. Check a sample first so high-cardinality columns
+    # bail out cheaply
+    distinct_limit = min(BUCKET_MAX_DISTINCT, len(keys) // BUCKET_MIN_ROWS_PER_KEY)
+    try:
+        few_values = len(set(islice(keys, CARDINALITY_SAMPLE))) <= distinct_limit
+    except TypeError:  # unhashable keys
+        return "timsort", None
+    if few_values and (column is not None or set(map(type, keys)) <= key_types):
+        if len(set(keys)) <= distinct_limit:
+            return "bucket", column
+
+    if column is not None:
+        span = int(column.max()) - int(column.min())
+        if span < COUNTING_MAX_SPAN:
+            return "counting", column
+        if span < RADIX_MAX_SPAN:
+            return "radix", column
+    elif np is None and first_type is not str and set(map(type, keys)) <= key_types:
+        span = max(keys) - min(keys)
+        if span < COUNTING_MAX_SPAN and span <= len(keys):
+            return "counting", None
+
+    return "timsort", column
+
+
+def counting_sort_rows(data_list, keys, reverse=False):
+    """
+    Stable counting sort for integer keys with a small range.
+
+    With NumPy the column is narrowed to uint8/uint16, for which NumPy's
+    stable sort is a counting (radix) sort. Without NumPy each row is
+    appended to the bucket for its key and the buckets are concatenated.
+
+    Time Complexity: O(n + span)
+    """
+
+    if np is not None:
+        column = narrow_int_column(np.asarray(keys, dtype=np.int64))
+        return gather_rows(data_list, stable_argsort(column, reverse))
+
+    low = min(keys)
+    buckets = [[] for _ in range(max(keys) - low + 1)]
+    for row, key in zip(data_list, keys):
+        buckets[key - low].append(row)
+
+    sorted_list = []
+    for bucket in (reversed(buckets) if reverse else buckets):
+        sorted_list += bucket
+    return sorted_list
+
+
+def radix_sort_rows(data_list, keys, reverse=False):
+    """
+    Stable LSD radix sort for integer keys, 16 bits per pass (NumPy).
+
+    Keys are re-based to start at zero (mirrored for descending order, so
+    equal keys still keep their input order), then sorted one 16-bit digit
+    at a time from the least significant; each pass is NumPy's uint16
+    counting sort.
+
+    Time Complexity: O(n * passes), passes = ceil(log2(span) / 16)
+    """
+
+    column = np.asarray(keys, dtype=np.int64)
+    low, high = int(column.min()), int(column.max())
+    if reverse:
+        rebased = (high - column).astype(np.uint64)
+    else:
+        rebased = (column - low).astype(np.uint64)
+
+    order = np.arange(len(column))
+    for shift in range(0, max(high - low, 1).bit_length(), 16):
+        digit = ((rebased[order] >> np.uint64(shift)) & np.uint64(0xFFFF)).astype(np.uint16)
+        order = order[np.argsort(digit, kind="stable")]
+
+    return gather_rows(data_list, order)
+
+
+def bucket_sort_rows(data_list, keys, reverse=False):
+    """
+    Stable bucket sort for keys with few distinct values.
+
+    One pass appends each row to the bucket for its key; only the distinct
+    keys are then compared and sorted.
+
+    Time Complexity: O(n + d log d) for d distinct keys
+    """
+
+    buckets = {}
+    for row, key in zip(data_list, keys):
+        bucket = buckets.get(key)
+        if bucket is None:
+            buckets[key] = [row]
+        else:
+            bucket.append(row)
+
+    sorted_list = []
+    for key in sorted(buckets, reverse=reverse):
+        sorted_list += buckets[key]
+    return sorted_list
+
+
+def bucket_sort_dict_list(data_list, sort_key, reverse=False, default_value=_REQUIRED):
+    """
+    One-pass bucket sort that reads each row's key as it goes.
+
+    The key-column strategies above pay for building a key list and for
+    gathering rows back by index, which on lists of dictionaries costs as
+    much as Timsort saves. This variant touches each row once and gives up
+    as soon as it has seen more distinct keys than can pay off, so
+    high-cardinality columns only cost a short prefix.
+
+    Args:
+        data_list (list): Dictionaries to sort
+        sort_key (str): Key to sort by
+        reverse (bool): If True, sort in descending order
+        default_value: Value for rows without sort_key; if not given, every
+            row must have the key
+
+    Returns:
+        list or None: Rows in the same stable order as sorted(), or None if
+        the keys are unhashable or too many are distinct
+
+    Raises:
+        KeyError: If default_value is not given and a row lacks sort_key
+    """
+
+    required = default_value is _REQUIRED
+    limit = min(BUCKET_MAX_DISTINCT, len(data_list) // BUCKET_MIN_ROWS_PER_KEY)
+    buckets = {}
+    try:
+        for row in data_list:
+            key = row[sort_key] if required else row.get(sort_key, default_value)
+            bucket = buckets.get(key)
+            if bucket is None:
+                if len(buckets) >= limit:
+                    return None
+                buckets[key] = [row]
+            else:
+                bucket.append(row)
+    except TypeError:  # unhashable key
+        return None
+
+    sorted_list = []
+    for key in sorted(buckets, reverse=reverse):
+        sorted_list += buckets[key]
+    return sorted_list
+
+
+def timsort_rows(data_list, keys, reverse=False):
+    """
+    General stable comparison sort (the fallback).
+
+    sorted() calls its key function once per row, in row order, so handing
+    it the precomputed keys one by one sorts the rows directly, with no
+    index list to gather back (faster than a NumPy argsort plus gather,
+    even for float columns).
+    """
+
+    return sorted(data_list, key=partial(next, iter(keys)), reverse=reverse)
+
+
+_SORTERS = {
+    "counting": counting_sort_rows,
+    "radix": radix_sort_rows,
+    "bucket": bucket_sort_rows,
+    "timsort": timsort_rows,
+}
+
+
+def sort_rows_by_keys(data_list, keys, reverse=False, strategy=None):
+    """
+    Sort rows by a precomputed key column with the detected strategy.
+
+    Every strategy returns the same stable order as
+    sorted(data_list, key=..., reverse=reverse).
+
+    Args:
+        data_list (list): Rows to sort
+        keys (list): Key value of each row, in row order
+        reverse (bool): If True, sort in descending order
+        strategy (str): Force one of STRATEGIES (it must suit the keys);
+            detected automatically if None
+
+    Returns:
+        tuple: (sorted list of rows, name of the strategy used)
+
+    Raises:
+        ValueError: If strategy is not one of STRATEGIES
+    """
+
+    column = None
+    if strategy is None:
+        strategy, column = _detect_sort_strategy(keys, SPECIALIZED_MIN_ROWS)
+    elif strategy not in _SORTERS:
+        raise ValueError(f"Unknown sort strategy '{strategy}', expected one of {STRATEGIES}")
+
+    if not data_list:
+        return [], strategy
+
+    # Counting and radix sort reuse the int64 column built for detection
+    if strategy in ("counting", "radix") and column is not None:
+        keys = column
+    return _SORTERS[strategy](data_list, keys, reverse), strategy
+
+
+def sort_dict_list_specialized(data_list, sort_key, reverse=False, strategy=None):
+    """
+    sort_dict_list_manual with strategy selection and reporting.
+
+    The key column is extracted once (which also validates every row) and
+    sorted by sort_rows_by_keys with the detected or forced strategy.
+
+    Args:
+        data_list (list): List of dictionaries to sort
+        sort_key (str): Key to sort by
+        reverse (bool): If True, sort in descending order
+        strategy (str): Force one of STRATEGIES; detected if None
+
+    Returns:
+        tuple: (sorted list of dictionaries, name of the strategy used)
+
+    Raises:
+        TypeError: If any item is not a dictionary
+        KeyError: If sort_key is missing from any dictionary
+
+    Example:
+        rows, strategy = sort_dict_list_specialized(products, 'category')
+        # strategy == 'bucket' for a handful of categories
+    """
+
+    keys = extract_key_column(data_list, sort_key)
+    return sort_rows_by_keys(data_list, keys, reverse, strategy)
+
+
+# ============================================================================
+# CROSSOVER BENCHMARK
+# ============================================================================
+
+if __name__ == "__main__":
+    import random
+    import sys
+    import time
+
+    print("="*80)
+    print("SPECIALIZED SORT STRATEGIES - CROSSOVER BENCHMARK")
+    print("="*80)
+
+    def best_of(repeats, func, *args):
+        timings = []
+        for _ in range(repeats):
+            start_time = time.perf_counter()
+            result = func(*args)
+            timings.append(time.perf_counter() - start_time)
+        return min(timings), result
+
+    categories = [f"department_{i:03d}" for i in range(256)]
+    scenarios = [
+        ("value 1-10,000", "counting", lambda rng: rng.randint(1, 10000)),
+        ("value 1-100,000", "radix", lambda rng: rng.randint(1, 100000)),
+        ("timestamp (2**31 span)", "radix", lambda rng: rng.randint(0, 2 ** 31)),
+        ("category (4 values)", "bucket", lambda rng: rng.choice(['A', 'B', 'C', 'D'])),
+        ("department (256 values)", "bucket", lambda rng: rng.choice(categories)),
+    ]
+    sizes = [int(arg) for arg in sys.argv[1:]] or [256, 1024, 4096, 16384, 65536, 262144, 1_000_000]
+
+    for label, strategy, make_key in scenarios:
+        print(f"\n[{label}] {strategy} vs timsort (best of 3, ms)")
+        print(f"{'rows':>10s} {strategy:>10s} {'timsort':>10s} {'speedup':>10s} {'detected':>10s}")
+        print("-" * 80)
+        crossover = None
+        for size in sizes:
+            rng = random.Random(size)
+            dataset = [{"id": i, "key": make_key(rng)} for i in range(size)]
+            keys = extract_key_column(dataset, "key")
+
+            special_time, actual = best_of(3, sort_rows_by_keys, dataset, keys, False, strategy)
+            timsort_time, expected = best_of(3, sort_rows_by_keys, dataset, keys, False, "timsort")
+            assert all(a is b for a, b in zip(actual[0], expected[0])), "order mismatch"
+
+            speedup = timsort_time / special_time
+            if crossover is None and speedup > 1:
+                crossover = size
+            print(f"{size:>10,d} {special_time * 1000:>10.2f} {timsort_time * 1000:>10.2f} "
+                  f"{speedup:>9.2f}x {detect_sort_strategy(keys):>10s}")
+
+        if crossover is None:
+            print(f"  ⚠️  {strategy} never beat timsort at these sizes")
+        else:
+            print(f"  ✓ {strategy} wins from {crossover:,} rows")
+
+    # End to end on dictionaries: detection and the row gather are paid
+    # too, against the Timsort pass over the same validated key column
+    print("\n[Lists of dictionaries] sort_dict_list_specialized vs forced timsort")
+    print(f"{'keys':>26s} {'rows':>10s} {'strategy':>10s} {'speedup':>10s}")
+    print("-" * 80)
+    for label, _, make_key in scenarios:
+        for size in sizes[-2:]:
+            rng = random.Random(size)
+            dataset = [{"id": i, "key": make_key(rng)} for i in range(size)]
+            special_time, (actual, used) = best_of(3, sort_dict_list_specialized, dataset, "key")
+            timsort_time, (expected, _) = best_of(
+                3, sort_dict_list_specialized, dataset, "key", False, "timsort")
+            assert all(a is b for a, b in zip(actual, expected)), "order mismatch"
+            print(f"{label:>26s} {size:>10,d} {used:>10s} {timsort_time / special_time:>9.2f}x")
+
+    # Stability: equal keys keep their input order in both directions
+    rng = random.Random(0)
+    sample = [{"id": i, "key": rng.choice(['A', 'B', 'C'])} for i in range(10_000)]
+    for reverse in (False, True):
+        rows, used = sort_dict_list_specialized(sample, "key", reverse=reverse)
+        expected = sorted(sample, key=lambda x: x["key"], reverse=reverse)
+        assert all(a is b for a, b in zip(rows, expected))
+        print(f"\n✓ reverse={reverse}: '{used}' order identical to sorted()")
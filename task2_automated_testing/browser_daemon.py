@@ -0,0 +1,321 @@
+"""
+Task 2: Automated Testing with AI - Warm Browser Daemon
+Framework: Selenium WebDriver (remote)
+Objective: Keep ChromeDriver and Chrome running between suite invocations
+so each run attaches to a warm browser instead of launching one
+Author: [Kipruto Andrew Kipngetich]
+Date: October 2026
+"""
+
+import json
+import os
+import shutil
+import signal
+import subprocess
+import tempfile
+import time
+import urllib.request
+from urllib.error import URLError
+
+from selenium import webdriver
+
+from selenium_login_test import build_chrome_options
+
+DEFAULT_STATE_FILE = os.path.join(tempfile.gettempdir(), "login_test_browser_daemon.json")
+DEFAULT_PROFILE_DIR = os.path.join(tempfile.gettempdir(), "login_test_browser_profile")
+HEALTH_CHECK_INTERVAL = 5.0
+
+
+def _http_ok(url, timeout=2.0):
+    """True if url answers 200 within timeout."""
+    try:
+        with urllib.request.urlopen(url, timeout=timeout) as response:
+            return response.status == 200
+    except (URLError, OSError):
+        return False
+
+
+def _find_binary(names):
+    for name in names:
+        path = shutil.which(name)
+        if path:
+            return path
+    return None
+
+
+def read_state(state_file=DEFAULT_STATE_FILE):
+    """Return the running daemon's state dict, or None if there is none."""
+    try:
+        with open(state_file, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def daemon_health(state):
+    """
+    Check both halves of a daemon.
+
+    Returns:
+        dict: {"driver": ChromeDriver answers /status,
+        "browser": Chrome answers on its DevTools port}
+    """
+    return {
+        "driver": _http_ok(f"{state['driver_url']}/status"),
+        "browser": _http_ok(f"http://{state['debugger_address']}/json/version"),
+    }
+
+
+def connect_to_daemon(state_file=DEFAULT_STATE_FILE):
+    """
+    Attach a Remote WebDriver session to the daemon's running Chrome.
+
+    No browser process is launched and no profile is created; ChromeDriver
+    just opens a session on the existing browser.
+
+    Returns:
+        WebDriver or None: None if no healthy daemon is running
+    """
+    state = read_state(state_file)
+    if state is None or not all(daemon_health(state).values()):
+        return None
+    options = webdriver.ChromeOptions()
+    options.debugger_address = state["debugger_address"]
+    driver = webdriver.Remote(command_executor=state["driver_url"], options=options)
+    driver.implicitly_wait(0)
+    return driver
+
+
+class BrowserDaemon:
+    """
+    Supervises one ChromeDriver server and one Chrome with remote debugging.
+
+    Chrome keeps a persistent profile directory, so the profile is created
+    once, not per run. A health check restarts whichever process stops
+    answering, and the state file tells harness runs where to attach.
+
+    Example (shell):
+        python browser_daemon.py start &
+        python selenium_login_test.py --local --daemon
+    """
+
+    def __init__(self, driver_port=9515, debug_port=9222, profile_dir=DEFAULT_PROFILE_DIR,
+                 headless=True, chromedriver=None, chrome=None, state_file=DEFAULT_STATE_FILE):
+        """
+        Args:
+            driver_port (int): Port ChromeDriver listens on
+            debug_port (int): Chrome remote debugging port
+            profile_dir (str): Persistent Chrome profile directory
+            headless (bool): Run Chrome without a window
+            chromedriver (str): ChromeDriver binary (default: from PATH)
+            chrome (str): Chrome/Chromium binary (default: from PATH)
+            state_file (str): Where the daemon advertises itself
+        """
+        self.driver_port = driver_port
+        self.debug_port = debug_port
+        self.profile_dir = profile_dir
+        self.headless = headless
+        self.chromedriver = chromedriver or _find_binary(["chromedriver"])
+        self.chrome = chrome or _find_binary(
+            ["google-chrome", "google-chrome-stable", "chromium", "chromium-browser", "chrome"])
+        self.state_file = state_file
+        self.restarts = 0
+        self._driver_process = None
+        self._browser_process = None
+
+        if not self.chromedriver or not self.chrome:
+            raise FileNotFoundError("chromedriver and Chrome/Chromium must be on PATH "
+                                    "(or passed as chromedriver= / chrome=)")
+
+    @property
+    def state(self):
+        return {
+            "pid": os.getpid(),
+            "driver_url": f"http://127.0.0.1:{self.driver_port}",
+            "debugger_address": f"127.0.0.1:{self.debug_port}",
+            "profile_dir": self.profile_dir,
+            "restarts": self.restarts,
+        }
+
+    def _wait_until(self, check, timeout=15.0):
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            if check():
+                return True
+            time.sleep(0.1)
+        return False
+
+    def _start_driver(self):
+        self._driver_process = subprocess.Popen(
+            [self.chromedriver, f"--port={self.driver_port}"],
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        if not self._wait_until(lambda: _http_ok(f"{self.state['driver_url']}/status")):
+            raise RuntimeError("ChromeDriver did not become ready")
+
+    def _start_browser(self):
+        arguments = build_chrome_options(self.headless).arguments + [
+            f"--remote-debugging-port={self.debug_port}",
+            f"--user-data-dir={self.profile_dir}",
+            "--no-first-run",
+            "--no-default-browser-check",
+            "about:blank",
+        ]
+        self._browser_process = subprocess.Popen(
+            [self.chrome, *arguments], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        debugger = f"http://{self.state['debugger_address']}/json/version"
+        if not self._wait_until(lambda: _http_ok(debugger)):
+            raise RuntimeError("Chrome did not open its debugging port")
+
+    @staticmethod
+    def _terminate(process):
+        if process is not None and process.poll() is None:
+            process.terminate()
+            try:
+                process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                process.kill()
+
+    def ensure_running(self):
+        """
+        Health-check both processes and restart whichever is down.
+
+        Returns:
+            dict: Health before any restart (see daemon_health)
+        """
+        health = daemon_health(self.state)
+        if not health["driver"]:
+            self._terminate(self._driver_process)
+            self._start_driver()
+        if not health["browser"]:
+            self._terminate(self._browser_process)
+            self._start_browser()
+        if not all(health.values()):
+            self.restarts += 1
+            self._write_state()
+        return health
+
+    def _write_state(self):
+        temp_path = self.state_file + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(self.state, f)
+        os.replace(temp_path, self.state_file)
+
+    def start(self):
+        """Launch both processes (first health check) and write the state file."""
+        os.makedirs(self.profile_dir, exist_ok=True)
+        self.ensure_running()
+        self.restarts = 0  # the first launch is not a restart
+        self._write_state()
+        return self
+
+    def serve_forever(self, interval=HEALTH_CHECK_INTERVAL):
+        """Run health checks until SIGTERM/SIGINT, then shut down."""
+        def handle_sigterm(signum, frame):
+            raise KeyboardInterrupt
+
+        signal.signal(signal.SIGTERM, handle_sigterm)
+        try:
+            while True:
+                time.sleep(interval)
+                health = self.ensure_running()
+                if not all(health.values()):
+                    print(f"♻️  Restarted {[name for name, ok in health.items() if not ok]} "
+                          f"(restarts: {self.restarts})", flush=True)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.stop()
+
+    def stop(self):
+        """Stop both processes and remove the state file."""
+        self._terminate(self._browser_process)
+        self._terminate(self._driver_process)
+        state = read_state(self.state_file)
+        if state is not None and state.get("pid") == os.getpid():
+            os.remove(self.state_file)
+
+
+def benchmark_startup(rounds=5, state_file=DEFAULT_STATE_FILE):
+    """
+    Time cold launches against warm attaches, up to a first page load.
+
+    Returns:
+        dict: {"cold": [seconds...], "warm": [seconds...]}
+    """
+    from selenium_login_test import create_chrome_driver
+
+    timings = {"cold": [], "warm": []}
+    for _ in range(rounds):
+        start_time = time.perf_counter()
+        driver = create_chrome_driver(headless=True)
+        driver.get("about:blank")
+        timings["cold"].append(time.perf_counter() - start_time)
+        driver.quit()
+
+        start_time = time.perf_counter()
+        driver = connect_to_daemon(state_file)
+        if driver is None:
+            raise RuntimeError("No healthy browser daemon; run: python browser_daemon.py start")
+        driver.get("about:blank")
+        timings["warm"].append(time.perf_counter() - start_time)
+        driver.quit()
+    return timings
+
+
+# ============================================================================
+# MAIN EXECUTION
+# ============================================================================
+
+if __name__ == "__main__":
+    import argparse
+    import statistics
+
+    parser = argparse.ArgumentParser(description="Warm browser daemon for the login tests")
+    parser.add_argument("command", choices=("start", "status", "stop", "bench"))
+    parser.add_argument("--state-file", default=DEFAULT_STATE_FILE)
+    parser.add_argument("--driver-port", type=int, default=9515)
+    parser.add_argument("--debug-port", type=int, default=9222)
+    parser.add_argument("--profile-dir", default=DEFAULT_PROFILE_DIR)
+    parser.add_argument("--headed", action="store_true", help="Show the browser window")
+    parser.add_argument("--chromedriver", help="ChromeDriver binary")
+    parser.add_argument("--chrome", help="Chrome/Chromium binary")
+    parser.add_argument("--interval", type=float, default=HEALTH_CHECK_INTERVAL,
+                        help="Seconds between health checks")
+    parser.add_argument("--rounds", type=int, default=5, help="Rounds for bench")
+    args = parser.parse_args()
+
+    if args.command == "start":
+        daemon = BrowserDaemon(args.driver_port, args.debug_port, args.profile_dir,
+                               headless=not args.headed, chromedriver=args.chromedriver,
+                               chrome=args.chrome, state_file=args.state_file)
+        start_time = time.perf_counter()
+        daemon.start()
+        print(f"✅ Browser daemon ready in {time.perf_counter() - start_time:.2f}s")
+        print(f"   WebDriver URL: {daemon.state['driver_url']}")
+        print(f"   Chrome DevTools: {daemon.state['debugger_address']}")
+        daemon.serve_forever(args.interval)
+
+    elif args.command == "status":
+        state = read_state(args.state_file)
+        if state is None:
+            print("❌ No browser daemon running")
+        else:
+            print(json.dumps({**state, "health": daemon_health(state)}, indent=2))
+
+    elif args.command == "stop":
+        state = read_state(args.state_file)
+        if state is None:
+            print("❌ No browser daemon running")
+        else:
+            os.kill(state["pid"], signal.SIGTERM)
+            print(f"✅ Sent stop to daemon (pid {state['pid']})")
+
+    else:
+        timings = benchmark_startup(args.rounds, args.state_file)
+        print(f"{'startup':>8s} {'median':>10s} {'min':>10s} {'max':>10s}")
+        print("-" * 42)
+        for label, values in timings.items():
+            print(f"{label:>8s} {statistics.median(values):>9.3f}s {min(values):>9.3f}s "
+                  f"{max(values):>9.3f}s")
+        cold, warm = (statistics.median(timings[label]) for label in ("cold", "warm"))
+        print(f"\n✓ Warm attach is {cold / warm:.1f}x faster than a cold launch")
@@ -0,0 +1,308 @@
+"""
+Task 2: Automated Testing with AI - Data-Driven Test Case Sources
+Framework: Python standard library
+Objective: Stream login test cases from CSV/JSONL files or a generator,
+split them into shards and resume interrupted runs from a checkpoint
+Author: [Kipruto Andrew Kipngetich]
+Date: October 2026
+"""
+
+import csv
+import json
+import os
+import random
+from collections import namedtuple
+
+# Same field order as the tuples in DEFAULT_TEST_CASES, so a LoginCase can
+# be passed as test_login(*case[:4]). needs_browser marks cases the HTTP
+# backend must leave to Selenium (post-login rendering, session handling)
+LoginCase = namedtuple("LoginCase", ["username", "password", "expected", "name", "needs_browser"],
+                       defaults=(False,))
+
+# Payloads for generated cases (security and robustness tests)
+INJECTION_PAYLOADS = [
+    "admin' OR '1'='1",
+    "admin'--",
+    "' OR 1=1; DROP TABLE users; --",
+    "\" OR \"\"=\"",
+    "<script>alert('XSS')</script>",
+    "<img src=x onerror=alert(1)>",
+    "javascript:alert(1)",
+    "${7*7}",
+    "{{7*7}}",
+    "*)(uid=*))(|(uid=*",
+    "; cat /etc/passwd",
+    "../../../../etc/passwd",
+]
+
+UNICODE_PAYLOADS = [
+    "st\u00fcdent",
+    "\u0455tudent",          # Cyrillic "s" homoglyph
+    "stu\u200bdent",         # zero-width space
+    "student\u202e",         # right-to-left override
+    "\u5b66\u751f",
+    "\U0001f510\U0001f464",
+    "s\u0301tudent",         # combining accent
+]
+
+WHITESPACE_VARIANTS = [" student", "student ", "Student", "STUDENT", "stu dent"]
+
+FUZZ_LENGTHS = [1, 64, 255, 256, 1024, 4096]
+
+
+def parse_shard(spec):
+    """
+    Parse a "--shard i/N" value.
+
+    Args:
+        spec (str): Shard index and count, e.g. "2/8" (index is 0-based)
+
+    Returns:
+        tuple: (shard_index, shard_count)
+
+    Raises:
+        ValueError: If spec is malformed or the index is out of range
+    """
+    try:
+        index, count = (int(part) for part in spec.split("/"))
+    except ValueError:
+        raise ValueError(f"Shard must look like i/N, got {spec!r}") from None
+    if count < 1 or not 0 <= index < count:
+        raise ValueError(f"Shard index must be in 0..N-1, got {spec!r}")
+    return index, count
+
+
+def needs_browser(case):
+    """True if a case tuple or LoginCase is marked to run in the browser."""
+    return len(case) > 4 and bool(case[4])
+
+
+def _parse_flag(value):
+    """CSV/JSON truth value: true/1/yes (any case) or a JSON true."""
+    if isinstance(value, str):
+        return value.strip().lower() in ("true", "1", "yes")
+    return bool(value)
+
+
+def _to_case(record, line_number):
+    """Build a LoginCase from a CSV row or JSON object."""
+    expected = record.get("expected") or "failure"
+    if expected not in ("success", "failure"):
+        raise ValueError(f"Case {line_number}: expected must be 'success' or 'failure'")
+    return LoginCase(
+        username=record.get("username") or "",
+        password=record.get("password") or "",
+        expected=expected,
+        name=record.get("name") or f"Case {line_number}",
+        needs_browser=_parse_flag(record.get("needs_browser")),
+    )
+
+
+def read_csv_cases(path):
+    """
+    Stream cases from a CSV file with a username,password,expected,name
+    (and optionally needs_browser) header.
+
+    Missing columns default to "" (credentials), "failure", "Case <n>"
+    and false.
+    """
+    with open(path, newline="", encoding="utf-8") as f:
+        for line_number, record in enumerate(csv.DictReader(f), start=1):
+            yield _to_case(record, line_number)
+
+
+def read_jsonl_cases(path):
+    """Stream cases from a JSON Lines file (one case object per line)."""
+    with open(path, encoding="utf-8") as f:
+        for line_number, line in enumerate(f, start=1):
+            if line.strip():
+                yield _to_case(json.loads(line), line_number)
+
+
+def generate_credential_cases(count, seed=0):
+    """
+    Generate a reproducible credential/payload matrix.
+
+    The same (count, seed) always yields the same cases in the same order,
+    which is what makes sharding and checkpoint resume safe.
+
+    Args:
+        count (int): Number of cases to generate
+        seed (int): Random seed
+
+    Yields:
+        LoginCase
+    """
+    rng = random.Random(seed)
+    generators = [
+        lambda: ("injection", rng.choice(INJECTION_PAYLOADS), rng.choice(["password", "Password123"])),
+        lambda: ("injection (password)", "student", rng.choice(INJECTION_PAYLOADS)),
+        lambda: ("unicode", rng.choice(UNICODE_PAYLOADS), "Password123"),
+        lambda: ("whitespace/case", rng.choice(WHITESPACE_VARIANTS), "Password123"),
+        lambda: ("length", "a" * rng.choice(FUZZ_LENGTHS), "Password123"),
+        lambda: ("length (password)", "student", "P" * rng.choice(FUZZ_LENGTHS)),
+    ]
+
+    for i in range(count):
+        if i % 50 == 0:
+            # Keep a known-good login in the mix as a control
+            yield LoginCase("student", "Password123", "success", f"Valid Login control #{i}",
+                            needs_browser=True)
+            continue
+        category, username, password = rng.choice(generators)()
+        yield LoginCase(username, password, "failure", f"Generated {category} #{i}")
+
+
+def iter_cases(source, count=1000, seed=0):
+    """
+    Open a case source by name.
+
+    Args:
+        source (str): Path to a .csv or .jsonl file, or "generate"
+        count (int): Number of cases for "generate"
+        seed (int): Seed for "generate"
+
+    Returns:
+        iterator: LoginCase objects, streamed (never all in memory)
+    """
+    if source == "generate":
+        return generate_credential_cases(count, seed)
+    extension = os.path.splitext(source)[1].lower()
+    if extension == ".csv":
+        return read_csv_cases(source)
+    if extension in (".jsonl", ".ndjson"):
+        return read_jsonl_cases(source)
+    raise ValueError(f"Unsupported case source {source!r} (use .csv, .jsonl or 'generate')")
+
+
+def shard_cases(cases, shard_index=0, shard_count=1):
+    """
+    Keep every shard_count-th case, starting at shard_index.
+
+    Args:
+        cases: Iterable of cases, in the same order for every shard
+        shard_index (int): This shard (0-based)
+        shard_count (int): Total number of shards
+
+    Yields:
+        tuple: (position within this shard, case)
+    """
+    for i, case in enumerate(cases):
+        if i % shard_count == shard_index:
+            yield i // shard_count, case
+
+
+def global_case_index(position, shard=(0, 1)):
+    """
+    Index in the full case list of a shard_cases() position.
+
+    Unlike positions, these are unique across shards, so they identify a
+    case even in a report that several shards append to.
+
+    Args:
+        position (int): Position within the shard
+        shard (tuple): (shard_index, shard_count)
+
+    Returns:
+        int: Index of the case in the unsharded case list
+    """
+    shard_index, shard_count = shard
+    return position * shard_count + shard_index
+
+
+class Checkpoint:
+    """
+    Append-only record of completed case positions within one shard.
+
+    Every finished position is written on its own line and flushed, so a
+    crash loses at most the cases still in flight. In memory it keeps only
+    a watermark (every position below it is done) plus positions finished
+    ahead of it - a handful under parallel runs - so memory does not grow
+    with the number of cases.
+
+    Example:
+        checkpoint = Checkpoint("shard_0of4.ckpt")
+        for position, case in checkpoint.pending(shard_cases(cases, 0, 4)):
+            run(case)
+            checkpoint.mark_done(position)
+    """
+
+    def __init__(self, path):
+        """
+        Args:
+            path (str): Checkpoint file; created if missing, resumed if not
+        """
+        self.path = path
+        self.watermark = 0
+        self._done_ahead = set()
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        self._record(int(line))
+        self._file = open(path, "a", encoding="utf-8")
+
+    def _record(self, position):
+        self._done_ahead.add(position)
+        while self.watermark in self._done_ahead:
+            self._done_ahead.remove(self.watermark)
+            self.watermark += 1
+
+    def is_done(self, position):
+        """True if the case at this position has already completed."""
+        return position < self.watermark or position in self._done_ahead
+
+    @property
+    def completed(self):
+        """Number of completed cases recorded so far."""
+        return self.watermark + len(self._done_ahead)
+
+    def pending(self, indexed_cases):
+        """Skip (position, case) pairs that already completed."""
+        return ((position, case) for position, case in indexed_cases if not self.is_done(position))
+
+    def mark_reported(self, results, shard=(0, 1)):
+        """
+        Mark done every case of this shard that a report already holds.
+
+        A streamed result reaches the report just before its position
+        reaches the checkpoint, so a crash in between leaves a reported
+        case pending. Marking it here keeps the resumed run from writing
+        it again. Results are read one at a time, so memory does not grow
+        with the report.
+
+        Args:
+            results: Result dicts, e.g. report_stream.read_report(path);
+                those without a case_index are ignored
+            shard (tuple): (shard_index, shard_count) of this checkpoint
+
+        Returns:
+            int: Number of cases newly marked done
+        """
+        shard_index, shard_count = shard
+        marked = 0
+        for result in results:
+            case_index = result.get("case_index")
+            if case_index is None or case_index % shard_count != shard_index:
+                continue
+            position = case_index // shard_count
+            if not self.is_done(position):
+                self.mark_done(position)
+                marked += 1
+        return marked
+
+    def mark_done(self, position):
+        """Record one completed case and flush it to disk."""
+        self._file.write(f"{position}\n")
+        self._file.flush()
+        self._record(position)
+
+    def close(self):
+        """Close the checkpoint file."""
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,219 @@
+"""
+Task 2: Automated Testing with AI - Local Stand-In Login Page
+Framework: Python standard library (http.server)
+Objective: Serve a copy of the practice login page locally so the Selenium
+suite can run with no network access
+Author: [Kipruto Andrew Kipngetich]
+Date: October 2026
+"""
+
+import html
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+
+LOGIN_PATH = "/practice-test-login/"
+SUCCESS_PATH = "/logged-in-successfully/"
+
+VALID_USERNAME = "student"
+VALID_PASSWORD = "Password123"
+
+# Same element ids, classes and messages as practicetestautomation.com, so
+# LoginTestAutomation's locators and result checks work unchanged. As on the
+# real page, the error box is hidden until it gets the "show" class.
+LOGIN_PAGE = """<!DOCTYPE html>
+<html>
+<head>
+  <title>Test Login | Practice Test Automation</title>
+  <style>#error {{ display: none; }} #error.show {{ display: block; }}</style>
+</head>
+<body>
+  <section id="login">
+    <h2>Test login</h2>
+    <form method="post" action="{login_path}">
+      <div id="form">
+        <label for="username">Username</label>
+        <input type="text" name="username" id="username" value="">
+        <label for="password">Password</label>
+        <input type="password" name="password" id="password" value="">
+        <button id="submit" class="btn" type="submit">Submit</button>
+      </div>
+      <div id="error"{error_class}>{error_message}</div>
+    </form>
+  </section>
+</body>
+</html>
+"""
+
+SUCCESS_PAGE = """<!DOCTYPE html>
+<html>
+<head><title>Logged In Successfully | Practice Test Automation</title></head>
+<body>
+  <article>
+    <h1 class="post-title">Logged In Successfully</h1>
+    <p class="has-text-align-center"><strong>Congratulations student. You successfully logged in!</strong></p>
+    <a href="{login_path}" class="wp-block-button__link">Log out</a>
+  </article>
+</body>
+</html>
+"""
+
+
+def check_credentials(username, password):
+    """
+    Mirror the practice site's rules.
+
+    Returns:
+        str or None: The error message to show, or None on success
+    """
+    if username != VALID_USERNAME:
+        return "Your username is invalid!"
+    if password != VALID_PASSWORD:
+        return "Your password is invalid!"
+    return None
+
+
+class LoginStubHandler(BaseHTTPRequestHandler):
+    """Request handler for the stand-in login and success pages."""
+
+    server_version = "LoginStub/1.0"
+
+    def log_message(self, format, *args):
+        # Keep the test output readable
+        pass
+
+    def _send_html(self, body, status=200):
+        payload = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _render_login(self, error_message=None):
+        return LOGIN_PAGE.format(
+            login_path=LOGIN_PATH,
+            error_class=' class="show"' if error_message else "",
+            error_message=html.escape(error_message or ""),
+        )
+
+    def _count_request(self):
+        with self.server.counter_lock:
+            self.server.request_count += 1
+
+    def do_GET(self):
+        self._count_request()
+        if self.server.response_delay:
+            time.sleep(self.server.response_delay)
+        path = self.path.split("?", 1)[0]
+        if path in ("/", LOGIN_PATH):
+            self._send_html(self._render_login())
+        elif path == SUCCESS_PATH:
+            self._send_html(SUCCESS_PAGE.format(login_path=LOGIN_PATH))
+        else:
+            self._send_html("<h1>Not Found</h1>", status=404)
+
+    def do_POST(self):
+        self._count_request()
+        if self.server.response_delay:
+            time.sleep(self.server.response_delay)
+        length = int(self.headers.get("Content-Length") or 0)
+        form = parse_qs(self.rfile.read(length).decode("utf-8"), keep_blank_values=True)
+        username = form.get("username", [""])[0]
+        password = form.get("password", [""])[0]
+
+        error_message = check_credentials(username, password)
+        if error_message:
+            self._send_html(self._render_login(error_message))
+            return
+
+        self.send_response(303)
+        self.send_header("Location", SUCCESS_PATH)
+        self.send_header("Set-Cookie", "session=student; Path=/; HttpOnly")
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+
+class LoginStubServer:
+    """
+    Stand-in login site running on a background thread.
+
+    Example:
+        with LoginStubServer() as server:
+            tester = LoginTestAutomation(server.url)
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, response_delay=0.0):
+        """
+        Args:
+            host (str): Interface to bind
+            port (int): Port to bind (0 picks a free one)
+            response_delay (float): Seconds to stall every response, to
+                mimic a remote server
+        """
+        self._httpd = ThreadingHTTPServer((host, port), LoginStubHandler)
+        self._httpd.daemon_threads = True
+        self._httpd.response_delay = response_delay
+        self._httpd.request_count = 0
+        self._httpd.counter_lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def request_count(self):
+        """Number of HTTP requests served so far."""
+        return self._httpd.request_count
+
+    @property
+    def origin(self):
+        """Scheme, host and port, e.g. http://127.0.0.1:54321"""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def url(self):
+        """URL of the login page (pass this as base_url)."""
+        return self.origin + LOGIN_PATH
+
+    def start(self):
+        """Start serving on a daemon thread; returns self."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop serving and release the port."""
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+
+# ============================================================================
+# MAIN EXECUTION
+# ============================================================================
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Serve the stand-in login page")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--delay", type=float, default=0.0,
+                        help="Seconds to stall every response")
+    args = parser.parse_args()
+
+    with LoginStubServer(port=args.port, response_delay=args.delay) as server:
+        print(f"🌐 Stand-in login page: {server.url}")
+        print("   Press Ctrl+C to stop")
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            print("\n✅ Server stopped")
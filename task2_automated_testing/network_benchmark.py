@@ -0,0 +1,141 @@
+"""
+Task 2: Automated Testing with AI - Network Profile Benchmark
+Framework: Selenium WebDriver + Chrome DevTools Protocol
+Objective: Compare per-case page-load time and bytes transferred with and
+without the request-blocking network profile
+Author: [Kipruto Andrew Kipngetich]
+Date: October 2026
+"""
+
+import argparse
+import json
+import statistics
+
+from selenium import webdriver
+
+from network_profile import DEFAULT_CACHE_DIR, NetworkProfile
+from selenium_login_test import (
+    DEFAULT_TEST_CASES,
+    LoginTestAutomation,
+    build_chrome_options,
+)
+
+
+def network_usage(performance_log):
+    """
+    Sum up Chrome's performance log (DevTools Network events).
+
+    Unlike the page's own performance entries, this also counts
+    cross-origin fonts, scripts and images, which report no size to the
+    page.
+
+    Returns:
+        dict: transfer_bytes (encoded bytes on the wire), requests and
+        blocked (requests refused by the profile)
+    """
+    usage = {"transfer_bytes": 0, "requests": 0, "blocked": 0}
+    for entry in performance_log:
+        message = json.loads(entry["message"])["message"]
+        method, params = message["method"], message.get("params", {})
+        if method == "Network.requestWillBeSent":
+            usage["requests"] += 1
+        elif method == "Network.loadingFinished":
+            usage["transfer_bytes"] += int(params.get("encodedDataLength", 0))
+        elif method == "Network.loadingFailed" and params.get("blockedReason"):
+            usage["blocked"] += 1
+    return usage
+
+
+def run_profile(base_url, network_profile, rounds=1):
+    """
+    Run the default cases on a fresh session, navigating for every case.
+
+    Args:
+        base_url (str): Login page to test
+        network_profile: NetworkProfile, or None for the plain baseline
+        rounds (int): Times to run the nine default cases
+
+    Returns:
+        list: One row per case: test_name, status, load_ms (the
+        prepare_page step, i.e. the page load the test waits for) and the
+        network_usage() of the whole case
+    """
+    options = build_chrome_options(headless=True, network_profile=network_profile)
+    options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+    driver = webdriver.Chrome(options=options)
+    try:
+        # Network events are only logged once the domain is enabled
+        driver.execute_cdp_cmd("Network.enable", {})
+        tester = LoginTestAutomation(base_url, driver=driver, verbose=False,
+                                     reset_strategy="navigate",
+                                     network_profile=network_profile)
+        rows = []
+        for _ in range(rounds):
+            for test_case in DEFAULT_TEST_CASES:
+                driver.get_log("performance")  # drop events from earlier cases
+                result = tester.test_login(*test_case[:4])
+                rows.append({
+                    "test_name": result["test_name"],
+                    "status": result["status"],
+                    "load_ms": result["timings"].get("prepare_page", 0) * 1000,
+                    **network_usage(driver.get_log("performance")),
+                })
+        return rows
+    finally:
+        driver.quit()
+
+
+# ============================================================================
+# MAIN EXECUTION
+# ============================================================================
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the network blocking profile")
+    parser.add_argument("--url", default="https://practicetestautomation.com/practice-test-login/",
+                        help="Login page to test")
+    parser.add_argument("--local", action="store_true",
+                        help="Use the local stand-in login page (has no third-party assets)")
+    parser.add_argument("--rounds", type=int, default=1,
+                        help="Times to run the nine default cases per profile")
+    parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR,
+                        help="Shared disk cache for the profiled run")
+    args = parser.parse_args()
+
+    print("="*70)
+    print("PAGE LOADS WITH AND WITHOUT THE NETWORK PROFILE")
+    print("="*70)
+
+    server = None
+    base_url = args.url
+    if args.local:
+        from login_stub_server import LoginStubServer
+        server = LoginStubServer().start()
+        base_url = server.url
+    try:
+        profile = NetworkProfile(disk_cache_dir=args.cache_dir)
+        print(f"\n🚫 Profile: {profile.describe()}")
+        baseline = run_profile(base_url, None, args.rounds)
+        profiled = run_profile(base_url, profile, args.rounds)
+    finally:
+        if server is not None:
+            server.stop()
+
+    print(f"\n{'case':<24s} {'load ms':>9s} {'→':>1s} {'profiled':<9s} "
+          f"{'KB':>9s} {'→':>1s} {'profiled':<9s} {'blocked':>8s} {'status':>11s}")
+    print("-" * 90)
+    for before, after in zip(baseline, profiled):
+        print(f"{before['test_name'][:24]:<24s} {before['load_ms']:>9.0f} → {after['load_ms']:<9.0f} "
+              f"{before['transfer_bytes'] / 1024:>9.1f} → {after['transfer_bytes'] / 1024:<9.1f} "
+              f"{after['blocked']:>8d} {before['status']:>5s}/{after['status']:<5s}")
+
+    load_before = statistics.median(row["load_ms"] for row in baseline)
+    load_after = statistics.median(row["load_ms"] for row in profiled)
+    bytes_before = sum(row["transfer_bytes"] for row in baseline)
+    bytes_after = sum(row["transfer_bytes"] for row in profiled)
+    print(f"\n📊 Median page load: {load_before:.0f} ms → {load_after:.0f} ms "
+          f"({load_before / load_after if load_after else 0:.1f}x faster)")
+    print(f"📊 Transferred: {bytes_before / 1024:.1f} KB → {bytes_after / 1024:.1f} KB "
+          f"({(1 - bytes_after / bytes_before) * 100 if bytes_before else 0:.0f}% less), "
+          f"{sum(row['blocked'] for row in profiled)} requests blocked")
+    if any(b["status"] != a["status"] for b, a in zip(baseline, profiled)):
+        print("⚠️  Some cases changed status under the profile; check the blocked URLs")
@@ -0,0 +1,190 @@
+"""
+Task 2: Automated Testing with AI - Streaming Test Report
+Framework: Python standard library
+Objective: Append each test result to a JSON Lines report as soon as it
+finishes, and compute summary statistics from the stream
+Author: [Kipruto Andrew Kipngetich]
+Date: October 2026
+"""
+
+import json
+import math
+import threading
+from collections import Counter
+
+REPORT_PERCENTILES = (50, 90, 95, 99)
+
+
+class ReportAggregator:
+    """
+    Running summary of a stream of result dicts.
+
+    Durations are kept as a histogram of their recorded (10 ms) values,
+    so memory depends on the spread of durations, not the number of
+    results, and percentiles are still exact.
+    """
+
+    def __init__(self):
+        self.status_counts = Counter()
+        self.duration_counts = Counter()
+        self.total_duration = 0.0
+
+    @classmethod
+    def from_results(cls, results):
+        """Aggregate an iterable of result dicts."""
+        aggregator = cls()
+        for result in results:
+            aggregator.add(result)
+        return aggregator
+
+    def add(self, result):
+        """Fold one result into the summary."""
+        self.status_counts[result["status"]] += 1
+        duration = result.get("duration") or 0
+        self.duration_counts[duration] += 1
+        self.total_duration += duration
+
+    @property
+    def total(self):
+        return sum(self.status_counts.values())
+
+    def percentile(self, percent):
+        """Nearest-rank percentile of the durations (0 if there are none)."""
+        total = self.total
+        if total == 0:
+            return 0
+        rank = max(1, math.ceil(percent / 100 * total))
+        seen = 0
+        for duration in sorted(self.duration_counts):
+            seen += self.duration_counts[duration]
+            if seen >= rank:
+                return duration
+        return max(self.duration_counts)
+
+    def summary(self):
+        """
+        Summary statistics for everything added so far.
+
+        Returns:
+            dict: total, passed, failed, errors, success_rate (%),
+            total_duration, avg_duration, max_duration and p50/p90/p95/p99
+        """
+        total = self.total
+        summary = {
+            "total": total,
+            "passed": self.status_counts["PASS"],
+            "failed": self.status_counts["FAIL"],
+            "errors": self.status_counts["ERROR"],
+            "success_rate": self.status_counts["PASS"] / total * 100 if total else 0,
+            "total_duration": round(self.total_duration, 2),
+            "avg_duration": self.total_duration / total if total else 0,
+            "max_duration": max(self.duration_counts, default=0),
+        }
+        for percent in REPORT_PERCENTILES:
+            summary[f"p{percent}_duration"] = self.percentile(percent)
+        return summary
+
+
+class JsonlReportWriter:
+    """
+    Thread-safe JSON Lines report: one result per line, flushed on write.
+
+    A crash mid-suite keeps every result written so far, and dashboards
+    can tail the file for live progress. The writer also keeps a running
+    ReportAggregator, so the final summary needs no second pass.
+
+    Example:
+        with JsonlReportWriter("test_report.jsonl") as writer:
+            tester = LoginTestAutomation(url, report_writer=writer)
+    """
+
+    def __init__(self, path):
+        """
+        Args:
+            path (str): Report file (appended to if it exists)
+        """
+        self.path = path
+        self.aggregator = ReportAggregator()
+        self._lock = threading.Lock()
+        self._file = open(path, "a", encoding="utf-8")
+
+    def write(self, result):
+        """Append one result and flush it to disk."""
+        line = json.dumps(result, ensure_ascii=False) + "\n"
+        with self._lock:
+            self._file.write(line)
+            self._file.flush()
+            self.aggregator.add(result)
+
+    def close(self):
+        """Close the report file."""
+        with self._lock:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def read_report(path):
+    """
+    Stream result dicts from a JSON Lines report.
+
+    A truncated last line (the run is still writing, or crashed
+    mid-write) is skipped.
+    """
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if not line.endswith("\n"):
+                break
+            if line.strip():
+                yield json.loads(line)
+
+
+def aggregate_report(path):
+    """Summary statistics of a JSON Lines report (see ReportAggregator.summary)."""
+    return ReportAggregator.from_results(read_report(path)).summary()
+
+
+def format_summary(summary):
+    """One-line progress summary, e.g. for a dashboard or a follow loop."""
+    return (f"{summary['total']} tests | ✅ {summary['passed']} passed | "
+            f"❌ {summary['failed']} failed | ⚠️  {summary['errors']} errors | "
+            f"p50 {summary['p50_duration']:.2f}s p95 {summary['p95_duration']:.2f}s")
+
+
+# ============================================================================
+# MAIN EXECUTION
+# ============================================================================
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="Summarise a JSON Lines test report")
+    parser.add_argument("report", help="test_report_*.jsonl file")
+    parser.add_argument("--follow", action="store_true",
+                        help="Keep reading as the run appends results")
+    parser.add_argument("--interval", type=float, default=2.0,
+                        help="Seconds between updates with --follow")
+    args = parser.parse_args()
+
+    if not args.follow:
+        print(json.dumps(aggregate_report(args.report), indent=2))
+    else:
+        aggregator = ReportAggregator()
+        pending = ""
+        with open(args.report, encoding="utf-8") as f:
+            try:
+                while True:
+                    pending += f.read()
+                    *lines, pending = pending.split("\n")
+                    for line in lines:
+                        if line.strip():
+                            aggregator.add(json.loads(line))
+                    print(format_summary(aggregator.summary()), flush=True)
+                    time.sleep(args.interval)
+            except KeyboardInterrupt:
+                print()
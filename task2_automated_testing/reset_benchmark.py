@@ -0,0 +1,97 @@
+"""
+Task 2: Automated Testing with AI - State Reset Benchmark
+Framework: Selenium WebDriver
+Objective: Compare in-place state reset against a full page load per case
+on the local stand-in login page
+Author: [Kipruto Andrew Kipngetich]
+Date: October 2026
+"""
+
+import argparse
+import statistics
+import time
+
+from login_stub_server import LoginStubServer
+from selenium_login_test import (
+    DEFAULT_TEST_CASES,
+    LoginTestAutomation,
+    create_chrome_driver,
+)
+
+
+def run_strategy(server, driver, reset_strategy, rounds):
+    """
+    Run the default cases `rounds` times with one reset strategy.
+
+    Returns:
+        dict: Per-case latency stats, page-load counts and HTTP requests
+    """
+    tester = LoginTestAutomation(server.url, driver=driver, verbose=False,
+                                 reset_strategy=reset_strategy)
+    # Start every strategy from the same blank page
+    driver.get("about:blank")
+    requests_before = server.request_count
+
+    start_time = time.perf_counter()
+    for _ in range(rounds):
+        for test_case in DEFAULT_TEST_CASES:
+            tester.test_login(*test_case[:4])
+    wall_time = time.perf_counter() - start_time
+
+    results = tester.test_results
+    timed = [r["timings"] for r in results if "wait_for_outcome" in r["timings"]]
+    prepare = [t["prepare_page"] for t in timed]
+    to_outcome = [t["prepare_page"] + t["locate_fields"] + t["enter_credentials"] + t["wait_for_outcome"]
+                  for t in timed]
+    return {
+        "strategy": reset_strategy,
+        "cases": len(results),
+        "passed": sum(r["status"] == "PASS" for r in results),
+        "wall_time": wall_time,
+        "per_case_ms": wall_time / len(results) * 1000,
+        "prepare_median_ms": statistics.median(prepare) * 1000,
+        "page_to_outcome_median_ms": statistics.median(to_outcome) * 1000,
+        "navigations": sum(r["page_load"] == "navigate" for r in results),
+        "http_requests": server.request_count - requests_before,
+    }
+
+
+# ============================================================================
+# MAIN EXECUTION
+# ============================================================================
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark state reset strategies")
+    parser.add_argument("--rounds", type=int, default=5,
+                        help="Times to run the nine default cases per strategy")
+    parser.add_argument("--delay", type=float, default=0.05,
+                        help="Seconds the stand-in server stalls each response")
+    args = parser.parse_args()
+
+    print("="*70)
+    print("STATE RESET VS FULL PAGE LOAD PER CASE")
+    print("="*70)
+
+    summaries = []
+    with LoginStubServer(response_delay=args.delay) as server:
+        driver = create_chrome_driver(headless=True)
+        try:
+            # Always navigating is the old behaviour, i.e. the baseline
+            for reset_strategy in ("navigate", "reset"):
+                summaries.append(run_strategy(server, driver, reset_strategy, args.rounds))
+        finally:
+            driver.quit()
+
+    print(f"\n{len(DEFAULT_TEST_CASES) * args.rounds} cases per strategy, "
+          f"{args.delay * 1000:.0f} ms simulated server latency\n")
+    print(f"{'strategy':>10s} {'passed':>8s} {'per case':>10s} {'prepare p50':>12s} "
+          f"{'to outcome p50':>15s} {'page loads':>11s} {'requests':>9s}")
+    print("-" * 80)
+    for s in summaries:
+        print(f"{s['strategy']:>10s} {s['passed']:>4d}/{s['cases']:<3d} {s['per_case_ms']:>8.1f}ms "
+              f"{s['prepare_median_ms']:>10.1f}ms {s['page_to_outcome_median_ms']:>13.1f}ms "
+              f"{s['navigations']:>11d} {s['http_requests']:>9d}")
+
+    baseline, reset = summaries
+    print(f"\n✓ In-place reset: {baseline['per_case_ms'] / reset['per_case_ms']:.2f}x faster per case, "
+          f"{baseline['http_requests'] - reset['http_requests']} fewer HTTP requests")
@@ -0,0 +1,269 @@
+"""
+Task 2: Automated Testing with AI - Result History
+Framework: SQLite (Python standard library)
+Objective: Remember every case's past results, and use them for per-case
+timeouts, flaky-case detection and duration regression checks
+Author: [Kipruto Andrew Kipngetich]
+Date: October 2026
+"""
+
+import math
+import sqlite3
+import threading
+from datetime import datetime
+
+DEFAULT_HISTORY_PATH = "test_history.sqlite3"
+BACKENDS = ("selenium", "http")  # values of result["backend"]
+HISTORY_WINDOW = 50       # most recent results per case that count
+MIN_SAMPLES = 5           # fewer clean passes than this: keep the defaults
+
+# Adaptive timeout = TIMEOUT_MARGIN x the p99 of the step, clamped
+TIMEOUT_PERCENTILE = 99
+TIMEOUT_MARGIN = 3.0
+MIN_TIMEOUT = 2.0
+MAX_TIMEOUT = 30.0
+
+# A case regressed if it took REGRESSION_RATIO x its p95, and at least
+# REGRESSION_MIN_SECONDS more (so fast cases do not trip on noise)
+REGRESSION_RATIO = 1.5
+REGRESSION_MIN_SECONDS = 0.5
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    started TEXT NOT NULL,
+    base_url TEXT
+);
+CREATE TABLE IF NOT EXISTS results (
+    run_id INTEGER NOT NULL REFERENCES runs (id),
+    test_name TEXT NOT NULL,
+    backend TEXT NOT NULL,
+    status TEXT NOT NULL,
+    actual TEXT,
+    duration REAL,
+    locate_fields REAL,
+    wait_for_outcome REAL,
+    attempts INTEGER NOT NULL,
+    timestamp TEXT
+);
+CREATE INDEX IF NOT EXISTS results_by_case ON results (test_name, backend, run_id);
+"""
+
+
+def _percentile(sorted_values, percent):
+    rank = max(1, math.ceil(percent / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def looks_like_timing_flake(result):
+    """
+    True if a result failed because something did not show up in time.
+
+    That is a wait that ran out before any outcome appeared ("unknown"),
+    or an error raised by a timed-out element lookup or command. A case
+    that reached a definite but wrong outcome is a real failure.
+    """
+    if result["status"] == "PASS":
+        return False
+    if result["actual"] == "unknown":
+        return True
+    message = (result.get("error_message") or "").lower()
+    return result["actual"] is None and any(
+        marker in message for marker in ("timeout", "timed out", "not found"))
+
+
+class ResultHistory:
+    """
+    SQLite store of past results, one row per finished case.
+
+    Baselines only look at earlier runs, so results being recorded do not
+    shift the numbers they are compared against. Safe to share between
+    worker threads.
+
+    Example:
+        with ResultHistory("test_history.sqlite3", base_url=url) as history:
+            tester = LoginTestAutomation(url, history=history)
+            tester.run_test_suite()
+    """
+
+    def __init__(self, path=DEFAULT_HISTORY_PATH, base_url=None, window=HISTORY_WINDOW):
+        """
+        Args:
+            path (str): SQLite database (created if needed)
+            base_url (str): Recorded with the run, for reference
+            window (int): Most recent results per case used for baselines
+        """
+        self.path = path
+        self.window = window
+        self._lock = threading.Lock()
+        self._baselines = {}
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        with self._conn:
+            cursor = self._conn.execute(
+                "INSERT INTO runs (started, base_url) VALUES (?, ?)",
+                (datetime.now().isoformat(timespec="seconds"), base_url))
+        self.run_id = cursor.lastrowid
+
+    def record(self, result):
+        """Store one finished result."""
+        timings = result.get("timings") or {}
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO results VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (self.run_id, result["test_name"], result.get("backend", "selenium"),
+                 result["status"], result["actual"], result.get("duration"),
+                 timings.get("locate_fields"), timings.get("wait_for_outcome"),
+                 result.get("attempts", 1), result.get("timestamp")))
+
+    def baseline(self, test_name, backend="selenium"):
+        """
+        Statistics of a case's most recent results from earlier runs.
+
+        Latency figures only use passes that needed no retry.
+
+        Returns:
+            dict or None: samples, pass_rate, duration_p50, duration_p95
+            and locate_fields_p99 / wait_for_outcome_p99 (None when too
+            few samples); None if the case has no history
+        """
+        key = (test_name, backend)
+        with self._lock:
+            if key not in self._baselines:
+                rows = self._conn.execute(
+                    "SELECT status, attempts, duration, locate_fields, wait_for_outcome "
+                    "FROM results WHERE test_name = ? AND backend = ? AND run_id < ? "
+                    "ORDER BY run_id DESC LIMIT ?",
+                    (test_name, backend, self.run_id, self.window)).fetchall()
+                self._baselines[key] = self._summarise(rows) if rows else None
+            return self._baselines[key]
+
+    @staticmethod
+    def _summarise(rows):
+        clean = [row for row in rows if row[0] == "PASS" and row[1] == 1]
+        baseline = {
+            "samples": len(rows),
+            "clean_passes": len(clean),
+            "pass_rate": sum(row[0] == "PASS" for row in rows) / len(rows),
+            "duration_p50": None,
+            "duration_p95": None,
+            "locate_fields_p99": None,
+            "wait_for_outcome_p99": None,
+        }
+        if len(clean) >= MIN_SAMPLES:
+            durations = sorted(row[2] for row in clean)
+            baseline["duration_p50"] = _percentile(durations, 50)
+            baseline["duration_p95"] = _percentile(durations, 95)
+            for column, step in ((3, "locate_fields"), (4, "wait_for_outcome")):
+                values = sorted(row[column] for row in clean if row[column] is not None)
+                if len(values) >= MIN_SAMPLES:
+                    baseline[f"{step}_p99"] = _percentile(values, TIMEOUT_PERCENTILE)
+        return baseline
+
+    def timeouts(self, test_name, defaults):
+        """
+        Per-case wait timeouts from the case's latency history.
+
+        Args:
+            test_name (str): Case name
+            defaults (dict): {"locate_fields": s, "wait_for_outcome": s},
+                used for any step without enough history
+
+        Returns:
+            dict: Same keys, in seconds
+        """
+        baseline = self.baseline(test_name)
+        timeouts = dict(defaults)
+        if baseline is None:
+            return timeouts
+        for step in defaults:
+            p99 = baseline[f"{step}_p99"]
+            if p99 is not None:
+                timeouts[step] = round(min(max(p99 * TIMEOUT_MARGIN, MIN_TIMEOUT), MAX_TIMEOUT), 2)
+        return timeouts
+
+    def regression(self, result):
+        """
+        Compare a result's duration with its case's baseline.
+
+        Returns:
+            dict or None: {"baseline_p95", "ratio"} if the case got slower
+            than REGRESSION_RATIO x its p95 (and by REGRESSION_MIN_SECONDS)
+        """
+        if result["status"] != "PASS":
+            return None
+        baseline = self.baseline(result["test_name"], result.get("backend", "selenium"))
+        if baseline is None or baseline["duration_p95"] is None:
+            return None
+        p95 = baseline["duration_p95"]
+        duration = result["duration"]
+        if duration > p95 * REGRESSION_RATIO and duration - p95 >= REGRESSION_MIN_SECONDS:
+            return {"baseline_p95": p95, "ratio": round(duration / max(p95, 0.01), 2)}
+        return None
+
+    def suite_baseline(self, backend="selenium", current_run=False):
+        """
+        Duration percentiles of one backend's clean passes (all cases).
+
+        Browser and HTTP cases take very different times, so they are
+        never pooled.
+
+        Args:
+            backend (str): One of BACKENDS
+            current_run (bool): Summarise this run instead of the earlier
+                runs it is compared against
+
+        Returns:
+            dict or None: {"runs", "samples", "p50", "p95"}, where runs
+            counts the runs that contributed samples; None with fewer than
+            MIN_SAMPLES samples
+        """
+        if current_run:
+            runs_filter, params = "run_id = ?", (self.run_id,)
+        else:
+            runs_filter = "run_id IN (SELECT id FROM runs WHERE id < ? ORDER BY id DESC LIMIT ?)"
+            params = (self.run_id, self.window)
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT run_id, duration FROM results WHERE {runs_filter} AND backend = ? "
+                "AND status = 'PASS' AND attempts = 1 AND duration IS NOT NULL "
+                "ORDER BY duration",
+                (*params, backend)).fetchall()
+        if len(rows) < MIN_SAMPLES:
+            return None
+        durations = [row[1] for row in rows]
+        return {"runs": len({row[0] for row in rows}), "samples": len(durations),
+                "p50": _percentile(durations, 50), "p95": _percentile(durations, 95)}
+
+    def flaky_cases(self):
+        """
+        Cases whose recent results (this run included) mix passes with
+        failures or needed retries, per backend.
+
+        Returns:
+            list: (test_name, backend, results, pass_rate, retried) tuples,
+            least reliable first
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT test_name, backend, COUNT(*), AVG(status = 'PASS'), SUM(attempts > 1) "
+                "FROM (SELECT *, ROW_NUMBER() OVER "
+                "      (PARTITION BY test_name, backend ORDER BY run_id DESC) AS recent "
+                "      FROM results) "
+                "WHERE recent <= ? GROUP BY test_name, backend",
+                (self.window,)).fetchall()
+        flaky = [row for row in rows if 0 < row[3] < 1 or row[4]]
+        return sorted(flaky, key=lambda row: (row[3], -row[4]))
+
+    def close(self):
+        """Close the database."""
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,194 @@
+"""
+Task 2: Automated Testing with AI - Screenshot Pipeline
+Framework: Selenium WebDriver
+Objective: Capture screenshots without blocking the test on disk writes,
+and store identical images only once
+Author: [Kipruto Andrew Kipngetich]
+Date: October 2026
+"""
+
+import contextlib
+import hashlib
+import os
+import queue
+import random
+import threading
+import time
+
+# always     - every case
+# on-failure - cases that did not PASS
+# sampled    - every non-passing case plus a random share of passing ones
+# never      - no screenshots
+CAPTURE_POLICIES = ("always", "on-failure", "sampled", "never")
+
+_STOP = object()
+
+
+class ScreenshotPipeline:
+    """
+    Background writer for test screenshots.
+
+    The test thread only grabs the PNG bytes from the driver and hashes
+    them (well under a millisecond); the file write happens on a worker
+    thread. Files are named by content hash, so a page that looks the same
+    in several cases (e.g. the same error message) is stored once.
+
+    Example:
+        with ScreenshotPipeline("screenshots", policy="on-failure") as shots:
+            tester = LoginTestAutomation(url, screenshot_pipeline=shots)
+            tester.run_test_suite()
+        print(shots.stats())
+    """
+
+    def __init__(self, directory="screenshots", policy="always", sample_rate=0.1,
+                 seed=None, max_pending=64):
+        """
+        Args:
+            directory (str): Where screenshots are written (created if needed)
+            policy (str): One of CAPTURE_POLICIES
+            sample_rate (float): Share of passing cases captured by "sampled"
+            seed: Random seed for "sampled"
+            max_pending (int): Most screenshots queued for writing; capture
+                blocks beyond this so memory stays bounded
+        """
+        if policy not in CAPTURE_POLICIES:
+            raise ValueError(f"policy must be one of {CAPTURE_POLICIES}, got {policy!r}")
+        self.directory = directory
+        self.policy = policy
+        self.sample_rate = sample_rate
+        self._rng = random.Random(seed)
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._lock = threading.Lock()
+        self._known = set()
+        self._thread = None
+        self._counters = {
+            "captured": 0,
+            "skipped": 0,
+            "duplicates": 0,
+            "written": 0,
+            "write_errors": 0,
+            "bytes_written": 0,
+            "bytes_deduplicated": 0,
+            "capture_seconds": 0.0,
+            "write_seconds": 0.0,
+        }
+        os.makedirs(directory, exist_ok=True)
+
+    def should_capture(self, status):
+        """Apply the capture policy to a case with the given status."""
+        if self.policy == "always":
+            return True
+        if self.policy == "never":
+            return False
+        if status != "PASS":
+            return True
+        return self.policy == "sampled" and self._rng.random() < self.sample_rate
+
+    def capture(self, driver, status="PASS"):
+        """
+        Grab a screenshot and queue it for writing.
+
+        Args:
+            driver: WebDriver to capture
+            status: The case's status, for the capture policy
+
+        Returns:
+            str or None: Path the screenshot is (or will shortly be) stored
+            at, or None if the policy skipped it
+        """
+        if not self.should_capture(status):
+            with self._lock:
+                self._counters["skipped"] += 1
+            return None
+
+        start_time = time.perf_counter()
+        png = driver.get_screenshot_as_png()
+        digest = hashlib.sha256(png).hexdigest()
+        path = os.path.join(self.directory, f"{digest[:16]}.png")
+
+        with self._lock:
+            self._counters["captured"] += 1
+            self._counters["capture_seconds"] += time.perf_counter() - start_time
+            if digest in self._known:
+                self._counters["duplicates"] += 1
+                self._counters["bytes_deduplicated"] += len(png)
+                return path
+            self._known.add(digest)
+
+        self._start()
+        self._queue.put((digest, path, png))
+        return path
+
+    def _start(self):
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._write_loop, daemon=True)
+                self._thread.start()
+
+    def _write_loop(self):
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+            digest, path, png = item
+            start_time = time.perf_counter()
+            try:
+                written = self._write(path, png)
+            except OSError:
+                # Disk full, permissions, ...: count it and keep draining
+                # the queue, so capture() and close() never wait on a dead
+                # writer. A later identical screenshot gets another try.
+                with self._lock:
+                    self._counters["write_errors"] += 1
+                    self._known.discard(digest)
+                continue
+            with self._lock:
+                self._counters["written"] += 1 if written else 0
+                self._counters["bytes_written"] += written
+                self._counters["write_seconds"] += time.perf_counter() - start_time
+
+    @staticmethod
+    def _write(path, png):
+        """Write one screenshot atomically; returns the bytes written."""
+        if os.path.exists(path):
+            # Stored by an earlier run
+            return 0
+        temp_path = path + ".tmp"
+        try:
+            with open(temp_path, "wb") as f:
+                f.write(png)
+            os.replace(temp_path, path)
+        except OSError:
+            with contextlib.suppress(OSError):
+                os.remove(temp_path)
+            raise
+        return len(png)
+
+    def close(self):
+        """Wait for queued screenshots to be written, then stop the writer."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._queue.put(_STOP)
+            thread.join()
+
+    def stats(self):
+        """
+        Capture counters plus the time moved off the test thread.
+
+        write_ms_saved_per_case is the average time one file write takes,
+        i.e. what every captured case used to wait for with save_screenshot
+        (duplicates are not written at all).
+        """
+        with self._lock:
+            stats = dict(self._counters)
+        captured, written = stats["captured"], stats["written"]
+        stats["capture_ms_per_case"] = stats["capture_seconds"] / captured * 1000 if captured else 0
+        stats["write_ms_saved_per_case"] = stats["write_seconds"] / written * 1000 if written else 0
+        return stats
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -11,10 +11,230 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import (
+    StaleElementReferenceException,
+    TimeoutException,
+    WebDriverException,
+)
 import time
 import json
+from collections import Counter
+from contextlib import contextmanager, nullcontext
 from datetime import datetime
+from functools import partial
+from itertools import islice
+from operator import itemgetter
+from urllib.parse import urlsplit
+
+from case_sources import global_case_index
+from network_profile import DEFAULT_BLOCKED_URLS, DEFAULT_CACHE_DIR, NetworkProfile
+from report_stream import JsonlReportWriter, ReportAggregator, read_report
+from result_history import (
+    BACKENDS,
+    DEFAULT_HISTORY_PATH,
+    MAX_TIMEOUT,
+    ResultHistory,
+    looks_like_timing_flake,
+)
+from screenshot_pipeline import CAPTURE_POLICIES, ScreenshotPipeline
+from tracing import Tracer, format_step_table, instrument_driver
+
+# Explicit-wait settings: how long to wait for the page to react to a
+# submit, and how often to re-check the condition while waiting
+ELEMENT_TIMEOUT = 10
+OUTCOME_TIMEOUT = 10
+# Wait timeouts without history
+DEFAULT_TIMEOUTS = {"locate_fields": ELEMENT_TIMEOUT, "wait_for_outcome": OUTCOME_TIMEOUT}
+MAX_RETRIES = 2
+RETRY_BACKOFF = 0.5       # seconds before the first retry, doubled per retry
+RETRY_BACKOFF_MAX = 4.0
+RETRY_TIMEOUT_FACTOR = 2.0  # wait timeouts grow by this per retry, up to MAX_TIMEOUT
+POLL_FREQUENCY = 0.1
+
+# Streamed cases routed to the HTTP backend per batch of this many
+HTTP_STREAM_BATCH = 500
+
+# p95 / median duration ratio reported as a long tail
+LONG_TAIL_RATIO = 2
+
+# URL fragments that mean the login went through
+SUCCESS_URL_MARKERS = ("logged-in-successfully", "dashboard")
+
+# What counts as a success or an error on the page after submit (read by
+# PROBE_SCRIPT, and so by check_login_success / check_login_error)
+DEFAULT_LOGIN_INDICATORS = {
+    "success_url_markers": list(SUCCESS_URL_MARKERS),
+    # [CSS selector, text its content must contain (lower case)]
+    "success_text": [[".post-title", "successfully"]],
+    "success_link_texts": ["Log out"],
+    # Visible elements matching any of these mean the login failed
+    "error_selectors": ["#error", ".error", ".alert-error", ".login-error"],
+}
+
+# Collects every indicator in a single round-trip. Success wins over error.
+PROBE_SCRIPT = """
+var indicators = arguments[0];
+var url = location.href;
+var success = [];
+var errors = [];
+function isVisible(el) {
+    var style = window.getComputedStyle(el);
+    return style.display !== 'none' && style.visibility !== 'hidden'
+        && el.getClientRects().length > 0;
+}
+indicators.success_url_markers.forEach(function (marker) {
+    if (url.indexOf(marker) !== -1) { success.push('url:' + marker); }
+});
+indicators.success_text.forEach(function (pair) {
+    var matches = Array.prototype.some.call(document.querySelectorAll(pair[0]), function (el) {
+        return el.textContent.toLowerCase().indexOf(pair[1]) !== -1;
+    });
+    if (matches) { success.push('text:' + pair[0]); }
+});
+if (indicators.success_link_texts.length) {
+    Array.prototype.forEach.call(document.querySelectorAll('a'), function (link) {
+        var text = link.textContent.trim();
+        if (indicators.success_link_texts.indexOf(text) !== -1) { success.push('link:' + text); }
+    });
+}
+indicators.error_selectors.forEach(function (selector) {
+    var visible = Array.prototype.filter.call(document.querySelectorAll(selector), isVisible);
+    if (visible.length) {
+        errors.push({selector: selector, text: visible[0].textContent.trim()});
+    }
+});
+return {
+    url: url,
+    outcome: success.length ? 'success' : (errors.length ? 'failure' : 'unknown'),
+    success: success,
+    errors: errors
+};
+"""
+
+# How each case gets a clean login page:
+#   reset    - clear cookies/storage, and blank the form in place when the
+#              login page is still loaded; navigate only when it is not
+#   navigate - always clear state and reload the page
+RESET_STRATEGIES = ("reset", "navigate")
+
+# Blanks the login form in place. Returns false (so the caller navigates)
+# unless the login page is loaded and all three fields are present.
+RESET_FORM_SCRIPT = """
+var expected = arguments[0];
+if (location.href.split('#')[0] !== expected) { return false; }
+var username = document.getElementById('username');
+var password = document.getElementById('password');
+if (!username || !password || !document.getElementById('submit')) { return false; }
+username.value = '';
+password.value = '';
+var error = document.getElementById('error');
+if (error) { error.classList.remove('show'); error.textContent = ''; }
+return true;
+"""
+
+# (username, password, expected result, test name[, needs browser])
+# AI would generate these based on requirements
+DEFAULT_TEST_CASES = [
+    # Valid credentials (post-login page: always run in the browser)
+    ("student", "Password123", "success", "Valid Login", True),
+    
+    # Invalid username
+    ("invaliduser", "Password123", "failure", "Invalid Username"),
+    
+    # Invalid password
+    ("student", "wrongpassword", "failure", "Invalid Password"),
+    
+    # Both invalid
+    ("wronguser", "wrongpass", "failure", "Invalid Credentials"),
+    
+    # Empty username
+    ("", "Password123", "failure", "Empty Username"),
+    
+    # Empty password
+    ("student", "", "failure", "Empty Password"),
+    
+    # Both empty
+    ("", "", "failure", "Empty Credentials"),
+    
+    # SQL injection attempt (security test)
+    ("admin' OR '1'='1", "password", "failure", "SQL Injection Attempt"),
+    
+    # XSS attempt (security test)
+    ("<script>alert('XSS')</script>", "password", "failure", "XSS Attempt"),
+]
+
+
+def build_chrome_options(headless=False, network_profile=None):
+    """
+    Chrome options shared by every driver the harness launches.
+    
+    Args:
+        headless: Run without a browser window
+        network_profile: NetworkProfile whose launch settings to add
+        
+    Returns:
+        Options
+    """
+    chrome_options = Options()
+    if headless:
+        chrome_options.add_argument("--headless=new")
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--window-size=1920,1080")
+    
+    # Suppress unnecessary logs
+    chrome_options.add_experimental_option('excludeSwitches', ['enable-logging'])
+    if network_profile is not None:
+        network_profile.apply_to_options(chrome_options)
+    return chrome_options
+
+
+def create_chrome_driver(headless=False, network_profile=None):
+    """
+    Launch a Chrome WebDriver session.
+    
+    Every session gets its own temporary Chrome profile, so cookies and
+    storage are never shared between drivers.
+    
+    Args:
+        headless: Run without a browser window
+        network_profile: NetworkProfile to launch with (request blocking,
+            page-load strategy, images, disk cache)
+        
+    Returns:
+        WebDriver
+    """
+    driver = webdriver.Chrome(options=build_chrome_options(headless, network_profile))
+    # Explicit waits only: an implicit wait would make every negative
+    # find_element probe block for the full timeout
+    driver.implicitly_wait(0)
+    if network_profile is not None:
+        network_profile.apply_to_driver(driver)
+    return driver
+
+
+def login_outcome_reached(indicators=None):
+    """
+    Wait condition: the page shows a success or an error indicator.
+    
+    Each poll is one execute_script round-trip (see PROBE_SCRIPT).
+    
+    Args:
+        indicators: Indicator set, defaults to DEFAULT_LOGIN_INDICATORS
+        
+    Returns:
+        callable: Condition for WebDriverWait.until, returning the probe
+        dict once the outcome is decided, else False (keep polling)
+    """
+    indicators = indicators or DEFAULT_LOGIN_INDICATORS
+    
+    def condition(driver):
+        probe = driver.execute_script(PROBE_SCRIPT, indicators)
+        return probe if probe["outcome"] != "unknown" else False
+    
+    return condition
+
 
 class LoginTestAutomation:
     """
@@ -22,37 +242,104 @@ class LoginTestAutomation:
     Simulates AI-enhanced testing with intelligent wait strategies and error detection.
     """
     
-    def __init__(self, base_url="https://practicetestautomation.com/practice-test-login/"):
+    def __init__(self, base_url="https://practicetestautomation.com/practice-test-login/",
+                 driver=None, headless=False, verbose=True, session_pool=None,
+                 reset_strategy="reset", keep_results=True, report_writer=None,
+                 screenshot_pipeline=None, tracer=None, indicators=None, http_backend=None,
+                 network_profile=None, history=None, max_retries=MAX_RETRIES):
         """
         Initialize the test automation framework.
         
         Args:
             base_url: URL of the login page to test
+            driver: Existing WebDriver to use instead of launching one (the
+                caller stays responsible for quitting it)
+            headless: Launch Chrome without a browser window
+            verbose: Print step-by-step progress for every test
+            session_pool: DriverSessionPool to run test cases on in
+                parallel; no driver of our own is launched
+            reset_strategy: How each case gets a clean login page, one of
+                RESET_STRATEGIES
+            keep_results: Append every result to test_results (turn off
+                for long streamed runs)
+            report_writer: JsonlReportWriter that receives every result as
+                soon as its case finishes
+            screenshot_pipeline: ScreenshotPipeline to capture through
+                (background writes, de-duplicated, policy-based); without
+                one every case saves a screenshot synchronously
+            tracer: Tracer that records a span for every step, wait,
+                page-load phase and WebDriver command
+            indicators: Success/error indicator set for classifying the
+                page after submit; defaults to DEFAULT_LOGIN_INDICATORS
+            http_backend: HttpLoginBackend that run_test_suite hands every
+                case it can judge without a browser
+            network_profile: NetworkProfile for the driver we launch; an
+                injected driver only gets its URL blocking
+            history: ResultHistory that records every result and supplies
+                per-case timeouts, regression checks and report statistics
+            max_retries: Retries for failures that look like timing flakes
         """
+        if reset_strategy not in RESET_STRATEGIES:
+            raise ValueError(f"reset_strategy must be one of {RESET_STRATEGIES}, got {reset_strategy!r}")
         self.base_url = base_url
-        self.driver = None
+        self.reset_strategy = reset_strategy
+        self.driver = driver
+        self.headless = headless
+        self.verbose = verbose
+        self.session_pool = session_pool
         self.test_results = []
-        self.setup_driver()
+        self.keep_results = keep_results
+        self.report_writer = report_writer
+        self.screenshot_pipeline = screenshot_pipeline
+        self.tracer = tracer
+        self.indicators = indicators or DEFAULT_LOGIN_INDICATORS
+        self.http_backend = http_backend
+        self.network_profile = network_profile
+        self.history = history
+        self.max_retries = max_retries
+        self._current_test = None
+        self._pool_workers = {}
+        self._owns_driver = driver is None and session_pool is None
+        if self._owns_driver:
+            self.setup_driver()
+        elif driver is not None:
+            driver.implicitly_wait(0)
+            if network_profile is not None and not network_profile.apply_to_driver(driver):
+                print("⚠️  Driver has no DevTools access; URL blocking is off")
+        if tracer is not None and self.driver is not None:
+            instrument_driver(self.driver, tracer)
+    
+    def log(self, message):
+        """Print a progress message unless running quietly."""
+        if self.verbose:
+            print(message)
+    
+    def trace_span(self, name, cat="step"):
+        """Span for the current test, or a no-op context without a tracer."""
+        if self.tracer is None:
+            return nullcontext()
+        return self.tracer.span(name, cat, test=self._current_test)
+    
+    @contextmanager
+    def timed_step(self, timings, step):
+        """Record how long the with-block took in timings[step] (seconds)."""
+        start_time = time.perf_counter()
+        try:
+            with self.trace_span(step):
+                yield
+        finally:
+            timings[step] = round(time.perf_counter() - start_time, 3)
     
     def setup_driver(self):
         """Configure and initialize Chrome WebDriver with options."""
         print("🔧 Setting up Chrome WebDriver...")
         
-        chrome_options = Options()
-        # Uncomment for headless mode (no browser window)
-        # chrome_options.add_argument("--headless")
-        chrome_options.add_argument("--disable-gpu")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--window-size=1920,1080")
-        
-        # Suppress unnecessary logs
-        chrome_options.add_experimental_option('excludeSwitches', ['enable-logging'])
-        
         try:
-            self.driver = webdriver.Chrome(options=chrome_options)
-            self.driver.implicitly_wait(10)
-            print("✅ WebDriver initialized successfully")
+            start_time = time.perf_counter()
+            self.driver = create_chrome_driver(self.headless, self.network_profile)
+            if self.network_profile is not None:
+                print(f"🚫 Network profile: {self.network_profile.describe()}")
+            print(f"✅ WebDriver initialized successfully ({time.perf_counter() - start_time:.2f}s)")
         except Exception as e:
             print(f"❌ Error initializing WebDriver: {e}")
             print("💡 Make sure ChromeDriver is installed and in PATH")
@@ -60,12 +347,55 @@ class LoginTestAutomation:
     
     def navigate_to_login(self):
         """Navigate to the login page."""
-        print(f"\n🌐 Navigating to: {self.base_url}")
+        self.log(f"\n🌐 Navigating to: {self.base_url}")
+        # get() returns once the load event has fired; the field lookups
+        # that follow wait explicitly for anything rendered later
         self.driver.get(self.base_url)
-        time.sleep(1)  # Allow page to load
-        print("✅ Page loaded successfully")
+        self.log("✅ Page loaded successfully")
+        
+        if self.tracer is not None:
+            timing = self.driver.execute_script("return window.performance.timing.toJSON();")
+            self.tracer.add_navigation_timing(timing, test=self._current_test)
     
-    def find_element_safe(self, by, value, timeout=10):
+    def clear_session_state(self):
+        """
+        Clear cookies and local/session storage so no login carries over.
+        
+        Uses Chrome DevTools commands when the driver supports them, and
+        falls back to WebDriver calls for other (e.g. remote) drivers.
+        """
+        parts = urlsplit(self.base_url)
+        origin = f"{parts.scheme}://{parts.netloc}"
+        try:
+            self.driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            self.driver.execute_cdp_cmd("Storage.clearDataForOrigin", {
+                "origin": origin,
+                "storageTypes": "local_storage,session_storage",
+            })
+        except (AttributeError, WebDriverException):
+            self.driver.delete_all_cookies()
+            self.driver.execute_script(
+                "try { localStorage.clear(); sessionStorage.clear(); } catch (e) {}")
+    
+    def prepare_login_page(self):
+        """
+        Get a clean, empty login form for the next case.
+        
+        With the "reset" strategy the form is blanked in place when the
+        login page is still loaded (e.g. after a failed attempt), which
+        saves a full page load; anything else falls back to navigating.
+        
+        Returns:
+            str: "reset" if the form was reset in place, else "navigate"
+        """
+        self.clear_session_state()
+        if self.reset_strategy == "reset" and self.driver.execute_script(RESET_FORM_SCRIPT, self.base_url):
+            self.log("♻️  Login form reset in place")
+            return "reset"
+        self.navigate_to_login()
+        return "navigate"
+    
+    def find_element_safe(self, by, value, timeout=ELEMENT_TIMEOUT):
         """
         Safely find element with explicit wait (AI-enhanced pattern).
         
@@ -78,32 +408,117 @@ class LoginTestAutomation:
             WebElement or None
         """
         try:
-            element = WebDriverWait(self.driver, timeout).until(
-                EC.presence_of_element_located((by, value))
-            )
+            with self.trace_span(f"wait.presence:{value}", "wait"):
+                element = WebDriverWait(self.driver, timeout, poll_frequency=POLL_FREQUENCY).until(
+                    EC.presence_of_element_located((by, value))
+                )
             return element
         except TimeoutException:
-            print(f"⚠️  Timeout: Element not found - {value}")
+            self.log(f"⚠️  Timeout: Element not found - {value}")
             return None
     
-    def test_login(self, username, password, expected_result, test_name):
+    def wait_for_login_outcome(self, timeout=OUTCOME_TIMEOUT):
+        """
+        Wait until the page shows either a success or an error after submit.
+        
+        Polls every POLL_FREQUENCY seconds instead of sleeping a fixed time,
+        so a fast response is picked up as soon as it renders.
+        
+        Args:
+            timeout: Maximum wait time in seconds
+            
+        Returns:
+            dict or None: The deciding probe (see probe_login_result), or
+            None if neither appeared in time
+        """
+        try:
+            with self.trace_span("wait.login_outcome", "wait"):
+                return WebDriverWait(
+                    self.driver, timeout, poll_frequency=POLL_FREQUENCY,
+                    ignored_exceptions=[StaleElementReferenceException],
+                ).until(login_outcome_reached(self.indicators))
+        except TimeoutException:
+            self.log(f"⚠️  Timeout: No login outcome after {timeout}s")
+            return None
+    
+    def probe_login_result(self):
+        """
+        Classify the current page with a single execute_script call.
+        
+        Replaces separate current_url / find_element / find_elements /
+        is_displayed round-trips; check_login_success and
+        check_login_error are thin wrappers over it.
+        
+        Returns:
+            dict: {"url", "outcome": "success" | "failure" | "unknown",
+            "success": matched success indicators,
+            "errors": [{"selector", "text"}] for visible error elements}
+        """
+        return self.driver.execute_script(PROBE_SCRIPT, self.indicators)
+    
+    def test_login(self, username, password, expected_result, test_name, case_index=None):
         """
         Execute a single login test case.
         
+        Waits use per-case timeouts from the history, if any. A failure
+        that looks like a timing flake (see looks_like_timing_flake) is
+        retried up to max_retries times, with bounded exponential backoff;
+        each retry scales the case's timeouts by RETRY_TIMEOUT_FACTOR
+        (capped at MAX_TIMEOUT). The final attempt is recorded,
+        with result["attempts"] and, against the case's baseline,
+        result["regression"].
+        
+        result["timings"] breaks the duration down by step (prepare_page,
+        locate_fields, enter_credentials, wait_for_outcome, analyze,
+        screenshot), in seconds.
+        
         Args:
             username: Username to enter
             password: Password to enter
             expected_result: "success" or "failure"
             test_name: Descriptive name for the test
+            case_index: Index of a streamed case in the full case list,
+                stored on the result so the report can drop a repeat
             
         Returns:
             dict: Test result details
         """
-        print(f"\n{'='*70}")
-        print(f"🧪 TEST: {test_name}")
-        print(f"{'='*70}")
+        timeouts = self.case_timeouts(test_name)
+        for attempt in range(self.max_retries + 1):
+            result = self._attempt_login(username, password, expected_result, test_name, timeouts)
+            if attempt == self.max_retries or not looks_like_timing_flake(result):
+                break
+            delay = min(RETRY_BACKOFF * 2 ** attempt, RETRY_BACKOFF_MAX)
+            self.log(f"🔁 Looks like a timing flake; retry {attempt + 1}/{self.max_retries} "
+                     f"in {delay:.1f}s")
+            time.sleep(delay)
+            timeouts = {step: min(seconds * RETRY_TIMEOUT_FACTOR, MAX_TIMEOUT)
+                        for step, seconds in timeouts.items()}
+        
+        result["attempts"] = attempt + 1
+        result["regression"] = self.history.regression(result) if self.history is not None else None
+        if result["regression"] is not None:
+            self.log(f"🐢 Slower than usual: {result['duration']}s vs p95 "
+                     f"{result['regression']['baseline_p95']:.2f}s")
+        if case_index is not None:
+            result["case_index"] = case_index
+        self.record_result(result)
+        return result
+    
+    def case_timeouts(self, test_name):
+        """Wait timeouts for a case: from its history, else DEFAULT_TIMEOUTS."""
+        if self.history is None:
+            return dict(DEFAULT_TIMEOUTS)
+        return self.history.timeouts(test_name, DEFAULT_TIMEOUTS)
+    
+    def _attempt_login(self, username, password, expected_result, test_name, timeouts):
+        """One attempt at a case (see test_login); returns the unrecorded result."""
+        self.log(f"\n{'='*70}")
+        self.log(f"🧪 TEST: {test_name}")
+        self.log(f"{'='*70}")
         
         start_time = time.time()
+        self._current_test = test_name
         result = {
             "test_name": test_name,
             "username": username,
@@ -114,211 +529,317 @@ class LoginTestAutomation:
             "duration": 0,
             "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
             "screenshot": None,
-            "error_message": None
+            "error_message": None,
+            "page_load": None,
+            "indicators": [],
+            "timings": {},
+            "backend": "selenium"
         }
+        timings = result["timings"]
         
         try:
-            # Navigate to login page
-            self.navigate_to_login()
-            
-            # Find username field (AI would learn these selectors)
-            print("🔍 Locating username field...")
-            username_field = self.find_element_safe(By.ID, "username")
-            if not username_field:
-                raise Exception("Username field not found")
-            
-            # Find password field
-            print("🔍 Locating password field...")
-            password_field = self.find_element_safe(By.ID, "password")
-            if not password_field:
-                raise Exception("Password field not found")
+            # Get a clean login page
+            with self.timed_step(timings, "prepare_page"):
+                result["page_load"] = self.prepare_login_page()
             
-            # Find submit button
-            print("🔍 Locating submit button...")
-            submit_button = self.find_element_safe(By.ID, "submit")
-            if not submit_button:
-                raise Exception("Submit button not found")
+            with self.timed_step(timings, "locate_fields"):
+                # Find username field (AI would learn these selectors)
+                self.log("🔍 Locating username field...")
+                username_field = self.find_element_safe(By.ID, "username", timeouts["locate_fields"])
+                if not username_field:
+                    raise Exception("Username field not found")
+                
+                # Find password field
+                self.log("🔍 Locating password field...")
+                password_field = self.find_element_safe(By.ID, "password", timeouts["locate_fields"])
+                if not password_field:
+                    raise Exception("Password field not found")
+                
+                # Find submit button
+                self.log("🔍 Locating submit button...")
+                submit_button = self.find_element_safe(By.ID, "submit", timeouts["locate_fields"])
+                if not submit_button:
+                    raise Exception("Submit button not found")
             
-            # Enter credentials
-            print(f"⌨️  Entering username: {username}")
-            username_field.clear()
-            username_field.send_keys(username)
-            
-            print(f"⌨️  Entering password: {'*' * len(password) if password else ''}")
-            password_field.clear()
-            password_field.send_keys(password)
+            with self.timed_step(timings, "enter_credentials"):
+                # Enter credentials
+                self.log(f"⌨️  Entering username: {username}")
+                username_field.clear()
+                username_field.send_keys(username)
+                
+                self.log(f"⌨️  Entering password: {'*' * len(password) if password else ''}")
+                password_field.clear()
+                password_field.send_keys(password)
             
             # Click submit
-            print("🖱️  Clicking submit button...")
-            submit_button.click()
-            
-            # Wait for response (AI learns optimal wait times)
-            time.sleep(2)
+            self.log("🖱️  Clicking submit button...")
+            with self.timed_step(timings, "wait_for_outcome"):
+                submit_button.click()
+                
+                # Wait for the success page or the error message, whichever
+                # shows up first
+                probe = self.wait_for_login_outcome(timeouts["wait_for_outcome"])
             
             # Analyze result
-            print("🔍 Analyzing page response...")
+            self.log("🔍 Analyzing page response...")
             
-            # Check for success indicators
-            success_detected = self.check_login_success()
-            
-            # Check for error messages
-            error_detected = self.check_login_error()
+            with self.timed_step(timings, "analyze"):
+                # The wait's last probe already decided the outcome; only
+                # probe again (one round-trip) if it timed out
+                if probe is None:
+                    probe = self.probe_login_result()
+            result["indicators"] = probe["success"] or [error["selector"] for error in probe["errors"]]
             
             # Determine actual result
-            if success_detected:
+            if probe["outcome"] == "success":
                 result["actual"] = "success"
-                print("✅ Login successful - redirected to dashboard")
-            elif error_detected:
+                self.log("✅ Login successful - redirected to dashboard")
+            elif probe["outcome"] == "failure":
                 result["actual"] = "failure"
-                print("❌ Login failed - error message displayed")
+                self.log(f"   Error message: {probe['errors'][0]['text']}")
+                self.log("❌ Login failed - error message displayed")
             else:
                 result["actual"] = "unknown"
-                print("⚠️  Unable to determine login result")
+                self.log("⚠️  Unable to determine login result")
             
             # Compare with expected result
             if result["actual"] == expected_result:
                 result["status"] = "PASS"
-                print(f"✅ TEST PASSED: Got expected result '{expected_result}'")
+                self.log(f"✅ TEST PASSED: Got expected result '{expected_result}'")
             else:
                 result["status"] = "FAIL"
                 result["error_message"] = f"Expected {expected_result}, got {result['actual']}"
-                print(f"❌ TEST FAILED: Expected '{expected_result}', got '{result['actual']}'")
+                self.log(f"❌ TEST FAILED: Expected '{expected_result}', got '{result['actual']}'")
             
             # Take screenshot
-            screenshot_name = f"test_{test_name.replace(' ', '_')}_{int(time.time())}.png"
-            self.driver.save_screenshot(screenshot_name)
-            result["screenshot"] = screenshot_name
-            print(f"📸 Screenshot saved: {screenshot_name}")
+            if self.screenshot_pipeline is not None:
+                # Only the capture blocks; the write happens in the background
+                with self.timed_step(timings, "screenshot"):
+                    result["screenshot"] = self.screenshot_pipeline.capture(self.driver, result["status"])
+                if result["screenshot"]:
+                    self.log(f"📸 Screenshot queued: {result['screenshot']}")
+            else:
+                screenshot_name = f"test_{test_name.replace(' ', '_')}_{int(time.time())}.png"
+                with self.timed_step(timings, "screenshot"):
+                    self.driver.save_screenshot(screenshot_name)
+                result["screenshot"] = screenshot_name
+                self.log(f"📸 Screenshot saved: {screenshot_name}")
             
         except Exception as e:
             result["status"] = "ERROR"
             result["error_message"] = str(e)
-            print(f"❌ TEST ERROR: {e}")
+            self.log(f"❌ TEST ERROR: {e}")
+            if self.screenshot_pipeline is not None and result["screenshot"] is None:
+                # Keep evidence of what the page looked like when it broke
+                try:
+                    result["screenshot"] = self.screenshot_pipeline.capture(self.driver, "ERROR")
+                except WebDriverException:
+                    pass
         
         finally:
             # Calculate duration
             end_time = time.time()
             result["duration"] = round(end_time - start_time, 2)
-            print(f"⏱️  Test duration: {result['duration']} seconds")
-            
-            # Store result
-            self.test_results.append(result)
+            if self.tracer is not None:
+                self.tracer.add_span("case", int(start_time * 1_000_000),
+                                     int((end_time - start_time) * 1_000_000), "case",
+                                     test=test_name, status=result["status"])
+            self.log(f"⏱️  Test duration: {result['duration']} seconds")
         
         return result
     
+    def record_result(self, result):
+        """Keep a finished result and stream it to the report and history, if any."""
+        if self.keep_results:
+            self.test_results.append(result)
+        if self.report_writer is not None:
+            self.report_writer.write(result)
+        if self.history is not None:
+            self.history.record(result)
+    
     def check_login_success(self):
         """
         Check if login was successful (AI pattern: multiple success indicators).
         
+        One probe_login_result call checks the success URL, the success
+        message and the logout link together.
+        
         Returns:
             bool: True if success detected
         """
-        try:
-            # Method 1: Check for success URL
-            current_url = self.driver.current_url
-            if "logged-in-successfully" in current_url or "dashboard" in current_url:
-                return True
-            
-            # Method 2: Check for success message element
-            success_element = self.driver.find_element(By.CLASS_NAME, "post-title")
-            if success_element and "successfully" in success_element.text.lower():
-                return True
-            
-            # Method 3: Check for logout button (indicates logged in)
-            logout_button = self.driver.find_elements(By.LINK_TEXT, "Log out")
-            if logout_button:
-                return True
-            
-        except NoSuchElementException:
-            pass
-        
-        return False
+        return bool(self.probe_login_result()["success"])
     
     def check_login_error(self):
         """
         Check if login error occurred (AI pattern: detect various error types).
         
+        One probe_login_result call checks every visible error element.
+        
         Returns:
             bool: True if error detected
         """
-        try:
-            # Method 1: Check for error message element
-            error_element = self.driver.find_element(By.ID, "error")
-            if error_element and error_element.is_displayed():
-                print(f"   Error message: {error_element.text}")
-                return True
-            
-            # Method 2: Check for generic error indicators
-            error_classes = ["error", "alert-error", "login-error"]
-            for error_class in error_classes:
-                elements = self.driver.find_elements(By.CLASS_NAME, error_class)
-                if elements and any(e.is_displayed() for e in elements):
-                    return True
-            
-        except NoSuchElementException:
-            pass
-        
-        return False
+        errors = self.probe_login_result()["errors"]
+        if errors:
+            self.log(f"   Error message: {errors[0]['text']}")
+        return bool(errors)
     
-    def run_test_suite(self):
+    def run_test_suite(self, test_cases=None, max_parallel=None):
         """
         Execute comprehensive test suite with various scenarios.
         AI would learn these test cases from historical bugs.
+        
+        Args:
+            test_cases: (username, password, expected, name) tuples;
+                defaults to DEFAULT_TEST_CASES
+            max_parallel: With a session pool, the most cases to run at
+                once (defaults to the pool size)
         """
         print("\n" + "="*70)
         print("🚀 STARTING AUTOMATED TEST SUITE")
         print("="*70)
         
-        # Test cases (AI would generate these based on requirements)
-        test_cases = [
-            # Valid credentials
-            ("student", "Password123", "success", "Valid Login"),
-            
-            # Invalid username
-            ("invaliduser", "Password123", "failure", "Invalid Username"),
-            
-            # Invalid password
-            ("student", "wrongpassword", "failure", "Invalid Password"),
-            
-            # Both invalid
-            ("wronguser", "wrongpass", "failure", "Invalid Credentials"),
-            
-            # Empty username
-            ("", "Password123", "failure", "Empty Username"),
-            
-            # Empty password
-            ("student", "", "failure", "Empty Password"),
-            
-            # Both empty
-            ("", "", "failure", "Empty Credentials"),
-            
-            # SQL injection attempt (security test)
-            ("admin' OR '1'='1", "password", "failure", "SQL Injection Attempt"),
-            
-            # XSS attempt (security test)
-            ("<script>alert('XSS')</script>", "password", "failure", "XSS Attempt"),
-        ]
+        if test_cases is None:
+            test_cases = DEFAULT_TEST_CASES
+        
+        if self.http_backend is not None:
+            # Form-POST-only cases run concurrently over HTTP first; the
+            # rest (e.g. the valid login) still go through the browser
+            http_cases, test_cases = self.http_backend.route(test_cases)
+            if http_cases:
+                print(f"\n⚡ Running {len(http_cases)} cases over HTTP, "
+                      f"{len(test_cases)} in the browser")
+                self.http_backend.run(http_cases, on_result=self.record_result)
         
-        # Run all tests
-        for username, password, expected, name in test_cases:
-            self.test_login(username, password, expected, name)
-            time.sleep(1)  # Brief pause between tests
+        if self.session_pool is not None:
+            # Results come back in case order, whichever worker ran them
+            results = self.session_pool.map(self._run_case_on_driver, test_cases, max_parallel)
+            if self.keep_results:
+                self.test_results.extend(results)
+        else:
+            # Run all tests
+            for username, password, expected, name, *_ in test_cases:
+                self.test_login(username, password, expected, name)
         
         # Generate test report
         self.generate_report()
     
+    def run_case_stream(self, indexed_cases, checkpoint=None, on_result=None, max_parallel=None,
+                        shard=(0, 1)):
+        """
+        Run a large, streamed set of cases without holding the results.
+        
+        Each result goes to on_result as soon as its case finishes and is
+        then dropped, and its position is recorded in the checkpoint, so
+        memory stays flat however many cases there are.
+        
+        With an HTTP backend, cases are routed as in run_test_suite, one
+        batch of HTTP_STREAM_BATCH cases at a time: each batch's HTTP cases
+        run concurrently before its browser cases are handed out.
+        
+        A result reaches the report before its position reaches the
+        checkpoint. Each result carries its case_index, and on resume
+        every case already in the report is marked done first
+        (Checkpoint.mark_reported), so a crash between the two writes does
+        not rerun the case into a duplicate row.
+        
+        Args:
+            indexed_cases: (position, case) pairs, e.g. from shard_cases()
+            checkpoint: Checkpoint to skip completed cases and record new ones
+            on_result: Called with every result dict
+            max_parallel: With a session pool, the most cases to run at once
+            shard: (shard_index, shard_count) the positions belong to
+            
+        Returns:
+            Counter: Number of results per status
+        """
+        counts = Counter()
+        
+        def finish(position, result):
+            counts[result["status"]] += 1
+            if on_result is not None:
+                on_result(result)
+            if checkpoint is not None:
+                checkpoint.mark_done(position)
+        
+        if checkpoint is not None:
+            if self.report_writer is not None:
+                marked = checkpoint.mark_reported(read_report(self.report_writer.path), shard)
+                if marked:
+                    print(f"♻️  {marked} reported case(s) were missing from the checkpoint")
+            indexed_cases = checkpoint.pending(indexed_cases)
+        if self.http_backend is not None:
+            indexed_cases = self._run_http_batches(indexed_cases, finish, shard)
+        
+        run_indexed_case = partial(self._run_indexed_case, shard=shard)
+        if self.session_pool is not None:
+            outcomes = self.session_pool.imap_unordered(
+                run_indexed_case, indexed_cases, max_parallel)
+        else:
+            outcomes = (run_indexed_case(self.driver, indexed_case)
+                        for indexed_case in indexed_cases)
+        
+        for position, result in outcomes:
+            finish(position, result)
+        return counts
+    
+    def _run_http_batches(self, indexed_cases, finish, shard):
+        """Run the HTTP share of each batch of (position, case) pairs; yield the rest."""
+        indexed_cases = iter(indexed_cases)
+        while True:
+            batch = list(islice(indexed_cases, HTTP_STREAM_BATCH))
+            if not batch:
+                return
+            http_cases, browser_cases = self.http_backend.route(batch, case_of=itemgetter(1))
+            if http_cases:
+                results = self.http_backend.run([case for _, case in http_cases])
+                for (position, _), result in zip(http_cases, results):
+                    result["case_index"] = global_case_index(position, shard)
+                    self.record_result(result)
+                    finish(position, result)
+            yield from browser_cases
+    
+    def _run_indexed_case(self, driver, indexed_case, shard=(0, 1)):
+        position, test_case = indexed_case
+        return position, self._run_case_on_driver(driver, test_case,
+                                                     global_case_index(position, shard))
+    
+    def _run_case_on_driver(self, driver, test_case, case_index=None):
+        """Run one test case on a pooled driver (called from worker threads)."""
+        worker = self if driver is self.driver else self._pool_workers.get(driver)
+        if worker is None:
+            # One worker per pooled driver, reused for every case it runs. A
+            # driver is checked out by one thread at a time, so no two
+            # threads ever create a worker for the same driver.
+            worker = LoginTestAutomation(self.base_url, driver=driver, verbose=False,
+                                         reset_strategy=self.reset_strategy, keep_results=False,
+                                         report_writer=self.report_writer,
+                                         screenshot_pipeline=self.screenshot_pipeline,
+                                         tracer=self.tracer, indicators=self.indicators,
+                                         history=self.history, max_retries=self.max_retries)
+            self._pool_workers[driver] = worker
+        result = worker.test_login(*test_case[:4], case_index=case_index)
+        status_icon = "✅" if result["status"] == "PASS" else "❌" if result["status"] == "FAIL" else "⚠️"
+        print(f"{status_icon} {result['test_name']} ({result['duration']}s)")
+        return result
+    
     def generate_report(self):
         """Generate comprehensive test report with AI-style insights."""
         print("\n" + "="*70)
         print("📊 TEST EXECUTION REPORT")
         print("="*70)
         
-        total_tests = len(self.test_results)
-        passed_tests = sum(1 for r in self.test_results if r["status"] == "PASS")
-        failed_tests = sum(1 for r in self.test_results if r["status"] == "FAIL")
-        error_tests = sum(1 for r in self.test_results if r["status"] == "ERROR")
+        # The streamed report already holds every result (kept or not)
+        if self.report_writer is not None:
+            summary = self.report_writer.aggregator.summary()
+        else:
+            summary = ReportAggregator.from_results(self.test_results).summary()
+        
+        total_tests = summary["total"]
+        passed_tests = summary["passed"]
+        failed_tests = summary["failed"]
+        error_tests = summary["errors"]
         
-        success_rate = (passed_tests / total_tests * 100) if total_tests > 0 else 0
+        success_rate = summary["success_rate"]
         
         print(f"\n📈 Summary:")
         print(f"   Total Tests: {total_tests}")
@@ -327,14 +848,17 @@ class LoginTestAutomation:
         print(f"   ⚠️  Errors: {error_tests}")
         print(f"   📊 Success Rate: {success_rate:.1f}%")
         
-        total_duration = sum(r["duration"] for r in self.test_results)
-        avg_duration = total_duration / total_tests if total_tests > 0 else 0
+        total_duration = summary["total_duration"]
+        avg_duration = summary["avg_duration"]
         print(f"   ⏱️  Total Duration: {total_duration:.2f}s")
         print(f"   ⏱️  Average Duration: {avg_duration:.2f}s")
+        print(f"   ⏱️  Duration p50/p95/max: {summary['p50_duration']:.2f}s / "
+              f"{summary['p95_duration']:.2f}s / {summary['max_duration']:.2f}s")
         
         # Detailed results
-        print(f"\n📋 Detailed Results:")
-        print("-" * 70)
+        if self.test_results:
+            print(f"\n📋 Detailed Results:")
+            print("-" * 70)
         for result in self.test_results:
             status_icon = "✅" if result["status"] == "PASS" else "❌" if result["status"] == "FAIL" else "⚠️"
             print(f"\n{status_icon} {result['test_name']}")
@@ -342,14 +866,20 @@ class LoginTestAutomation:
             print(f"   Expected: {result['expected']}")
             print(f"   Actual: {result['actual']}")
             print(f"   Duration: {result['duration']}s")
+            if result.get("timings"):
+                steps = ", ".join(f"{step} {seconds:.2f}s" for step, seconds in result["timings"].items())
+                print(f"   Steps: {steps}")
             if result["error_message"]:
                 print(f"   Error: {result['error_message']}")
         
-        # Save results to JSON
-        report_filename = f"test_report_{int(time.time())}.json"
-        with open(report_filename, 'w') as f:
-            json.dump(self.test_results, f, indent=2)
-        print(f"\n💾 Report saved to: {report_filename}")
+        # Results were streamed as they finished; otherwise save them now
+        if self.report_writer is not None:
+            print(f"\n💾 Report streamed to: {self.report_writer.path}")
+        else:
+            report_filename = f"test_report_{int(time.time())}.json"
+            with open(report_filename, 'w') as f:
+                json.dump(self.test_results, f, indent=2)
+            print(f"\n💾 Report saved to: {report_filename}")
         
         # AI-style insights
         print(f"\n🤖 AI-Powered Insights:")
@@ -360,14 +890,75 @@ class LoginTestAutomation:
         else:
             print("   ❌ Multiple failures detected. Critical issues require immediate fix.")
         
-        if avg_duration > 5:
-            print("   ⚠️  Page load times are slow. Consider performance optimization.")
-        else:
-            print("   ✅ Page response times are within acceptable range.")
+        for insight in self.build_insights(summary):
+            print(f"   {insight}")
+    
+    def build_insights(self, summary):
+        """
+        Observations backed by this run's statistics and, with a history,
+        by earlier runs.
+        
+        Args:
+            summary: ReportAggregator summary of this run
+            
+        Returns:
+            list: One line per insight
+        """
+        insights = []
+        p50, p95 = summary["p50_duration"], summary["p95_duration"]
+        if p95 and not p50:
+            # Most cases round to 0s; any measurable p95 is the tail
+            insights.append(f"⚠️  Long tail: p95 {p95:.2f}s against a median of {p50 or 0:.2f}s.")
+        elif p95 and p95 / p50 >= LONG_TAIL_RATIO:
+            insights.append(f"⚠️  Long tail: p95 {p95:.2f}s is {p95 / p50:.1f}x the median ({p50:.2f}s).")
+        elif summary["total"]:
+            insights.append(f"✅ Durations are consistent: p95 {p95:.2f}s, median {p50:.2f}s.")
+        
+        step_totals = Counter()
+        for result in self.test_results:
+            step_totals.update(result.get("timings") or {})
+        case_time = sum(result["duration"] for result in self.test_results)
+        if step_totals and case_time:
+            step, seconds = step_totals.most_common(1)[0]
+            insights.append(f"🔎 Most time goes to {step}: {seconds / len(self.test_results):.2f}s "
+                            f"per case, {seconds / case_time * 100:.0f}% of case time.")
+        
+        retried = [r for r in self.test_results if r.get("attempts", 1) > 1]
+        if retried:
+            recovered = [r["test_name"] for r in retried if r["status"] == "PASS"]
+            insights.append(f"🔁 {len(retried)} case(s) retried after timing flakes, "
+                            f"{len(recovered)} recovered" + (f": {', '.join(recovered)}" if recovered else ""))
+        
+        if self.history is None:
+            insights.append("💡 Keep a result history (--history) to compare against earlier runs.")
+            return insights
+        
+        has_baseline = False
+        for backend in BACKENDS:
+            # Clean passes of this run against clean passes of earlier runs
+            baseline = self.history.suite_baseline(backend)
+            current = self.history.suite_baseline(backend, current_run=True)
+            has_baseline = has_baseline or baseline is not None
+            if baseline is None or current is None or not baseline["p50"]:
+                continue
+            change = (current["p50"] - baseline["p50"]) / baseline["p50"] * 100
+            insights.append(f"📈 {backend} median {current['p50']:.2f}s vs {baseline['p50']:.2f}s "
+                            f"over the last {baseline['runs']} run(s) ({change:+.0f}%).")
+        regressions = [r for r in self.test_results if r.get("regression")]
+        for result in regressions:
+            insights.append(f"🐢 Regression: {result['test_name']} took {result['duration']:.2f}s, "
+                            f"{result['regression']['ratio']}x its p95 of "
+                            f"{result['regression']['baseline_p95']:.2f}s.")
+        if has_baseline and not regressions:
+            insights.append("✅ No case is slower than its historical baseline.")
+        for test_name, backend, count, pass_rate, retried_count in self.history.flaky_cases()[:5]:
+            insights.append(f"🎲 Flaky: {test_name} ({backend}) passed {pass_rate * 100:.0f}% of its last {count} "
+                            f"result(s), {retried_count} needed a retry.")
+        return insights
     
     def cleanup(self):
         """Close browser and cleanup resources."""
-        if self.driver:
+        if self.driver and self._owns_driver:
             print("\n🧹 Cleaning up...")
             self.driver.quit()
             print("✅ Browser closed successfully")
@@ -386,31 +977,185 @@ if __name__ == "__main__":
     print("- Comprehensive test coverage")
     print("- Detailed reporting with insights")
     
+    import argparse
+    from contextlib import ExitStack
+    
+    parser = argparse.ArgumentParser(description="Run the login test suite")
+    parser.add_argument("--url", default="https://practicetestautomation.com/practice-test-login/",
+                        help="Login page to test")
+    parser.add_argument("--local", action="store_true",
+                        help="Test the local stand-in login page (no network needed)")
+    parser.add_argument("--headless", action="store_true", help="Run Chrome without a window")
+    parser.add_argument("--daemon", nargs="?", const="", metavar="STATE_FILE",
+                        help="Attach to a running browser_daemon.py instead of "
+                             "launching Chrome (falls back to a launch if none is healthy)")
+    parser.add_argument("--parallel", type=int, default=1, metavar="N",
+                        help="Run cases on a pool of N headless Chrome sessions")
+    parser.add_argument("--max-parallel", type=int, default=None,
+                        help="Most cases to run at once (default: pool size)")
+    parser.add_argument("--reset-strategy", choices=RESET_STRATEGIES, default="reset",
+                        help="How each case gets a clean login page")
+    parser.add_argument("--cases", metavar="SOURCE",
+                        help="Stream cases from a .csv/.jsonl file or 'generate' "
+                             "instead of running the nine built-in cases")
+    parser.add_argument("--count", type=int, default=1000,
+                        help="Number of cases for --cases generate")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for --cases generate")
+    parser.add_argument("--shard", default="0/1", metavar="i/N",
+                        help="Run only shard i of N (0-based) of the case source")
+    parser.add_argument("--checkpoint", metavar="PATH",
+                        help="Record completed cases here and skip them on restart")
+    parser.add_argument("--screenshots", choices=CAPTURE_POLICIES, default="always",
+                        help="Which cases get a screenshot")
+    parser.add_argument("--screenshot-dir", default="screenshots",
+                        help="Where de-duplicated screenshots are stored")
+    parser.add_argument("--backend", choices=("selenium", "hybrid"), default="selenium",
+                        help="hybrid: run cases that only need the server's response "
+                             "as concurrent HTTP requests")
+    parser.add_argument("--http-concurrency", type=int, default=16,
+                        help="Requests in flight for --backend hybrid")
+    parser.add_argument("--network-profile", action="store_true",
+                        help="Block fonts/images/analytics/ads and return from page "
+                             "loads at DOMContentLoaded")
+    parser.add_argument("--block-url", action="append", default=[], metavar="PATTERN",
+                        help="Extra URL pattern to block with --network-profile")
+    parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR,
+                        help="Disk cache shared by sessions with --network-profile")
+    parser.add_argument("--history", nargs="?", const=DEFAULT_HISTORY_PATH, metavar="PATH",
+                        help="SQLite result history for per-case timeouts, regression and "
+                             f"flake checks (default path: {DEFAULT_HISTORY_PATH})")
+    parser.add_argument("--retries", type=int, default=MAX_RETRIES,
+                        help="Retries for failures that look like timing flakes")
+    parser.add_argument("--trace", metavar="PATH",
+                        help="Export step/wait/WebDriver spans as a Chrome trace here")
+    parser.add_argument("--report", metavar="PATH",
+                        help="JSON Lines report to append results to "
+                             "(default: test_report_<time>.jsonl)")
+    args = parser.parse_args()
+    
     tester = None
     
-    try:
-        # Initialize test framework
-        tester = LoginTestAutomation()
-        
-        # Run full test suite
-        tester.run_test_suite()
-        
-        print("\n" + "="*70)
-        print("✅ TEST SUITE COMPLETED SUCCESSFULLY")
-        print("="*70)
-        
-    except Exception as e:
-        print(f"\n❌ Fatal error: {e}")
-        import traceback
-        traceback.print_exc()
-        
-    finally:
-        # Always cleanup
-        if tester:
-            tester.cleanup()
+    with ExitStack() as stack:
+        try:
+            base_url = args.url
+            if args.local:
+                from login_stub_server import LoginStubServer
+                base_url = stack.enter_context(LoginStubServer()).url
+                print(f"\n🌐 Using local stand-in login page: {base_url}")
+            
+            network_profile = None
+            if args.network_profile:
+                network_profile = NetworkProfile(
+                    blocked_urls=[*DEFAULT_BLOCKED_URLS, *args.block_url],
+                    disk_cache_dir=args.cache_dir)
+            
+            session_pool = None
+            if args.parallel > 1:
+                from session_pool import DriverSessionPool
+                print(f"\n🔧 Starting {args.parallel} headless Chrome sessions...")
+                session_pool = stack.enter_context(DriverSessionPool(
+                    args.parallel, warm_url=base_url,
+                    driver_factory=partial(create_chrome_driver, True, network_profile)))
+                print(f"✅ Session pool ready ({session_pool.startup_time:.2f}s)")
+            
+            driver = None
+            if args.daemon is not None:
+                from browser_daemon import DEFAULT_STATE_FILE, connect_to_daemon
+                startup_start = time.perf_counter()
+                driver = connect_to_daemon(args.daemon or DEFAULT_STATE_FILE)
+                if driver is None:
+                    print("\n⚠️  No healthy browser daemon; launching Chrome instead")
+                else:
+                    # Ends the session only; the daemon's browser keeps running
+                    stack.callback(driver.quit)
+                    print(f"\n🔥 Attached to warm browser ({time.perf_counter() - startup_start:.2f}s)")
+            
+            report_writer = stack.enter_context(
+                JsonlReportWriter(args.report or f"test_report_{int(time.time())}.jsonl"))
+            print(f"\n📝 Streaming results to: {report_writer.path}")
+            
+            http_backend = None
+            if args.backend == "hybrid":
+                from http_backend import HttpLoginBackend
+                http_backend = HttpLoginBackend(base_url, max_concurrency=args.http_concurrency)
+            
+            history = None
+            if args.history:
+                history = stack.enter_context(ResultHistory(args.history, base_url=base_url))
+                print(f"🗄️  Result history: {args.history} (run {history.run_id})")
+            
+            screenshot_pipeline = stack.enter_context(
+                ScreenshotPipeline(args.screenshot_dir, policy=args.screenshots))
+            
+            # Initialize test framework
+            tester = LoginTestAutomation(base_url, driver=driver, headless=args.headless,
+                                         session_pool=session_pool,
+                                         reset_strategy=args.reset_strategy,
+                                         report_writer=report_writer,
+                                         screenshot_pipeline=screenshot_pipeline,
+                                         tracer=Tracer() if args.trace else None,
+                                         http_backend=http_backend,
+                                         network_profile=network_profile,
+                                         history=history, max_retries=args.retries)
+            
+            suite_start = time.time()
+            if args.cases:
+                # Streamed, sharded run of a large case matrix
+                from case_sources import Checkpoint, iter_cases, parse_shard, shard_cases
+                shard_index, shard_count = parse_shard(args.shard)
+                cases = shard_cases(iter_cases(args.cases, args.count, args.seed),
+                                    shard_index, shard_count)
+                checkpoint = stack.enter_context(Checkpoint(args.checkpoint)) if args.checkpoint else None
+                if checkpoint is not None and checkpoint.completed:
+                    print(f"\n♻️  Resuming: {checkpoint.completed} cases already completed")
+                tester.verbose = False
+                tester.keep_results = False
+                
+                print(f"\n🚀 Running shard {shard_index}/{shard_count} of {args.cases}")
+                tester.run_case_stream(cases, checkpoint, max_parallel=args.max_parallel,
+                                       shard=(shard_index, shard_count))
+                tester.generate_report()
+            else:
+                # Run full test suite
+                tester.run_test_suite(max_parallel=args.max_parallel)
+            print(f"\n⏱️  Suite wall time: {time.time() - suite_start:.2f}s")
+            
+            screenshot_pipeline.close()
+            shots = screenshot_pipeline.stats()
+            print(f"📸 Screenshots: {shots['captured']} captured, {shots['written']} written, "
+                  f"{shots['duplicates']} duplicates, {shots['skipped']} skipped by policy")
+            print(f"   Capture {shots['capture_ms_per_case']:.1f} ms/case on the test thread, "
+                  f"{shots['write_ms_saved_per_case']:.1f} ms/case of writing moved off it")
+            if shots["write_errors"]:
+                print(f"⚠️  {shots['write_errors']} screenshot(s) could not be written "
+                      f"to {screenshot_pipeline.directory}")
+            
+            if tester.tracer is not None:
+                tester.tracer.export_chrome_trace(args.trace)
+                print(f"\n🔬 Trace saved to: {args.trace} (open in chrome://tracing or ui.perfetto.dev)")
+                print(format_step_table(tester.tracer.step_stats()))
+            
+            print("\n" + "="*70)
+            print("✅ TEST SUITE COMPLETED SUCCESSFULLY")
+            print("="*70)
+            
+        except Exception as e:
+            print(f"\n❌ Fatal error: {e}")
+            import traceback
+            traceback.print_exc()
+            
+        finally:
+            # Always cleanup
+            if tester:
+                tester.cleanup()
     
     print("\n💡 To run manually:")
     print("   python selenium_login_test.py")
+    print("   python selenium_login_test.py --local --parallel 4   # offline, 4 sessions")
+    print("   python browser_daemon.py start &  then  python selenium_login_test.py --daemon")
+    print("   python selenium_login_test.py --local --history   # adaptive timeouts, flake/regression checks")
+    print("   python selenium_login_test.py --local --cases generate --count 5000 --shard 0/4 "
+          "--checkpoint shard0.ckpt")
     print("\n📚 Requirements:")
     print("   pip install selenium")
     print("   Download ChromeDriver: https://chromedriver.chromium.org/")
\ No newline at end of file
@@ -0,0 +1,176 @@
+"""
+Task 2: Automated Testing with AI - WebDriver Session Pool
+Framework: Selenium WebDriver
+Objective: Keep several pre-warmed headless Chrome sessions and run login
+test cases on them concurrently
+Author: [Kipruto Andrew Kipngetich]
+Date: October 2026
+"""
+
+import queue
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from functools import partial
+from itertools import islice
+
+from selenium.common.exceptions import WebDriverException
+
+from selenium_login_test import create_chrome_driver
+
+_EXHAUSTED = object()
+
+
+class DriverSessionPool:
+    """
+    Fixed-size pool of WebDriver sessions.
+
+    Each session is a separate Chrome process with its own temporary
+    profile, so workers never share cookies, localStorage or cache. A
+    session's cookies are also cleared whenever it goes back to the pool,
+    so a logged-in case cannot leak into the next case on that worker.
+
+    Example:
+        with DriverSessionPool(4) as pool:
+            tester = LoginTestAutomation(url, session_pool=pool)
+            tester.run_test_suite()
+    """
+
+    def __init__(self, size=4, driver_factory=None, warm_url=None):
+        """
+        Args:
+            size (int): Number of sessions to launch
+            driver_factory: Zero-argument callable returning a WebDriver;
+                defaults to a headless Chrome
+            warm_url (str): Page to load in every session up front, so the
+                first case does not pay for a cold page load
+        """
+        if size < 1:
+            raise ValueError("size must be at least 1")
+        self.size = size
+        self.driver_factory = driver_factory or partial(create_chrome_driver, headless=True)
+        self.warm_url = warm_url
+        self.startup_time = None
+        self._drivers = []
+        self._idle = queue.Queue()
+
+    def _launch(self):
+        driver = self.driver_factory()
+        if self.warm_url:
+            try:
+                driver.get(self.warm_url)
+            except WebDriverException:
+                driver.quit()
+                raise
+        return driver
+
+    def start(self):
+        """
+        Launch every session in parallel; returns self.
+
+        Raises:
+            WebDriverException: If any session fails to start (the ones that
+                did start are quit)
+        """
+        if self._drivers:
+            return self
+
+        start_time = time.time()
+        with ThreadPoolExecutor(self.size) as executor:
+            futures = [executor.submit(self._launch) for _ in range(self.size)]
+
+        errors = [future.exception() for future in futures if future.exception()]
+        drivers = [future.result() for future in futures if not future.exception()]
+        if errors:
+            for driver in drivers:
+                driver.quit()
+            raise errors[0]
+
+        self._drivers = drivers
+        for driver in drivers:
+            self._idle.put(driver)
+        self.startup_time = time.time() - start_time
+        return self
+
+    @contextmanager
+    def session(self):
+        """Borrow an idle session for the duration of a with-block."""
+        driver = self._idle.get()
+        try:
+            yield driver
+        finally:
+            try:
+                driver.delete_all_cookies()
+            except WebDriverException:
+                pass
+            self._idle.put(driver)
+
+    def map(self, func, items, max_parallel=None):
+        """
+        Call func(driver, item) for every item, spread over the pool.
+
+        Args:
+            func: Callable taking a borrowed driver and one item
+            items: Work items (e.g. test case tuples)
+            max_parallel (int): Most calls to run at once; defaults to, and
+                is capped at, the pool size
+
+        Returns:
+            list: func's results, in the same order as items
+        """
+        self.start()
+        workers = min(max_parallel or self.size, self.size)
+        if workers < 1:
+            raise ValueError("max_parallel must be at least 1")
+
+        def run(item):
+            with self.session() as driver:
+                return func(driver, item)
+
+        with ThreadPoolExecutor(workers) as executor:
+            return list(executor.map(run, items))
+
+    def imap_unordered(self, func, items, max_parallel=None):
+        """
+        Like map(), but yields results as they finish and keeps only a
+        bounded number of items in flight, so items can be an endless
+        stream.
+
+        Yields:
+            func's results, in completion order
+        """
+        self.start()
+        workers = min(max_parallel or self.size, self.size)
+        if workers < 1:
+            raise ValueError("max_parallel must be at least 1")
+
+        def run(item):
+            with self.session() as driver:
+                return func(driver, item)
+
+        items = iter(items)
+        with ThreadPoolExecutor(workers) as executor:
+            in_flight = {executor.submit(run, item) for item in islice(items, workers * 2)}
+            while in_flight:
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+                    next_item = next(items, _EXHAUSTED)
+                    if next_item is not _EXHAUSTED:
+                        in_flight.add(executor.submit(run, next_item))
+
+    def close(self):
+        """Quit every session."""
+        drivers, self._drivers = self._drivers, []
+        self._idle = queue.Queue()
+        for driver in drivers:
+            try:
+                driver.quit()
+            except WebDriverException:
+                pass
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,196 @@
+"""
+Task 2: Automated Testing with AI - Step Tracing
+Framework: Selenium WebDriver
+Objective: Record spans for every test step, wait and WebDriver command,
+export them as a Chrome trace and summarise them as percentile tables
+Author: [Kipruto Andrew Kipngetich]
+Date: October 2026
+"""
+
+import json
+import math
+import os
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+TRACE_PERCENTILES = (50, 90, 99)
+
+# (span name, performance.timing start field, end field)
+NAVIGATION_PHASES = [
+    ("nav.dns", "domainLookupStart", "domainLookupEnd"),
+    ("nav.connect", "connectStart", "connectEnd"),
+    ("nav.ttfb", "requestStart", "responseStart"),
+    ("nav.download", "responseStart", "responseEnd"),
+    ("nav.dom", "responseEnd", "domContentLoadedEventEnd"),
+    ("nav.load_event", "domContentLoadedEventEnd", "loadEventEnd"),
+]
+
+
+def _now_us():
+    """Wall-clock microseconds (same clock as performance.timing)."""
+    return time.time_ns() // 1000
+
+
+class Tracer:
+    """
+    Thread-safe collector of Chrome trace "complete" events.
+
+    Spans from parallel workers land on their own thread rows, so the
+    exported trace shows each worker's timeline side by side in
+    chrome://tracing or https://ui.perfetto.dev.
+
+    Example:
+        tracer = Tracer()
+        tester = LoginTestAutomation(url, tracer=tracer)
+        tester.run_test_suite()
+        tracer.export_chrome_trace("trace.json")
+        print(format_step_table(tracer.step_stats()))
+    """
+
+    def __init__(self):
+        self.events = []
+        self._pid = os.getpid()
+
+    def add_span(self, name, start_us, duration_us, cat="step", **args):
+        """Record a span that has already finished."""
+        event = {
+            "name": name,
+            "cat": cat,
+            "ph": "X",
+            "ts": start_us,
+            "dur": max(duration_us, 0),
+            "pid": self._pid,
+            "tid": threading.get_ident(),
+        }
+        if args:
+            event["args"] = args
+        # list.append is atomic, so worker threads need no lock
+        self.events.append(event)
+
+    @contextmanager
+    def span(self, name, cat="step", **args):
+        """Record the duration of a with-block as one span."""
+        start_us = _now_us()
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration_us = int((time.perf_counter() - start_time) * 1_000_000)
+            self.add_span(name, start_us, duration_us, cat, **args)
+
+    def add_navigation_timing(self, timing, **args):
+        """
+        Turn a performance.timing object into one span per load phase.
+
+        Args:
+            timing (dict): window.performance.timing (epoch milliseconds)
+        """
+        for name, start_field, end_field in NAVIGATION_PHASES:
+            start_ms, end_ms = timing.get(start_field) or 0, timing.get(end_field) or 0
+            if start_ms and end_ms >= start_ms:
+                self.add_span(name, start_ms * 1000, (end_ms - start_ms) * 1000, "navigation", **args)
+
+    def export_chrome_trace(self, path):
+        """Write every span as Chrome trace-event JSON."""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": list(self.events), "displayTimeUnit": "ms"}, f)
+
+    def step_stats(self):
+        """Per-span-name percentiles of this tracer's events (see step_stats)."""
+        return step_stats(self.events)
+
+
+def instrument_driver(driver, tracer):
+    """
+    Record every WebDriver command round-trip as a span.
+
+    Wraps the driver's execute(), which every WebDriver and WebElement
+    call goes through. Instrumenting the same driver twice is a no-op.
+
+    Returns:
+        The same driver
+    """
+    if getattr(driver, "_tracer", None) is tracer:
+        return driver
+    execute = getattr(driver, "_untraced_execute", driver.execute)
+
+    def traced_execute(driver_command, params=None):
+        with tracer.span(f"webdriver.{driver_command}", cat="webdriver"):
+            return execute(driver_command, params)
+
+    driver._untraced_execute = execute
+    driver.execute = traced_execute
+    driver._tracer = tracer
+    return driver
+
+
+def load_trace(path):
+    """Read the events of an exported Chrome trace file."""
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    return data["traceEvents"] if isinstance(data, dict) else data
+
+
+def _percentile(sorted_values, percent):
+    rank = max(1, math.ceil(percent / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def step_stats(events):
+    """
+    Summarise spans by name.
+
+    Args:
+        events: Trace events, e.g. from one or several load_trace() calls
+
+    Returns:
+        dict: name -> {"cat", "count", "mean_ms", "p50_ms", "p90_ms",
+        "p99_ms", "max_ms"}, ordered by category then name
+    """
+    durations = defaultdict(list)
+    categories = {}
+    for event in events:
+        if event.get("ph") == "X":
+            durations[event["name"]].append(event["dur"] / 1000)
+            categories[event["name"]] = event.get("cat", "")
+
+    stats = {}
+    for name in sorted(durations, key=lambda n: (categories[n], n)):
+        values = sorted(durations[name])
+        row = {"cat": categories[name], "count": len(values),
+               "mean_ms": sum(values) / len(values), "max_ms": values[-1]}
+        for percent in TRACE_PERCENTILES:
+            row[f"p{percent}_ms"] = _percentile(values, percent)
+        stats[name] = row
+    return stats
+
+
+def format_step_table(stats):
+    """Render step_stats() as a fixed-width table."""
+    header = (f"{'span':<36s} {'cat':<10s} {'count':>6s} {'mean ms':>9s} "
+              + " ".join(f"{f'p{p} ms':>9s}" for p in TRACE_PERCENTILES) + f" {'max ms':>9s}")
+    lines = [header, "-" * len(header)]
+    for name, row in stats.items():
+        lines.append(
+            f"{name[:36]:<36s} {row['cat']:<10s} {row['count']:>6d} {row['mean_ms']:>9.1f} "
+            + " ".join(f"{row[f'p{p}_ms']:>9.1f}" for p in TRACE_PERCENTILES)
+            + f" {row['max_ms']:>9.1f}")
+    return "\n".join(lines)
+
+
+# ============================================================================
+# MAIN EXECUTION
+# ============================================================================
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Per-step percentiles across trace files")
+    parser.add_argument("traces", nargs="+", help="Chrome trace JSON files from --trace runs")
+    args = parser.parse_args()
+
+    events = [event for path in args.traces for event in load_trace(path)]
+    print(f"📊 {len(events)} spans from {len(args.traces)} run(s)\n")
+    print(format_step_table(step_stats(events)))
@@ -0,0 +1,386 @@
+"""
+Task 3: Predictive Analytics for Resource Allocation - Batch Scoring
+Framework: scikit-learn + pandas (joblib artifacts from the notebook)
+Objective: Score large CSV/Parquet files of issue records with the saved
+priority model, chunk by chunk, without re-running the notebook
+Author: [Kipruto Andrew Kipngetich]
+Date: October 2026
+"""
+
+import os
+import time
+import tracemalloc
+
+import joblib
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+    pq = None
+
+# Artifacts written by resource_allocation_model.ipynb (STEP 8)
+MODEL_FILE = "priority_prediction_model.pkl"
+SCALER_FILE = "feature_scaler.pkl"
+FEATURE_NAMES_FILE = "feature_names.pkl"
+
+# Class labels used in the notebook (target 0 = High Priority)
+PRIORITY_LABELS = {0: "High Priority", 1: "Low Priority"}
+DEFAULT_CHUNK_SIZE = 100_000
+
+
+class SchemaError(ValueError):
+    """Input records do not match the features the model was trained on."""
+
+
+def _require_pyarrow():
+    if pq is None:
+        raise ImportError("Parquet input/output needs pyarrow (pip install pyarrow)")
+
+
+def _is_parquet(path):
+    return path.lower().endswith((".parquet", ".pq"))
+
+
+class PriorityScorer:
+    """
+    The saved scaler and Random Forest, applied to whole batches at once.
+
+    Each batch is converted to one float64 matrix in training column
+    order, standardised in place with the scaler's mean_/scale_ (what
+    StandardScaler.transform computes, without a second copy) and scored
+    with a single predict_proba call.
+
+    Example:
+        scorer = PriorityScorer.load(".")
+        stats = score_file(scorer, "issues.parquet", "scored.parquet")
+    """
+
+    def __init__(self, model, scaler, feature_names):
+        """
+        Args:
+            model: Fitted classifier with predict_proba (RandomForestClassifier)
+            scaler: Fitted StandardScaler
+            feature_names (list): Training columns, in training order
+
+        Raises:
+            SchemaError: If the three artifacts disagree on the feature count
+        """
+        self.model = model
+        self.scaler = scaler
+        self.feature_names = list(feature_names)
+        counts = {len(self.feature_names), scaler.n_features_in_, model.n_features_in_}
+        if len(counts) != 1:
+            raise SchemaError(f"Artifacts disagree on the number of features: {sorted(counts)}")
+        self._labels = [PRIORITY_LABELS.get(label, str(label)) for label in model.classes_]
+        self._high_priority = list(model.classes_).index(0) if 0 in model.classes_ else 0
+
+    @classmethod
+    def load(cls, directory="."):
+        """
+        Load the model, scaler and feature names once.
+
+        Args:
+            directory (str): Folder holding the three .pkl files
+
+        Returns:
+            PriorityScorer
+        """
+        return cls(
+            joblib.load(os.path.join(directory, MODEL_FILE)),
+            joblib.load(os.path.join(directory, SCALER_FILE)),
+            joblib.load(os.path.join(directory, FEATURE_NAMES_FILE)),
+        )
+
+    def check_columns(self, columns):
+        """
+        Raises:
+            SchemaError: If any training feature is missing from columns
+        """
+        columns = set(columns)
+        missing = [name for name in self.feature_names if name not in columns]
+        if missing:
+            raise SchemaError(f"Missing {len(missing)} feature column(s): {', '.join(missing)}")
+
+    def prepare(self, frame):
+        """
+        Validate a batch and return its scaled feature matrix.
+
+        Columns are picked and reordered by name, so input column order
+        does not matter and extra columns are ignored. A batch with no rows
+        (e.g. a header-only CSV, whose columns read as object dtype) gives
+        an empty matrix.
+
+        Args:
+            frame (pd.DataFrame): Batch of records
+
+        Returns:
+            np.ndarray: (rows, features) float64, standardised
+
+        Raises:
+            SchemaError: Missing or non-numeric feature columns, or
+                missing/infinite values
+        """
+        self.check_columns(frame.columns)
+        if frame.empty:
+            return np.empty((0, len(self.feature_names)))
+        features = frame[self.feature_names]
+        non_numeric = [name for name, dtype in features.dtypes.items()
+                       if not pd.api.types.is_numeric_dtype(dtype)]
+        if non_numeric:
+            raise SchemaError(f"Non-numeric feature column(s): {', '.join(non_numeric)}")
+
+        X = features.to_numpy(dtype=np.float64, copy=True)
+        finite = np.isfinite(X).all(axis=1)
+        if not finite.all():
+            bad_rows = np.flatnonzero(~finite)
+            raise SchemaError(f"{len(bad_rows)} row(s) with missing or infinite feature values "
+                              f"(first at batch row {bad_rows[0]})")
+
+        if getattr(self.scaler, "mean_", None) is not None:
+            X -= self.scaler.mean_
+        if getattr(self.scaler, "scale_", None) is not None:
+            X /= self.scaler.scale_
+        return X
+
+    def predict_proba(self, frame):
+        """Class probabilities for a batch (columns follow model.classes_)."""
+        X = self.prepare(frame)
+        if len(X) == 0:
+            # predict_proba rejects zero samples
+            return np.empty((0, len(self._labels)))
+        return self.model.predict_proba(X)
+
+    def score(self, frame, keep_columns=()):
+        """
+        Score a batch.
+
+        Args:
+            frame (pd.DataFrame): Batch of records
+            keep_columns: Input columns to copy into the output (e.g. an
+                issue id)
+
+        Returns:
+            pd.DataFrame: keep_columns, high_priority_probability and
+            predicted_priority
+        """
+        proba = self.predict_proba(frame)
+        scored = frame[list(keep_columns)].reset_index(drop=True)
+        scored["high_priority_probability"] = proba[:, self._high_priority]
+        scored["predicted_priority"] = pd.Categorical.from_codes(
+            proba.argmax(axis=1), categories=self._labels)
+        return scored
+
+
+def iter_record_chunks(path, columns, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Stream a CSV or Parquet file as DataFrames of at most chunk_size rows.
+
+    Only the given columns are read.
+
+    Raises:
+        SchemaError: If the file lacks any of the columns
+    """
+    if _is_parquet(path):
+        _require_pyarrow()
+        parquet_file = pq.ParquetFile(path)
+        missing = [name for name in columns if name not in parquet_file.schema_arrow.names]
+        if missing:
+            raise SchemaError(f"{path} is missing column(s): {', '.join(missing)}")
+        for batch in parquet_file.iter_batches(batch_size=chunk_size, columns=list(columns)):
+            yield batch.to_pandas()
+    else:
+        header = pd.read_csv(path, nrows=0).columns
+        missing = [name for name in columns if name not in header]
+        if missing:
+            raise SchemaError(f"{path} is missing column(s): {', '.join(missing)}")
+        yield from pd.read_csv(path, usecols=list(columns), chunksize=chunk_size)
+
+
+class PredictionWriter:
+    """
+    Appends scored chunks to a CSV or Parquet file (chosen by extension).
+
+    If no chunk is written, close() writes the empty frame instead, so
+    scoring an empty input still gives a file with the output columns.
+
+    Example:
+        with PredictionWriter("scored.parquet") as writer:
+            for chunk in chunks:
+                writer.write(scorer.score(chunk))
+    """
+
+    def __init__(self, path, empty=None):
+        """
+        Args:
+            path (str): Output file (overwritten)
+            empty (pd.DataFrame): Zero-row frame with the output columns and
+                dtypes, written by close() if nothing else was
+        """
+        if _is_parquet(path):
+            _require_pyarrow()
+        self.path = path
+        self.empty = empty
+        self.rows = 0
+        self._written = False
+        self._parquet_writer = None
+
+    def write(self, frame):
+        """Append one chunk of predictions."""
+        if _is_parquet(self.path):
+            table = pa.Table.from_pandas(frame, preserve_index=False)
+            if self._parquet_writer is None:
+                self._parquet_writer = pq.ParquetWriter(self.path, table.schema)
+            self._parquet_writer.write_table(table)
+        else:
+            frame.to_csv(self.path, mode="w" if self.rows == 0 else "a",
+                         header=self.rows == 0, index=False)
+        self.rows += len(frame)
+        self._written = True
+
+    def close(self):
+        """Finish the file (an empty one with the schema if nothing was written)."""
+        if not self._written and self.empty is not None:
+            self.write(self.empty)
+        if self._parquet_writer is not None:
+            self._parquet_writer.close()
+            self._parquet_writer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def score_file(scorer, input_path, output_path, chunk_size=DEFAULT_CHUNK_SIZE,
+               keep_columns=(), trace_memory=False):
+    """
+    Score every record of input_path into output_path, one chunk at a time.
+
+    Memory is bounded by the chunk size, not the file size.
+
+    Args:
+        scorer (PriorityScorer): Loaded artifacts
+        input_path (str): .csv or .parquet records
+        output_path (str): .csv or .parquet predictions
+        chunk_size (int): Rows per batch
+        keep_columns: Input columns to carry into the output
+        trace_memory (bool): Measure peak Python/NumPy allocations with
+            tracemalloc (slows the run, so time it separately)
+
+    Returns:
+        dict: rows, chunks, seconds, rows_per_second and peak_memory_bytes
+        (None unless trace_memory)
+    """
+    columns = list(dict.fromkeys([*keep_columns, *scorer.feature_names]))
+    empty = scorer.score(pd.DataFrame(columns=columns), keep_columns)
+    if trace_memory:
+        tracemalloc.start()
+    start_time = time.perf_counter()
+    chunks = 0
+    try:
+        with PredictionWriter(output_path, empty) as writer:
+            for chunk in iter_record_chunks(input_path, columns, chunk_size):
+                writer.write(scorer.score(chunk, keep_columns))
+                chunks += 1
+        seconds = time.perf_counter() - start_time
+        peak = tracemalloc.get_traced_memory()[1] if trace_memory else None
+    finally:
+        if trace_memory:
+            tracemalloc.stop()
+    return {
+        "rows": writer.rows,
+        "chunks": chunks,
+        "seconds": seconds,
+        "rows_per_second": writer.rows / seconds if seconds else 0,
+        "peak_memory_bytes": peak,
+    }
+
+
+def write_synthetic_records(path, rows, seed=42):
+    """
+    Write rows of synthetic records for benchmarking: the notebook's
+    dataset resampled with noise, under its own column names, plus an
+    issue_id column.
+    """
+    from sklearn.datasets import load_breast_cancer
+
+    data = load_breast_cancer()
+    rng = np.random.default_rng(seed)
+    with PredictionWriter(path) as writer:
+        for start in range(0, rows, DEFAULT_CHUNK_SIZE):
+            count = min(DEFAULT_CHUNK_SIZE, rows - start)
+            sample = data.data[rng.integers(0, len(data.data), count)]
+            sample = sample * rng.normal(1.0, 0.05, sample.shape)
+            frame = pd.DataFrame(sample, columns=data.feature_names)
+            frame.insert(0, "issue_id", np.arange(start, start + count))
+            writer.write(frame)
+
+
+# ============================================================================
+# MAIN EXECUTION
+# ============================================================================
+
+if __name__ == "__main__":
+    import argparse
+    import tempfile
+
+    parser = argparse.ArgumentParser(description="Batch-score issue records with the priority model")
+    parser.add_argument("--artifacts", default=".",
+                        help="Folder with the notebook's .pkl files")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    score_parser = subparsers.add_parser("score", help="Score a CSV/Parquet file")
+    score_parser.add_argument("input", help="Records (.csv or .parquet)")
+    score_parser.add_argument("output", help="Predictions (.csv or .parquet)")
+    score_parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    score_parser.add_argument("--keep", action="append", default=[], metavar="COLUMN",
+                              help="Input column to copy into the output (e.g. an issue id)")
+
+    bench_parser = subparsers.add_parser("bench", help="Throughput and peak memory per chunk size")
+    bench_parser.add_argument("--rows", type=int, default=1_000_000)
+    bench_parser.add_argument("--chunk-sizes", type=int, nargs="+",
+                              default=[10_000, 50_000, 100_000, 250_000])
+    bench_parser.add_argument("--format", choices=("csv", "parquet"), default="csv")
+    args = parser.parse_args()
+
+    print("="*80)
+    print("TASK 3: BATCH PRIORITY SCORING")
+    print("="*80)
+
+    start_time = time.perf_counter()
+    scorer = PriorityScorer.load(args.artifacts)
+    print(f"\n✓ Artifacts loaded in {time.perf_counter() - start_time:.2f}s "
+          f"({len(scorer.feature_names)} features, "
+          f"{len(getattr(scorer.model, 'estimators_', []))} trees)")
+
+    if args.command == "score":
+        stats = score_file(scorer, args.input, args.output, args.chunk_size, args.keep)
+        print(f"✓ Scored {stats['rows']:,} rows in {stats['chunks']} chunk(s), "
+              f"{stats['seconds']:.2f}s ({stats['rows_per_second']:,.0f} rows/s)")
+        print(f"💾 Predictions saved to: {args.output}")
+    else:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            input_path = os.path.join(temp_dir, f"records.{args.format}")
+            output_path = os.path.join(temp_dir, f"scored.{args.format}")
+            print(f"\n📊 Writing {args.rows:,} synthetic records ({args.format})...")
+            write_synthetic_records(input_path, args.rows)
+
+            print(f"\n{'chunk size':>12s} {'rows/s':>12s} {'rows/hour':>14s} {'peak MB':>9s}")
+            print("-" * 50)
+            for chunk_size in args.chunk_sizes:
+                # Timed run and tracemalloc run are separate: tracing
+                # allocations slows the run down
+                stats = score_file(scorer, input_path, output_path, chunk_size, ["issue_id"])
+                peak = score_file(scorer, input_path, output_path, chunk_size, ["issue_id"],
+                                  trace_memory=True)["peak_memory_bytes"]
+                print(f"{chunk_size:>12,d} {stats['rows_per_second']:>12,.0f} "
+                      f"{stats['rows_per_second'] * 3600:>14,.0f} {peak / 2**20:>9.1f}")
+
+    print("\n" + "="*80)
+    print("Batch scoring complete! 🎉")
+    print("="*80)